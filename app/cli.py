@@ -0,0 +1,182 @@
+# app/cli.py
+"""
+운영용 커맨드.
+
+    python -m app.cli rebuild-rollups   # 일별 통계 롤업을 review 전체에서 다시 만든다
+    python -m app.cli import --github-id 42 a.ndjson b.json [--workers 4] [--batch-size 1000]
+                                        # 샘플 리뷰 JSON / NDJSON 파일을 대량으로 넣는다 (staging 시드, 과거 데이터)
+                                        # 실패하면 체크포인트 파일을 남기고, 같은 명령을 다시 실행하면 이어서 넣는다
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import AsyncIterator, List
+
+from starlette.concurrency import run_in_threadpool
+
+from app.utils.database import AsyncSessionLocal
+from app.services.sample_import import (
+    SampleImportError,
+    SampleImportResult,
+    clamp_batch_size,
+    clamp_workers,
+    import_samples_parallel,
+    iter_sample_items,
+)
+from app.services.stats_rollup import rebuild_rollups
+
+# 진행 상황 출력 간격 (초)
+IMPORT_PROGRESS_INTERVAL = 2.0
+
+
+async def _rebuild_rollups() -> None:
+    async with AsyncSessionLocal() as session:
+        await rebuild_rollups(session)
+        await session.commit()
+    print("rollups rebuilt")
+
+
+async def _iter_files(paths: List[str]) -> AsyncIterator[dict]:
+    """파일들을 순서대로 이어서 읽는다 (--skip 은 이어진 전체 기준)"""
+    for path in paths:
+        with open(path, "rb") as f:
+            async def read(size: int) -> bytes:
+                return await run_in_threadpool(f.read, size)
+
+            async for item in iter_sample_items(read):
+                yield item
+
+
+def _checkpoint_path(args: argparse.Namespace) -> str:
+    return args.checkpoint or f"{args.files[0]}.checkpoint.json"
+
+
+def _load_checkpoint(path: str, args: argparse.Namespace) -> dict:
+    """
+    이어서 할 위치 {"skip", "done_offsets", "batch_size"}. 파일이 없으면 --skip / --batch-size 그대로.
+    병렬 import 는 skip 뒤에도 먼저 커밋된 배치가 있을 수 있으므로 그 배치 위치 (done_offsets) 와
+    배치 크기를 같이 저장해 두고 건너뛴다.
+    """
+    if not os.path.exists(path):
+        return {"skip": args.skip, "done_offsets": [], "batch_size": clamp_batch_size(args.batch_size)}
+    with open(path, encoding="utf-8") as f:
+        checkpoint = json.load(f)
+    if checkpoint.get("github_id") != args.github_id or checkpoint.get("files") != args.files:
+        raise SystemExit(f"checkpoint {path} belongs to a different import (github_id / files); remove it first")
+    if args.skip:
+        raise SystemExit(f"--skip cannot be combined with checkpoint {path}")
+    return checkpoint
+
+
+def _save_checkpoint(path: str, args: argparse.Namespace, batch_size: int, result) -> None:
+    checkpoint = {
+        "github_id": args.github_id,
+        "files": args.files,
+        "batch_size": batch_size,
+        "skip": result.committed_prefix,
+        "done_offsets": result.committed_offsets,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+
+
+async def _import(args: argparse.Namespace) -> int:
+    workers = clamp_workers(args.workers)
+    # 여러 세션이 같은 롤업 행을 upsert 하면 서로 기다리므로 병렬일 때는 끝나고 한 번에 다시 만든다
+    rollups = workers == 1 and not args.no_rollups
+    last_report = 0.0
+    checkpoint_path = _checkpoint_path(args)
+    checkpoint = _load_checkpoint(checkpoint_path, args)
+    batch_size = checkpoint["batch_size"]
+
+    async def on_progress(result: SampleImportResult) -> None:
+        nonlocal last_report
+        if result.elapsed - last_report >= IMPORT_PROGRESS_INTERVAL:
+            last_report = result.elapsed
+            print(f"  {result.inserted} rows, {result.batches} batches ({result.rate or 0:.1f} rows/s)", file=sys.stderr)
+
+    if checkpoint["skip"] or checkpoint["done_offsets"]:
+        print(
+            f"resuming from {checkpoint_path}: skip {checkpoint['skip']}, "
+            f"{len(checkpoint['done_offsets'])} batch(es) already committed after it",
+            file=sys.stderr,
+        )
+    print(
+        f"importing {len(args.files)} file(s) as github_id={args.github_id} "
+        f"(batch_size={batch_size}, workers={workers}, rollups={'batch' if rollups else 'rebuild'})",
+        file=sys.stderr,
+    )
+    try:
+        result = await import_samples_parallel(
+            AsyncSessionLocal,
+            _iter_files(args.files),
+            github_id=args.github_id,
+            batch_size=batch_size,
+            workers=workers,
+            skip=checkpoint["skip"],
+            done_offsets=checkpoint["done_offsets"],
+            rollups=rollups,
+            on_progress=on_progress,
+        )
+    except SampleImportError as exc:
+        result = exc.result
+        _save_checkpoint(checkpoint_path, args, batch_size, result)
+        print(f"import failed: {exc}", file=sys.stderr)
+        print(f"{result.inserted} rows committed before the failure.", file=sys.stderr)
+        print(
+            f"progress saved to {checkpoint_path} (skip {result.committed_prefix}, "
+            f"{len(result.committed_offsets)} batch(es) committed after it); run the same command again to resume",
+            file=sys.stderr,
+        )
+        if not rollups:
+            print("rollups were not updated; run `python -m app.cli rebuild-rollups` afterwards.", file=sys.stderr)
+        return 1
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"inserted {result.inserted} rows in {result.batches} batches, {result.elapsed:.1f}s ({result.rate or 0:.1f} rows/s)")
+
+    if not rollups:
+        if args.no_rebuild:
+            print("rollups were not updated; run `python -m app.cli rebuild-rollups` afterwards.")
+        else:
+            await _rebuild_rollups()
+    return 0
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("rebuild-rollups", help="일별 통계 롤업 테이블 재생성 (backfill)")
+
+    imp = sub.add_parser("import", help="샘플 리뷰 JSON / NDJSON 파일 대량 import")
+    imp.add_argument("files", nargs="+", help="JSON 배열 / 단일 객체 / NDJSON 파일 (순서대로 이어서 읽는다)")
+    imp.add_argument("--github-id", required=True, help="리뷰를 저장할 유저의 github_id")
+    imp.add_argument("--batch-size", type=int, default=None, help="배치 (커밋) 단위 건수")
+    imp.add_argument("--workers", type=int, default=1, help="동시에 넣는 배치 수 (세션 수)")
+    imp.add_argument("--skip", type=int, default=0, help="앞에서부터 건너뛸 건수 (체크포인트 없이 직접 이어서 할 때)")
+    imp.add_argument(
+        "--checkpoint",
+        default=None,
+        help="실패 시 이어서 할 위치를 저장하고 다음 실행 때 읽는 파일 (기본: 첫 파일 경로 + .checkpoint.json)",
+    )
+    imp.add_argument(
+        "--no-rollups",
+        action="store_true",
+        help="배치마다 롤업 / 점수 스냅샷을 갱신하지 않고 끝난 뒤 롤업을 다시 만든다 (workers > 1 이면 항상)",
+    )
+    imp.add_argument("--no-rebuild", action="store_true", help="끝난 뒤 롤업 재생성을 건너뛴다 (여러 번 나눠 넣을 때)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild-rollups":
+        asyncio.run(_rebuild_rollups())
+    elif args.command == "import":
+        sys.exit(asyncio.run(_import(args)))
+
+
+if __name__ == "__main__":
+    main()
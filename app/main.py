@@ -1,4 +1,6 @@
 # app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse, RedirectResponse, HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,9 +15,35 @@ from app.routers.v1.user import router as user_router
 from app.routers.ui import router as ui_router
 from app.routers.llm import router as llm_router
 from app.routers.ws_debug import router as ws_debug_router
+from app.routers.ws_debug import WS_PING_INTERVAL, WS_PING_TIMEOUT, ws_manager
+from app.routers.ws_reviews import router as ws_reviews_router
+from app.routers.ws_reviews import review_ws_manager
 from app.routers.v1.fix import router as fix_router
 from app.routers.auth import router as auth_router
 from app.routers import sample_import
+from app.services.review_service import review_detail_cache
+from app.services.score_analytics import score_snapshot
+from app.services.stats_cache import stats_cache
+from app.services.fragment_cache import fragment_cache
+from app.services.principal import principal_cache
+from app.services.event_bus import event_bus
+from app.services.import_jobs import import_job_runner
+from app.utils.database import pool_monitor
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 간 리뷰 이벤트 전달 (EVENT_BUS_URL)
+    await event_bus.start()
+    # 커넥션 풀 누수 감시 (POOL_LEAK_WARN_SECONDS)
+    pool_monitor.start()
+    # 백그라운드 샘플 import 작업 (IMPORT_JOB_CONCURRENCY)
+    import_job_runner.start()
+    yield
+    await import_job_runner.stop()
+    await pool_monitor.stop()
+    await event_bus.stop()
+
 
 app = FastAPI(
     title="Code Review API",
@@ -23,6 +51,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 origins = os.getenv(
@@ -39,12 +68,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 
 app.include_router(llm_router)
 app.include_router(review_router)
 app.include_router(ws_debug_router)
+app.include_router(ws_reviews_router)
 app.include_router(auth_router)
 logging.getLogger("uvicorn.error").info("Auth router enabled.")
 app.include_router(fix_router)
@@ -62,6 +93,22 @@ def health():
     return {"ok": True, "service": "code-review-api"}
 
 
+@app.get("/metrics", tags=["meta"])
+def metrics():
+    return {
+        "review_detail_cache": review_detail_cache.stats(),
+        "score_snapshot": score_snapshot.stats(),
+        "stats_cache": stats_cache.stats(),
+        "fragment_cache": fragment_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "ws": ws_manager.stats(),
+        "ws_reviews": review_ws_manager.stats(),
+        "event_bus": event_bus.stats(),
+        "db_pool": pool_monitor.stats(),
+        "import_jobs": import_job_runner.stats(),
+    }
+
+
 @app.exception_handler(HTTPException)
 async def custom_http_exception_handler(request: Request, exc: HTTPException):
     wants_html = "text/html" in (request.headers.get("accept") or "")
@@ -80,4 +127,12 @@ async def custom_http_exception_handler(request: Request, exc: HTTPException):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        # WebSocket 생존 확인은 프로토콜 ping / pong 으로 (app/routers/ws_debug.py)
+        ws_ping_interval=WS_PING_INTERVAL,
+        ws_ping_timeout=WS_PING_TIMEOUT,
+    )
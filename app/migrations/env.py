@@ -14,6 +14,8 @@ if proj_root not in sys.path:
 from app.utils.database import Base
 from app.models import user as user_models         
 from app.models import review as review_models
+from app.models import review_stats as review_stats_models
+from app.models import import_job as import_job_models
 config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -0,0 +1,46 @@
+"""add sample_import_job table for background imports
+
+Revision ID: a7e4c91d3b58
+Revises: f2c8b7d41a09
+Create Date: 2025-12-19 16:24:08.311742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e4c91d3b58'
+down_revision: Union[str, Sequence[str], None] = 'f2c8b7d41a09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 샘플 import 를 요청 밖에서 돌리고, 배치 커밋마다 진행 상황 (체크포인트) 을 남긴다
+    op.create_table(
+        "sample_import_job",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("github_id", sa.String(length=32), nullable=False),
+        sa.Column("filename", sa.String(length=255), nullable=True),
+        sa.Column("spool_path", sa.String(length=512), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("batch_size", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="queued"),
+        sa.Column("inserted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("batches", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("claimed_by", sa.String(length=64), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_sample_import_job_status", "sample_import_job", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sample_import_job_status", table_name="sample_import_job")
+    op.drop_table("sample_import_job")
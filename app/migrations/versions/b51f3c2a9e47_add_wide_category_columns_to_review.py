@@ -0,0 +1,54 @@
+"""add wide category score/comment columns to review
+
+Revision ID: b51f3c2a9e47
+Revises: 0059db7eb88a
+Create Date: 2025-12-10 10:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51f3c2a9e47'
+down_revision: Union[str, Sequence[str], None] = '0059db7eb88a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CATEGORIES = ("bug", "maintainability", "style", "security")
+
+
+def upgrade() -> None:
+    # 1) review 에 고정 카테고리 점수/코멘트 컬럼 추가
+    for name in CATEGORIES:
+        op.add_column("review", sa.Column(f"score_{name}", sa.Float(), nullable=True))
+    for name in CATEGORIES:
+        op.add_column("review", sa.Column(f"comment_{name}", sa.Text(), nullable=True))
+
+    # 2) 기존 review_category_result 값으로 backfill
+    #    review_category_result 테이블은 확장 카테고리용으로 그대로 둔다.
+    conn = op.get_bind()
+    for name in CATEGORIES:
+        conn.execute(
+            sa.text(
+                f"""
+                UPDATE review r
+                JOIN review_category_result c
+                  ON c.review_id = r.id AND c.category = :category
+                SET
+                  r.score_{name} = c.score,
+                  r.comment_{name} = c.comment
+                """
+            ),
+            {"category": name},
+        )
+
+
+def downgrade() -> None:
+    for name in reversed(CATEGORIES):
+        op.drop_column("review", f"comment_{name}")
+    for name in reversed(CATEGORIES):
+        op.drop_column("review", f"score_{name}")
@@ -0,0 +1,100 @@
+"""add daily stats rollup tables
+
+Revision ID: d83a6f1c4b20
+Revises: b51f3c2a9e47
+Create Date: 2025-12-12 14:03:27.904153
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83a6f1c4b20'
+down_revision: Union[str, Sequence[str], None] = 'b51f3c2a9e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CATEGORIES = ("bug", "maintainability", "style", "security")
+
+# audit 없는 리뷰를 모으는 날짜 (app/services/stats_rollup.py UNDATED_DAY 와 동일)
+UNDATED_DAY = "1970-01-01"
+
+
+def _metric_columns() -> list:
+    columns = [
+        sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sum_total", sa.Float(precision=53), nullable=False, server_default="0"),
+    ]
+    for name in CATEGORIES:
+        columns.append(sa.Column(f"sum_{name}", sa.Float(precision=53), nullable=False, server_default="0"))
+        columns.append(sa.Column(f"cnt_{name}", sa.Integer(), nullable=False, server_default="0"))
+    return columns
+
+
+def _backfill(table: str, keys: Sequence[str]) -> None:
+    metric_names = ["review_count", "sum_total"]
+    aggregates = ["COUNT(r.id)", "COALESCE(SUM(r.quality_score), 0)"]
+    for name in CATEGORIES:
+        metric_names += [f"sum_{name}", f"cnt_{name}"]
+        aggregates += [f"COALESCE(SUM(r.score_{name}), 0)", f"COUNT(r.score_{name})"]
+
+    key_exprs = [f"COALESCE(m.{key}, '')" for key in keys]
+    day_expr = f"COALESCE(DATE(m.audit), '{UNDATED_DAY}')"
+
+    op.execute(
+        f"""
+        INSERT INTO {table} (day, {", ".join(keys)}, {", ".join(metric_names)})
+        SELECT {day_expr}, {", ".join(key_exprs)}, {", ".join(aggregates)}
+        FROM review r
+        JOIN review_meta m ON m.id = r.meta_id
+        GROUP BY {day_expr}, {", ".join(key_exprs)}
+        """
+    )
+
+
+def upgrade() -> None:
+    # 1) (day, model) 롤업
+    op.create_table(
+        "review_stats_daily_model",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("model", sa.String(length=255), nullable=False, server_default=""),
+        *_metric_columns(),
+        sa.UniqueConstraint("day", "model", name="uq_review_stats_daily_model"),
+    )
+    op.create_index(
+        "ix_review_stats_daily_model_day", "review_stats_daily_model", ["day"]
+    )
+
+    # 2) (day, github_id, model) 롤업
+    op.create_table(
+        "review_stats_daily_user",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("github_id", sa.String(length=32), nullable=False, server_default=""),
+        sa.Column("model", sa.String(length=255), nullable=False, server_default=""),
+        *_metric_columns(),
+        sa.UniqueConstraint("day", "github_id", "model", name="uq_review_stats_daily_user"),
+    )
+    op.create_index(
+        "ix_review_stats_daily_user_day", "review_stats_daily_user", ["day"]
+    )
+    op.create_index(
+        "ix_review_stats_daily_user_github_id", "review_stats_daily_user", ["github_id"]
+    )
+
+    # 3) 기존 리뷰로 backfill
+    _backfill("review_stats_daily_model", ("model",))
+    _backfill("review_stats_daily_user", ("github_id", "model"))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_stats_daily_user_github_id", table_name="review_stats_daily_user")
+    op.drop_index("ix_review_stats_daily_user_day", table_name="review_stats_daily_user")
+    op.drop_table("review_stats_daily_user")
+    op.drop_index("ix_review_stats_daily_model_day", table_name="review_stats_daily_model")
+    op.drop_table("review_stats_daily_model")
@@ -0,0 +1,113 @@
+"""add user_id fk to review_meta
+
+Revision ID: e5a19c3d7b62
+Revises: d83a6f1c4b20
+Create Date: 2025-12-15 11:26:08.317745
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a19c3d7b62'
+down_revision: Union[str, Sequence[str], None] = 'd83a6f1c4b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CATEGORIES = ("bug", "maintainability", "style", "security")
+
+UNDATED_DAY = "1970-01-01"
+
+
+def _metric_columns() -> list:
+    columns = [
+        sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("sum_total", sa.Float(precision=53), nullable=False, server_default="0"),
+    ]
+    for name in CATEGORIES:
+        columns.append(sa.Column(f"sum_{name}", sa.Float(precision=53), nullable=False, server_default="0"))
+        columns.append(sa.Column(f"cnt_{name}", sa.Integer(), nullable=False, server_default="0"))
+    return columns
+
+
+def _create_user_rollup(key_column: sa.Column, key_expr: str) -> None:
+    """review_stats_daily_user 를 (day, <key>, model) 키로 만들고 review 에서 채운다"""
+    key = key_column.name
+    op.create_table(
+        "review_stats_daily_user",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        key_column,
+        sa.Column("model", sa.String(length=255), nullable=False, server_default=""),
+        *_metric_columns(),
+        sa.UniqueConstraint("day", key, "model", name="uq_review_stats_daily_user"),
+    )
+    op.create_index("ix_review_stats_daily_user_day", "review_stats_daily_user", ["day"])
+    op.create_index(f"ix_review_stats_daily_user_{key}", "review_stats_daily_user", [key])
+
+    metric_names = ["review_count", "sum_total"]
+    aggregates = ["COUNT(r.id)", "COALESCE(SUM(r.quality_score), 0)"]
+    for name in CATEGORIES:
+        metric_names += [f"sum_{name}", f"cnt_{name}"]
+        aggregates += [f"COALESCE(SUM(r.score_{name}), 0)", f"COUNT(r.score_{name})"]
+
+    day_expr = f"COALESCE(DATE(m.audit), '{UNDATED_DAY}')"
+    op.execute(
+        f"""
+        INSERT INTO review_stats_daily_user (day, {key}, model, {", ".join(metric_names)})
+        SELECT {day_expr}, {key_expr}, COALESCE(m.model, ''), {", ".join(aggregates)}
+        FROM review r
+        JOIN review_meta m ON m.id = r.meta_id
+        GROUP BY {day_expr}, {key_expr}, COALESCE(m.model, '')
+        """
+    )
+
+
+def _drop_user_rollup(key: str) -> None:
+    op.drop_index(f"ix_review_stats_daily_user_{key}", table_name="review_stats_daily_user")
+    op.drop_index("ix_review_stats_daily_user_day", table_name="review_stats_daily_user")
+    op.drop_table("review_stats_daily_user")
+
+
+def upgrade() -> None:
+    # 1) review_meta.user_id (FK → users.id, 유저 삭제 시 CASCADE)
+    op.add_column("review_meta", sa.Column("user_id", sa.Integer(), nullable=True))
+    op.create_index("ix_review_meta_user_id", "review_meta", ["user_id"])
+    op.create_foreign_key(
+        "fk_review_meta_user_id",
+        "review_meta", "users",
+        ["user_id"], ["id"],
+        ondelete="CASCADE",
+    )
+
+    # 2) github_id 로 backfill
+    op.execute(
+        """
+        UPDATE review_meta m
+        JOIN users u ON u.github_id = m.github_id
+        SET m.user_id = u.id
+        """
+    )
+
+    # 3) 유저 롤업 키를 github_id → user_id 로 (유저 없는 리뷰는 0)
+    _drop_user_rollup("github_id")
+    _create_user_rollup(
+        sa.Column("user_id", sa.Integer(), nullable=False, server_default="0"),
+        "COALESCE(m.user_id, 0)",
+    )
+
+
+def downgrade() -> None:
+    _drop_user_rollup("user_id")
+    _create_user_rollup(
+        sa.Column("github_id", sa.String(length=32), nullable=False, server_default=""),
+        "COALESCE(m.github_id, '')",
+    )
+
+    op.drop_constraint("fk_review_meta_user_id", "review_meta", type_="foreignkey")
+    op.drop_index("ix_review_meta_user_id", table_name="review_meta")
+    op.drop_column("review_meta", "user_id")
@@ -0,0 +1,26 @@
+"""add review_meta (audit, id) index for list pagination
+
+Revision ID: f2c8b7d41a09
+Revises: e5a19c3d7b62
+Create Date: 2025-12-18 10:02:41.554310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8b7d41a09'
+down_revision: Union[str, Sequence[str], None] = 'e5a19c3d7b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 리뷰 목록을 (audit DESC, id DESC) keyset 으로 넘길 때 범위 조건 + 정렬을 인덱스로 처리
+    op.create_index("ix_review_meta_audit_id", "review_meta", ["audit", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_meta_audit_id", table_name="review_meta")
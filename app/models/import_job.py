@@ -0,0 +1,36 @@
+# app/models/import_job.py
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.utils.database import Base
+
+
+class SampleImportJob(Base):
+    """
+    백그라운드 샘플 import 작업.
+    업로드 파일은 spool_path (작업을 만든 서버의 로컬 디스크) 에 두고,
+    inserted 는 배치를 커밋하는 트랜잭션에서 같이 올린다 (이어서 할 때 건너뛸 항목 수).
+    """
+
+    __tablename__ = "sample_import_job"
+
+    id = Column(Integer, primary_key=True)
+    github_id = Column(String(32), nullable=False)
+    filename = Column(String(255), nullable=True)
+    spool_path = Column(String(512), nullable=False)
+    size_bytes = Column(BigInteger, nullable=False, server_default="0")
+    batch_size = Column(Integer, nullable=False)
+
+    # queued / running / done / failed / cancelled
+    status = Column(String(16), nullable=False, server_default="queued", index=True)
+    inserted = Column(Integer, nullable=False, server_default="0")
+    batches = Column(Integer, nullable=False, server_default="0")
+    error = Column(Text, nullable=True)
+    # 실행 중인 루프의 선점 토큰 (체크포인트마다 확인)
+    claimed_by = Column(String(64), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    # 실행 중인 작업의 마지막 체크포인트 시각 (오래되면 다른 워커가 이어받는다)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
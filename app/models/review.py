@@ -3,6 +3,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -15,11 +16,26 @@ from sqlalchemy.sql import func
 from app.utils.database import Base
 
 
+# review 에 컬럼으로 비정규화된 고정 카테고리
+CATEGORY_NAMES = ("bug", "maintainability", "style", "security")
+
+
 class ReviewMeta(Base):
     __tablename__ = "review_meta"
+    # 목록 keyset 페이지네이션 (audit DESC, id DESC)
+    __table_args__ = (
+        Index("ix_review_meta_audit_id", "audit", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     github_id = Column(String(32), nullable=True, index=True)
+    # 유저별 조회/삭제는 문자열 github_id 대신 이 FK 로 한다 (유저 삭제 시 CASCADE)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
     version = Column(String(10), nullable=False, server_default="v1")
     language = Column(String(50), nullable=False, server_default="python")
     trigger = Column(String(32), nullable=False, server_default="manual")
@@ -48,6 +64,18 @@ class Review(Base):
     summary = Column(Text, nullable=False)
     code = Column(Text, nullable=True)
 
+    # 고정 4개 카테고리는 review 에 바로 비정규화해서 저장 (조회/통계 시 join 불필요)
+    # 그 외 확장 카테고리는 review_category_result 에 계속 쌓는다.
+    score_bug = Column(Float, nullable=True)
+    score_maintainability = Column(Float, nullable=True)
+    score_style = Column(Float, nullable=True)
+    score_security = Column(Float, nullable=True)
+
+    comment_bug = Column(Text, nullable=True)
+    comment_maintainability = Column(Text, nullable=True)
+    comment_style = Column(Text, nullable=True)
+    comment_security = Column(Text, nullable=True)
+
     meta = relationship("ReviewMeta", back_populates="reviews")
 
     categories = relationship(
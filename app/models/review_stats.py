@@ -0,0 +1,59 @@
+# app/models/review_stats.py
+from sqlalchemy import (
+    Column,
+    Date,
+    Float,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+
+from app.utils.database import Base
+
+
+class _DailyRollupColumns:
+    """
+    일별 롤업 공통 컬럼 (리뷰 수 + 점수 합계 / 카테고리별 유효 개수).
+    평균은 sum / count 로 계산한다. 합계는 커지므로 double 정밀도로 둔다.
+    """
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False, index=True)
+
+    review_count = Column(Integer, nullable=False, server_default="0")
+    sum_total = Column(Float(precision=53), nullable=False, server_default="0")
+
+    sum_bug = Column(Float(precision=53), nullable=False, server_default="0")
+    cnt_bug = Column(Integer, nullable=False, server_default="0")
+    sum_maintainability = Column(Float(precision=53), nullable=False, server_default="0")
+    cnt_maintainability = Column(Integer, nullable=False, server_default="0")
+    sum_style = Column(Float(precision=53), nullable=False, server_default="0")
+    cnt_style = Column(Integer, nullable=False, server_default="0")
+    sum_security = Column(Float(precision=53), nullable=False, server_default="0")
+    cnt_security = Column(Integer, nullable=False, server_default="0")
+
+
+class ReviewDailyModelStats(_DailyRollupColumns, Base):
+    """(day, model) 단위 롤업. model 이 없으면 "" 로 저장"""
+
+    __tablename__ = "review_stats_daily_model"
+    __table_args__ = (
+        UniqueConstraint("day", "model", name="uq_review_stats_daily_model"),
+    )
+
+    model = Column(String(255), nullable=False, server_default="")
+
+
+class ReviewDailyUserStats(_DailyRollupColumns, Base):
+    """
+    (day, user_id, model) 단위 롤업. 유저가 없는 리뷰는 user_id 0 으로 모은다.
+    by-user 통계의 model 필터를 위해 model 까지 키에 포함한다.
+    """
+
+    __tablename__ = "review_stats_daily_user"
+    __table_args__ = (
+        UniqueConstraint("day", "user_id", "model", name="uq_review_stats_daily_user"),
+    )
+
+    user_id = Column(Integer, nullable=False, server_default="0", index=True)
+    model = Column(String(255), nullable=False, server_default="")
@@ -13,7 +13,12 @@ from app.services.auth import (
     exchange_code_for_token,
     fetch_github_me,
     create_jwt,
-    decode_jwt,
+)
+from app.services.principal import (
+    CurrentUser,
+    principal_cache,
+    request_token,
+    resolve_principal,
 )
 
 router = APIRouter(prefix="/auth/github", tags=["auth"])
@@ -113,25 +118,35 @@ def get_current_user_id(request: Request) -> int:
     auth = request.headers.get("Authorization", "")
     if not auth.startswith("Bearer "):
         raise HTTPException(401, "missing bearer token")
-    payload = decode_jwt(auth.split(" ", 1)[1])
-    return int(payload["sub"])
+    user_id = principal_cache.user_id_for_token(auth.split(" ", 1)[1])
+    if user_id is None:
+        raise HTTPException(401, "invalid token")
+    return user_id
 
 
 def get_current_user_id_from_cookie(request: Request) -> int:
 
-    auth = request.headers.get("Authorization", "")
-    token = None
-
-    if auth.startswith("Bearer "):
-        token = auth.split(" ", 1)[1]
-    else:
-        token = request.cookies.get("access_token")
+    token = request_token(request)
 
     if not token:
         raise HTTPException(401, "missing token (cookie or bearer)")
 
-    payload = decode_jwt(token)
-    return int(payload["sub"])
+    user_id = principal_cache.user_id_for_token(token)
+    if user_id is None:
+        raise HTTPException(401, "invalid token")
+    return user_id
+
+
+async def get_current_user(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> CurrentUser:
+    """Bearer / 쿠키의 로그인 유저 (캐시 스냅샷). request.state.principal 에도 남는다"""
+    get_current_user_id_from_cookie(request)
+    user = await resolve_principal(request, session)
+    if user is None:
+        raise HTTPException(status_code=404, detail="user not found")
+    return user
 
 
 @router.get("/logout")
@@ -152,8 +167,7 @@ async def mint_vscode_token(
     user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_session),
 ):
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await principal_cache.get_user(session, user_id=user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -1,20 +1,33 @@
 # app/routers/ui_sample_import.py
 
-from typing import Any
-import json
-from datetime import datetime
-
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.database import get_session
-from app.models.review import Review, ReviewMeta, ReviewCategoryResult
+from app.models.import_job import SampleImportJob
+from app.services.import_jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    import_job_runner,
+    import_job_topic,
+    job_dict,
+    publish_job_event,
+    remove_spool,
+    spool_upload,
+)
+from app.services.sample_import import clamp_batch_size
 
 router = APIRouter(prefix="/ui", tags=["ui"])
 templates = Jinja2Templates(directory="app/templates")
 
+# 작업 목록 페이지에 보여줄 최근 작업 수
+IMPORT_JOB_LIST_LIMIT = 50
+
 
 @router.get("/sample_import", response_class=HTMLResponse)
 async def sample_import_form(request: Request):
@@ -22,99 +35,128 @@ async def sample_import_form(request: Request):
         "ui/sample_import.html",
         {
             "request": request,
-            "inserted": None,
-            "error": None,
+            "batch_size": clamp_batch_size(None),
         },
     )
 
 
-@router.post("/sample_import", response_class=HTMLResponse)
+@router.post("/sample_import")
 async def sample_import_post(
     request: Request,
     github_id: str = Form(...),
     json_file: UploadFile = File(...),
+    batch_size: str = Form(""),
     session: AsyncSession = Depends(get_session),
 ):
-    inserted = 0
-    error_msg: str | None = None
-
+    # 업로드는 디스크에 받아두고 작업만 만든 뒤 바로 상태 페이지로 보낸다 (import 는 백그라운드)
+    size = clamp_batch_size(int(batch_size) if batch_size.strip().isdigit() else None)
+    spool_path, size_bytes = await spool_upload(json_file)
+
+    job = SampleImportJob(
+        github_id=github_id,
+        filename=(json_file.filename or "")[:255] or None,
+        spool_path=spool_path,
+        size_bytes=size_bytes,
+        batch_size=size,
+        status=JOB_QUEUED,
+    )
+    session.add(job)
     try:
-        raw = await json_file.read()
-        try:
-            data = json.loads(raw.decode("utf-8"))
-        except UnicodeDecodeError:
-            data = json.loads(raw.decode("cp949"))
-
-        # 배열 / 단일 객체 모두 처리
-        if isinstance(data, list):
-            items: list[dict[str, Any]] = data
-        elif isinstance(data, dict):
-            items = [data]
-        else:
-            raise ValueError("JSON은 배열 또는 객체 형태여야 합니다.")
-
-        for payload in items:
-            meta_json = payload.get("meta") or {}
-            body_json = payload.get("body") or {}
-
-            # 1) review_meta 먼저 생성
-            # github_id 는 UI에서 받은 값으로 강제 세팅
-            audit_raw = meta_json.get("audit")
-            audit_dt = None
-            if audit_raw:
-                try:
-                    # "2025-12-03T15:48:11" 형태라고 가정
-                    audit_dt = datetime.fromisoformat(audit_raw)
-                except Exception:
-                    audit_dt = None  # 포맷 이상하면 그냥 None
-
-            review_meta = ReviewMeta(
-                github_id=github_id,
-                version=meta_json.get("version") or "v1",
-                language=meta_json.get("language") or "plaintext",
-                trigger=meta_json.get("trigger") or "manual",
-                code_fingerprint=meta_json.get("code_fingerprint") or "",
-                model=meta_json.get("model") or "",
-                audit=audit_dt,
-            )
-            session.add(review_meta)
-            await session.flush()  # review_meta.id 확보
-
-            # 2) review 생성 (review.meta_id 로 연결)
-            review = Review(
-                quality_score=body_json.get("quality_score"),
-                summary=body_json.get("summary"),
-                meta_id=review_meta.id,
-                code=body_json.get("code"),
-            )
-            session.add(review)
-            await session.flush()  # review.id 확보
-
-            # 3) review_category_result 여러 줄 생성
-            scores = body_json.get("scores_by_category") or {}
-            comments = body_json.get("comments") or {}
-
-            for category, score in scores.items():
-                cr = ReviewCategoryResult(
-                    review_id=review.id,
-                    category=category,
-                    score=score,
-                    comment=comments.get(category),
-                )
-                session.add(cr)
-
         await session.commit()
-        inserted = len(items)
+    except Exception:
+        remove_spool(spool_path)
+        raise
 
-    except Exception as e:
-        await session.rollback()
-        error_msg = str(e)
+    await publish_job_event("import_queued", job_dict(job))
+    import_job_runner.wake()
+    return RedirectResponse(url=f"/ui/imports/{job.id}", status_code=303)
 
+
+# =====================================================================
+# import 작업 목록 / 상태
+# =====================================================================
+
+@router.get("/imports", response_class=HTMLResponse)
+async def import_jobs_page(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+):
+    jobs = (
+        await session.execute(
+            select(SampleImportJob).order_by(SampleImportJob.id.desc()).limit(IMPORT_JOB_LIST_LIMIT)
+        )
+    ).scalars().all()
     return templates.TemplateResponse(
-        "ui/sample_import.html",
-        {
-            "request": request,
-            "inserted": inserted if not error_msg else None,
-            "error": error_msg,
-        },
+        "ui/import_jobs.html",
+        {"request": request, "jobs": jobs},
     )
+
+
+@router.get("/imports/{job_id}", response_class=HTMLResponse)
+async def import_job_page(
+    job_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+):
+    job = await session.get(SampleImportJob, job_id)
+    if not job:
+        return RedirectResponse(url="/ui/imports", status_code=303)
+    return templates.TemplateResponse(
+        "ui/import_job.html",
+        {"request": request, "job": job_dict(job), "topic": import_job_topic(job.id)},
+    )
+
+
+@router.get("/imports/{job_id}/status")
+async def import_job_status(
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+):
+    """상태 페이지가 WebSocket 을 못 쓸 때 / 재연결 후 다시 맞출 때 쓰는 JSON"""
+    job = await session.get(SampleImportJob, job_id)
+    if not job:
+        return {"id": job_id, "status": None}
+    return job_dict(job)
+
+
+@router.post("/imports/{job_id}/cancel")
+async def import_job_cancel(
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+):
+    # 실행 중이면 다음 체크포인트에서 러너가 멈추고 spool 을 지운다
+    job = await session.get(SampleImportJob, job_id)
+    if job and job.status in (JOB_QUEUED, JOB_RUNNING, JOB_FAILED):
+        was_running = job.status == JOB_RUNNING
+        result = await session.execute(
+            update(SampleImportJob)
+            .where(SampleImportJob.id == job_id, SampleImportJob.status == job.status)
+            .values(status=JOB_CANCELLED)
+        )
+        await session.commit()
+        if result.rowcount == 1:
+            if not was_running:
+                remove_spool(job.spool_path)
+            await session.refresh(job)
+            await publish_job_event("import_cancelled", job_dict(job))
+    return RedirectResponse(url=f"/ui/imports/{job_id}", status_code=303)
+
+
+@router.post("/imports/{job_id}/resume")
+async def import_job_resume(
+    job_id: int,
+    session: AsyncSession = Depends(get_session),
+):
+    # 실패한 작업을 체크포인트 (inserted) 부터 다시 돌린다
+    job = await session.get(SampleImportJob, job_id)
+    if job and job.status == JOB_FAILED:
+        await session.execute(
+            update(SampleImportJob)
+            .where(SampleImportJob.id == job_id, SampleImportJob.status == JOB_FAILED)
+            .values(status=JOB_QUEUED, error=None, finished_at=None)
+        )
+        await session.commit()
+        await session.refresh(job)
+        await publish_job_event("import_queued", job_dict(job))
+        import_job_runner.wake()
+    return RedirectResponse(url=f"/ui/imports/{job_id}", status_code=303)
@@ -7,42 +7,103 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, Request, Form
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.utils.database import get_session
+from app.utils.database import AsyncSessionLocal, get_session
 from app.models.review import Review, ReviewMeta, ReviewCategoryResult
 from app.models.user import User
-from app.routers.auth import get_current_user_id_from_cookie
 from app.schemas.common import Meta as MetaSchema
-import httpx
+from app.schemas.review import ReviewRequest
+from app.services.review_service import (
+    parse_include,
+    load_review_detail,
+    load_review_page,
+    decode_review_cursor,
+    review_detail_cache,
+    review_owner_condition,
+)
+from app.services.review_pipeline import ReviewRequestError, run_review_request
+from app.services.principal import CurrentUser, principal_cache, resolve_principal
+from app.services.fix_service import fix_review_code
+from app.services.stats_service import model_stats, parse_date_utc, user_stats
+from app.services.stats_rollup import clear_rollups, subtract_reviews_from_rollups
+from app.services.fragment_cache import (
+    FRAGMENT_CACHE_LIST_TTL,
+    detail_key,
+    fragment_cache,
+    invalidate_reviews,
+    mark_fragments_dirty,
+    row_key,
+)
+from app.services.score_analytics import score_snapshot
+import asyncio
+import logging
 import os
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ui", tags=["ui"])
 templates = Jinja2Templates(directory="app/templates")
 
-INTERNAL_API_BASE: str = os.getenv("INTERNAL_API_BASE", "http://127.0.0.1:8000")
+# UI 에서 리뷰 / fix 를 기다리는 최대 시간 (초)
+UI_REVIEW_TIMEOUT = 60.0
+UI_FIX_TIMEOUT = 30.0
 
+# 리뷰 목록 한 페이지 행 수 (?limit= 으로 바꿀 수 있고 최대 UI_REVIEW_PAGE_MAX)
+UI_REVIEW_PAGE_SIZE = int(os.getenv("UI_REVIEW_PAGE_SIZE", "50"))
+UI_REVIEW_PAGE_MAX = 200
 
-# =====================================================================
-# 공통 유저 조회
-# =====================================================================
 
-async def _get_current_user(
-    request: Request,
-    session: AsyncSession,
-) -> Optional[User]:
+# 타임아웃 뒤에도 끝까지 저장 중인 리뷰 task (GC 로 사라지지 않도록 참조를 들고 있는다)
+_background_reviews: set[asyncio.Task] = set()
+
+
+async def _run_review(envelope: ReviewRequest, user: CurrentUser):
+    # 요청 세션은 응답과 함께 닫히므로, 타임아웃 뒤에도 이어서 저장할 수 있게 세션을 따로 연다
+    async with AsyncSessionLocal() as session:
+        return await run_review_request(session, envelope, user=user)
+
+
+def _review_done(task: asyncio.Task) -> None:
+    _background_reviews.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None and not isinstance(exc, ReviewRequestError):
+        logger.error("[ui] review failed", exc_info=exc)
+
+
+async def _submit_review(user: CurrentUser, payload: dict) -> tuple[int, dict]:
+    """
+    /v1/reviews/request 와 같은 처리를 같은 프로세스에서 실행한다.
+    (HTTP status, 응답 JSON 모양의 dict)
+    UI_REVIEW_TIMEOUT 이 지나면 504 를 돌려주지만 리뷰는 취소하지 않는다 (HTTP 호출 때처럼 끝까지 저장된다).
+    """
+    task = asyncio.create_task(_run_review(ReviewRequest.model_validate(payload), user))
+    _background_reviews.add(task)
+    task.add_done_callback(_review_done)
     try:
-        uid = get_current_user_id_from_cookie(request)
-    except Exception:
-        return None
+        response = await asyncio.wait_for(asyncio.shield(task), timeout=UI_REVIEW_TIMEOUT)
+    except ReviewRequestError as exc:
+        return exc.status_code, {"detail": exc.detail}
+    except asyncio.TimeoutError:
+        return 504, {"error": "Timeout: 리뷰 응답이 너무 오래 걸렸습니다. 리뷰는 완료되면 목록에 저장됩니다."}
+    return 200, response.model_dump(mode="json")
 
-    if not uid:
-        return None
 
-    row = await session.execute(select(User).where(User.id == uid))
-    return row.scalar_one_or_none()
+# =====================================================================
+# 렌더링 조각 캐시 (유저와 무관한 부분만)
+# =====================================================================
+
+def _render_cached(key: tuple, template_name: str, ttl: float | None = None, **context) -> Markup:
+    html = fragment_cache.get(key)
+    if html is None:
+        html = templates.get_template(template_name).render(**context)
+        fragment_cache.set(key, html, ttl)
+    return Markup(html)
 
 
 # =====================================================================
@@ -94,7 +155,7 @@ async def review_form(
     request: Request,
     session: AsyncSession = Depends(get_session),
 ):
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
 
     ctx = {
         "request": request,
@@ -115,19 +176,9 @@ async def review_submit(
     code: str = Form(...),
     session: AsyncSession = Depends(get_session),
 ):
-    try:
-        uid = get_current_user_id_from_cookie(request)
-    except Exception:
-        uid = None
-
-    if uid is None:
-        uid = user_id
-
-    if uid is None:
-        return RedirectResponse(url="/auth/github/login", status_code=303)
-
-    row = await session.execute(select(User).where(User.id == int(uid)))
-    user = row.scalar_one_or_none()
+    user = await resolve_principal(request, session)
+    if user is None and user_id is not None:
+        user = await principal_cache.get_user(session, user_id=int(user_id))
     if not user or not user.github_id:
         return RedirectResponse(url="/auth/github/login", status_code=303)
 
@@ -136,7 +187,7 @@ async def review_submit(
     criteria: List[str] = []
 
     payload = build_code_request_payload(
-        user_id=int(uid),
+        user_id=user.id,
         github_id=github_id,
         model_id=model_id,
         language=language,
@@ -145,15 +196,14 @@ async def review_submit(
         aspects=criteria,
     )
 
-    url = f"{INTERNAL_API_BASE}/v1/reviews/request"
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        res = await client.post(url, json=payload)
+    try:
+        status, body = await _submit_review(user, payload)
+    except Exception:
+        status, body = 500, {}
 
-    if res.status_code != 200:
+    if status != 200:
         return RedirectResponse(url="/ui/reviews", status_code=303)
 
-    body = res.json()
     resp_body = body.get("body") or {}
     review_id = resp_body.get("review_id")
 
@@ -173,24 +223,22 @@ async def review_detail(
     request: Request,
     session: AsyncSession = Depends(get_session),
 ):
-    stmt = (
-        select(Review)
-        .options(joinedload(Review.meta), joinedload(Review.categories))
-        .where(Review.id == review_id)
-    )
-    rec = (await session.execute(stmt)).unique().scalar_one_or_none()
-    if not rec:
-        return RedirectResponse(url="/ui/reviews", status_code=303)
+    # 본문은 유저와 무관하므로 캐시된 HTML 을 쓰고, 헤더 (로그인 유저) 만 매번 렌더링한다
+    body_html = fragment_cache.get(detail_key(review_id))
+    if body_html is None:
+        rec = await load_review_detail(session, review_id)
+        if not rec:
+            return RedirectResponse(url="/ui/reviews", status_code=303)
+        body_html = templates.get_template("ui/_review_detail_body.html").render(rec=rec)
+        fragment_cache.set(detail_key(review_id), body_html)
 
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/review_detail.html",
         {
             "request": request,
-            "rec": rec,
-            "quality": None,
-            "category_rows": None,
+            "body_html": Markup(body_html),
             "current_user_id": user.id if user else None,
             "current_user_login": user.login if user else None,
             "current_user_store_code": user.store_code if user else None,  # 🔥 추가
@@ -202,28 +250,109 @@ async def review_detail(
 # 리뷰 목록
 # =====================================================================
 
+def _review_list_filters(
+    user_id: str | None,
+    model: str | None,
+    from_: str | None,
+    to: str | None,
+) -> dict:
+    """목록 필터 쿼리 파라미터 정규화 (빈 값 / 잘못된 값은 무시)"""
+    try:
+        uid = int(user_id) if user_id else None
+    except ValueError:
+        uid = None
+    try:
+        from_dt, to_dt = parse_date_utc(from_ or None), parse_date_utc(to or None)
+    except ValueError:
+        from_dt = to_dt = None
+    return {
+        "user_id": uid,
+        "model": (model or "").strip() or None,
+        "from_dt": from_dt,
+        "to_dt": to_dt,
+    }
+
+
+async def _review_page(
+    session: AsyncSession,
+    request: Request,
+    *,
+    include: str | None,
+    cursor: str | None,
+    limit: int | None,
+    filters: dict,
+) -> dict:
+    """
+    목록 한 페이지의 행 HTML + 다음 조각 URL (review_list / review_list_fragment 공용).
+    같은 쿼리는 리뷰가 추가 / 삭제될 때까지 (조각 캐시 generation) DB 없이 캐시에서 돌려준다.
+    """
+    # 목록에서는 code 원문을 기본으로 싣지 않는다 (?include=code 일 때만)
+    include_code = "code" in parse_include(include)
+    page_key = ("list", fragment_cache.generation, tuple(sorted(request.query_params.multi_items())))
+    cached = fragment_cache.get(page_key)
+    if cached is not None:
+        # "<next_url>\n<rows_html>" 한 문자열로 저장해 둔다
+        next_url, rows_html = cached.split("\n", 1)
+        return {"rows_html": Markup(rows_html), "include_code": include_code, "next_url": next_url or None}
+
+    generation = fragment_cache.generation
+    page_size = min(max(limit or UI_REVIEW_PAGE_SIZE, 1), UI_REVIEW_PAGE_MAX)
+
+    rows, next_cursor = await load_review_page(
+        session,
+        limit=page_size,
+        cursor=decode_review_cursor(cursor),
+        include_code=include_code,
+        **filters,
+    )
+
+    next_url = None
+    if next_cursor:
+        params = {k: v for k, v in request.query_params.items() if k != "cursor" and v}
+        params["cursor"] = next_cursor
+        next_url = "/ui/reviews/fragment?" + urlencode(params)
+
+    rows_html = "".join(
+        _render_cached(row_key(row.review_id, include_code), "ui/_review_row.html", r=row, include_code=include_code)
+        for row in rows
+    )
+    # 조회 도중 리뷰가 바뀌었으면 (generation 변경) 페이지는 캐시하지 않는다
+    if generation == fragment_cache.generation:
+        fragment_cache.set(page_key, f"{next_url or ''}\n{rows_html}", FRAGMENT_CACHE_LIST_TTL)
+    return {"rows_html": Markup(rows_html), "include_code": include_code, "next_url": next_url}
+
+
 @router.get("/reviews")
 async def review_list(
     request: Request,
     session: AsyncSession = Depends(get_session),
-    user_id: int | None = None,
+    user_id: str | None = None,
+    model: str | None = None,
+    from_: str | None = None,
+    to: str | None = None,
+    include: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
 ):
-    stmt = (
-        select(Review)
-        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
-        .options(joinedload(Review.meta))
-        .order_by(ReviewMeta.audit.desc())
+    page = await _review_page(
+        session,
+        request,
+        include=include,
+        cursor=cursor,
+        limit=limit,
+        filters=_review_list_filters(user_id, model, from_, to),
     )
-
-    rows = (await session.execute(stmt)).unique().scalars().all()
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/review_list.html",
         {
             "request": request,
-            "rows": rows,
+            **page,
             "user_id": user_id,
+            "model": model,
+            "from": from_,
+            "to": to,
             "current_user_id": user.id if user else None,
             "current_user_login": user.login if user else None,
             "current_user_store_code": user.store_code if user else None,  # 🔥 추가
@@ -231,6 +360,30 @@ async def review_list(
     )
 
 
+@router.get("/reviews/fragment")
+async def review_list_fragment(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    user_id: str | None = None,
+    model: str | None = None,
+    from_: str | None = None,
+    to: str | None = None,
+    include: str | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+):
+    """다음 페이지의 <tr> 조각만 렌더링 (스크롤 시 lazy-load)"""
+    page = await _review_page(
+        session,
+        request,
+        include=include,
+        cursor=cursor,
+        limit=limit,
+        filters=_review_list_filters(user_id, model, from_, to),
+    )
+    return templates.TemplateResponse("ui/_review_rows.html", {"request": request, **page})
+
+
 # =====================================================================
 # API 테스트 화면 (/ui/api-test)
 # =====================================================================
@@ -240,7 +393,7 @@ async def api_test_form(
     request: Request,
     session: AsyncSession = Depends(get_session),
 ):
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/api_test.html",
@@ -269,7 +422,7 @@ async def api_test_submit(
     criteria: str | None = Form(None),
     session: AsyncSession = Depends(get_session),
 ):
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
     effective_user_id: Optional[int] = None
 
     if user:
@@ -280,8 +433,7 @@ async def api_test_submit(
     if effective_user_id is None:
         return RedirectResponse(url="/auth/github/login", status_code=303)
 
-    row = await session.execute(select(User).where(User.id == effective_user_id))
-    effective_user = row.scalar_one_or_none()
+    effective_user = user or await principal_cache.get_user(session, user_id=effective_user_id)
     if not effective_user or not effective_user.github_id:
         return RedirectResponse(url="/auth/github/login", status_code=303)
 
@@ -298,23 +450,7 @@ async def api_test_submit(
         "criteria": crit_list,
     }
 
-    final_token: str | None = None
-    access_cookie = request.cookies.get("access_token")
-
-    if token:
-        final_token = token
-    elif access_cookie:
-        final_token = access_cookie
-    else:
-        debug_url = f"{INTERNAL_API_BASE}/auth/github/debug/mint?user_id={effective_user_id}"
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                debug_res = await client.get(debug_url)
-            if debug_res.status_code == 200:
-                data = debug_res.json()
-                final_token = data.get("body", {}).get("access_token")
-        except Exception:
-            final_token = None
+    final_token: str | None = token or request.cookies.get("access_token")
 
     payload = build_code_request_payload(
         user_id=effective_user_id,
@@ -326,30 +462,10 @@ async def api_test_submit(
         aspects=crit_list,
     )
 
-    url = f"{INTERNAL_API_BASE}/v1/reviews/request"
-    headers = {"Content-Type": "application/json"}
-
-    if final_token:
-        headers["Authorization"] = f"Bearer {final_token}"
-
-    cookies = {}
-    if access_cookie:
-        cookies["access_token"] = access_cookie
-
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            res = await client.post(url, headers=headers, cookies=cookies, json=payload)
-        try:
-            body = res.json()
-        except Exception:
-            body = {"raw": res.text}
-        status = res.status_code
-    except httpx.ReadTimeout:
-        res = None
-        body = {
-            "error": "ReadTimeout: /v1/reviews/request 응답이 너무 오래 걸렸습니다."
-        }
-        status = 504
+        status, body = await _submit_review(effective_user, payload)
+    except Exception as e:
+        status, body = 500, {"error": str(e)}
 
     pretty_resp = json.dumps(body, ensure_ascii=False, indent=2)
     pretty_sent = json.dumps(payload, ensure_ascii=False, indent=2)
@@ -385,29 +501,15 @@ async def stats_by_model_page(
     request: Request,
     from_: str | None = None,
     to: str | None = None,
+    session: AsyncSession = Depends(get_session),
 ):
-    params = {}
-    if from_:
-        params["from"] = from_
-    if to:
-        params["to"] = to
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            res = await client.get(
-                f"{INTERNAL_API_BASE}/v1/reviews/stats/by-model",
-                params=params,
-            )
-        data = res.json()
+        _, _, items = await model_stats(session, parse_date_utc(from_), parse_date_utc(to))
+        data = {"data": items}
     except Exception as e:
         data = {"error": str(e), "data": []}
 
-    user: Optional[User] = None
-    try:
-        session: AsyncSession = await get_session().__anext__()
-        user = await _get_current_user(request, session)
-    except Exception:
-        user = None
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/stats_models.html",
@@ -435,33 +537,17 @@ async def stats_by_user_page(
     to: str | None = None,
     model: str | None = None,
     limit: int | None = None,
+    session: AsyncSession = Depends(get_session),
 ):
-    params = {}
-    if from_:
-        params["from"] = from_
-    if to:
-        params["to"] = to
-    if model:
-        params["model"] = model
-    if limit:
-        params["limit"] = limit
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            res = await client.get(
-                f"{INTERNAL_API_BASE}/v1/reviews/stats/by-user",
-                params=params,
-            )
-        data = res.json()
+        _, _, items = await user_stats(
+            session, parse_date_utc(from_), parse_date_utc(to), model, limit if limit and limit > 0 else None
+        )
+        data = {"data": items}
     except Exception as e:
         data = {"error": str(e), "data": []}
 
-    user: Optional[User] = None
-    try:
-        session: AsyncSession = await get_session().__anext__()
-        user = await _get_current_user(request, session)
-    except Exception:
-        user = None
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/stats_users.html",
@@ -489,7 +575,7 @@ async def fix_test_form(
     request: Request,
     session: AsyncSession = Depends(get_session),
 ):
-    user = await _get_current_user(request, session)
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/fix_test.html",
@@ -511,24 +597,25 @@ async def fix_test_submit(
     request: Request,
     review_id: int = Form(...),
     code: str = Form(...),
+    session: AsyncSession = Depends(get_session),
 ):
     payload = {
         "review_id": review_id,
         "code": code,
     }
 
-    url = f"{INTERNAL_API_BASE}/v1/fix"
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            res = await client.post(url, json=payload)
-        status = res.status_code
-        fixed_code = res.text            # 🔥 /v1/fix 가 str을 반환하므로 text 로 받기
-        error = None
-    except httpx.ReadTimeout:
+        fixed_code = await asyncio.wait_for(
+            fix_review_code(session, review_id, code), timeout=UI_FIX_TIMEOUT
+        )
+        if fixed_code is None:
+            fixed_code, status, error = "", 404, "review not found"
+        else:
+            status, error = 200, None
+    except asyncio.TimeoutError:
         fixed_code = ""
         status = 504
-        error = "ReadTimeout: /v1/fix 응답이 너무 오래 걸렸습니다."
+        error = "Timeout: fix 응답이 너무 오래 걸렸습니다."
     except Exception as e:
         fixed_code = ""
         status = 500
@@ -537,12 +624,7 @@ async def fix_test_submit(
     pretty_sent = json.dumps(payload, ensure_ascii=False, indent=2)
 
     # 유저 정보 (헤더용)
-    user: Optional[User] = None
-    try:
-        session: AsyncSession = await get_session().__anext__()
-        user = await _get_current_user(request, session)
-    except Exception:
-        user = None
+    user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/fix_test.html",
@@ -574,13 +656,15 @@ async def update_store_code_ui(
     - checkbox이면 "on"/"true"/"1" → True로 파싱됨
     - 숫자 0/1, true/false 전부 bool로 캐스팅됨
     """
-    user = await _get_current_user(request, session)
+    current = await resolve_principal(request, session)
+    user = await session.get(User, current.id) if current else None
     if not user:
         return RedirectResponse(url="/auth/github/login", status_code=303)
 
     user.store_code = store_code
     session.add(user)
     await session.commit()
+    principal_cache.invalidate_users([user.id])
 
     # 돌아갈 곳: referer 있으면 거기로, 없으면 리뷰 폼으로
     referer = request.headers.get("referer") or "/ui/review"
@@ -599,8 +683,14 @@ async def review_delete(
 ):
     rec = await session.get(Review, review_id)
     if rec:
+        # 롤업에서 먼저 빼고 삭제 (같은 트랜잭션)
+        await subtract_reviews_from_rollups(session, Review.id == review_id)
         await session.delete(rec)
+        mark_fragments_dirty(session)
         await session.commit()
+    review_detail_cache.delete(review_id)
+    score_snapshot.remove([review_id])
+    invalidate_reviews([review_id])
 
     # 삭제 후 목록으로
     return RedirectResponse(url="/ui/reviews", status_code=303)
@@ -623,7 +713,14 @@ async def review_delete_all(
     # 3) 메타도 모두 삭제
     await session.execute(delete(ReviewMeta))
 
+    # 4) 통계 롤업도 비우기
+    await clear_rollups(session)
+    mark_fragments_dirty(session)
+
     await session.commit()
+    review_detail_cache.clear()
+    score_snapshot.clear()
+    fragment_cache.clear()
 
     return RedirectResponse(url="/ui/reviews", status_code=303)
 
@@ -648,7 +745,15 @@ async def users_delete_all(
     # 4) 모든 유저 삭제
     await session.execute(delete(User))
 
+    # 5) 통계 롤업도 비우기
+    await clear_rollups(session)
+    mark_fragments_dirty(session)
+
     await session.commit()
+    review_detail_cache.clear()
+    score_snapshot.clear()
+    fragment_cache.clear()
+    principal_cache.clear_users()
 
     # 🔁 유저 관리 페이지로 돌려보내기
     return RedirectResponse(url="/ui/users", status_code=303)
@@ -668,58 +773,38 @@ async def users_delete_selected(
     if not user_ids:
         return RedirectResponse(url="/ui/users", status_code=303)
 
-    # 1) 선택된 유저들 조회
-    result_users = await session.execute(
-        select(User).where(User.id.in_(user_ids))
+    # 1) 캐시 무효화용 review id (user_id 가 비어 있는 행은 github_id 로)
+    github_ids = (
+        await session.execute(select(User.github_id).where(User.id.in_(user_ids)))
+    ).scalars().all()
+    owned = review_owner_condition(user_ids, github_ids)
+    result_reviews = await session.execute(
+        select(Review.id)
+        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+        .where(owned)
     )
-    users = result_users.scalars().all()
-
-    if not users:
-        return RedirectResponse(url="/ui/users", status_code=303)
+    review_ids = result_reviews.scalars().all()
 
-    # 2) 이 유저들의 github_id 목록
-    github_ids = [u.github_id for u in users if u.github_id]
-
-    review_ids: list[int] = []
-    meta_ids: list[int] = []
-
-    if github_ids:
-        # 3) github_id 기준으로 ReviewMeta 찾기
-        result_meta = await session.execute(
-            select(ReviewMeta.id).where(ReviewMeta.github_id.in_(github_ids))
-        )
-        meta_ids = result_meta.scalars().all()
-
-        if meta_ids:
-            # 4) meta_id 기준으로 Review 찾기
-            result_reviews = await session.execute(
-                select(Review.id).where(Review.meta_id.in_(meta_ids))
-            )
-            review_ids = result_reviews.scalars().all()
-
-    # 5) 카테고리 결과 삭제 (review_id 기준)
+    # 2) 롤업에서 빼기 (삭제 전에)
     if review_ids:
-        await session.execute(
-            delete(ReviewCategoryResult).where(
-                ReviewCategoryResult.review_id.in_(review_ids)
-            )
-        )
-        await session.execute(
-            delete(Review).where(Review.id.in_(review_ids))
-        )
+        await subtract_reviews_from_rollups(session, owned)
 
-    # 6) 메타 삭제
-    if meta_ids:
-        await session.execute(
-            delete(ReviewMeta).where(ReviewMeta.id.in_(meta_ids))
-        )
-
-    # 7) 유저 삭제
+    # 3) 유저 삭제 → review_meta / review / review_category_result 는 ON DELETE CASCADE
     await session.execute(
         delete(User).where(User.id.in_(user_ids))
     )
+    # 4) user_id 가 비어 있던 메타는 CASCADE 에 걸리지 않으므로 직접 삭제 (review 는 CASCADE)
+    if github_ids:
+        await session.execute(
+            delete(ReviewMeta).where(ReviewMeta.user_id.is_(None), ReviewMeta.github_id.in_(github_ids))
+        )
+    mark_fragments_dirty(session)
 
     await session.commit()
+    review_detail_cache.delete_many(review_ids)
+    score_snapshot.remove(review_ids)
+    invalidate_reviews(review_ids)
+    principal_cache.invalidate_users(user_ids)
 
     return RedirectResponse(url="/ui/users", status_code=303)
 
@@ -740,7 +825,7 @@ async def users_page(
     ).scalars().all()
 
     # 헤더용 현재 로그인 유저 정보
-    current_user = await _get_current_user(request, session)
+    current_user = await resolve_principal(request, session)
 
     return templates.TemplateResponse(
         "ui/users.html",
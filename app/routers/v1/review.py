@@ -1,24 +1,18 @@
+import os
 from uuid import uuid4
-from datetime import datetime, timezone, timedelta
-from hashlib import sha256
-from typing import List, Dict
+from datetime import datetime, timezone
+from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, case, and_, desc
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, func
 
 from app.utils.database import get_session
-from app.models.review import Review, ReviewMeta, ReviewCategoryResult
-from app.models.user import User
+from app.models.review import Review, ReviewMeta
 from app.schemas.common import Meta
 from app.schemas.review import (
     ReviewRequest,
     ReviewRequestResponse,
-    ReviewRequestResponseBody,
-    LLMRequest,
-    LLMQualityResponse,
-    ScoresByCategory,
     ReviewResultBody,
     ReviewDetailResponse,
     ReviewListResponse,
@@ -27,47 +21,90 @@ from app.schemas.review import (
     ModelStatsItem,
     UserStatsResponse,
     UserStatsItem,
+    TimeseriesItem,
+    TimeseriesResponse,
+    PercentileItem,
+    PercentileResponse,
+    HistogramItem,
+    HistogramResponse,
+    ReviewCodeBody,
+    ReviewCodeResponse,
 )
-from app.services.llm_client import review_code
-from app.services.review_service import save_review_result
-from app.routers.ws_debug import ws_manager
-from app.routers.auth import get_current_user_id_from_cookie
+from app.services.review_pipeline import (
+    ReviewRequestError,
+    run_review_request,
+    build_audit_value,
+)
+from app.services.review_service import (
+    parse_include,
+    review_list_columns,
+    split_categories,
+    review_collection_version,
+    review_owner_condition,
+    load_review_detail,
+)
+from app.services.stats_rollup import rollup_version
+from app.services.stats_service import cached_stats, model_stats, parse_date_utc, user_stats
+from app.services.stats_timeseries import load_timeseries
+from app.services.stats_cache import stats_cache_key
+from app.services import score_analytics
+from app.services.score_analytics import score_snapshot
+from app.utils.fast_json import FastJSONResponse
+from app.utils.http_cache import make_etag, etag_matches, apply_cache_headers, not_modified
+from app.routers.auth import get_current_user
+from app.services.principal import CurrentUser
 
 
 router = APIRouter(prefix="/v1/reviews", tags=["reviews"])
 
+# 리뷰는 저장 후 바뀌지 않으므로 상세 응답은 캐시해도 된다 (삭제만 가능)
+REVIEW_DETAIL_CACHE_CONTROL = os.getenv("REVIEW_DETAIL_CACHE_CONTROL", "private, max-age=3600")
+# 목록/통계는 매번 ETag 로 재검증
+COLLECTION_CACHE_CONTROL = "private, no-cache"
+AUTH_VARY = "Authorization, Cookie"
+
 
 # ─────────────────────────────────────────
 #  공통 유틸
 # ─────────────────────────────────────────
 
-def normalize_code(code: str) -> str:
-    if not code:
-        return ""
-    code = code.replace("\r\n", "\n").replace("\r", "\n")
-    return "\n".join(line.strip() for line in code.split("\n") if line.strip())
-
-
-def make_code_fingerprint(code: str) -> str:
-    normalized = normalize_code(code)
-    return sha256(normalized.encode("utf-8")).hexdigest()
-
-
-def build_audit_value(audit_dt: datetime | None) -> str:
-    """UTC → KST 변환 후 ISO 문자열 반환"""
-    if not audit_dt:
-        audit_dt = datetime.now(timezone.utc)
-    kst = audit_dt.astimezone(timezone(timedelta(hours=9)))
-    return kst.isoformat().replace("+09:00", "")
-
-async def emit_review_event(event_type: str, payload: dict) -> None:
-    await ws_manager.broadcast({"type": event_type, "payload": payload})
-
-def parse_date_utc(date_str: str | None) -> datetime | None:
-    if not date_str:
-        return None
-    dt = datetime.strptime(date_str, "%Y-%m-%d")
-    return dt.replace(tzinfo=timezone.utc)
+def _review_etag(review_id: int, audit: datetime | None, variant: str) -> str:
+    """리뷰 상세용 strong ETag (review id + meta audit + 표현 방식)"""
+    return make_etag("review", review_id, audit.isoformat() if audit else "", variant)
+
+
+def _detail_meta_dict(doc: dict) -> dict:
+    """리뷰 상세 문서 → Meta 모양의 dict"""
+    return {
+        "github_id": doc["github_id"],
+        "review_id": doc["review_id"],
+        "version": doc["version"],
+        "actor": "server",
+        "language": doc["language"],
+        "trigger": doc["trigger"],
+        "code_fingerprint": doc["code_fingerprint"],
+        "model": doc["model"] or "unknown",
+        "result": {"result_ref": str(doc["review_id"]), "error_message": None},
+        "audit": build_audit_value(doc["audit"]),
+    }
+
+
+def _list_item_dict(row, include_code: bool) -> dict:
+    """목록 row 튜플 → ReviewListItem 모양의 dict"""
+    scores, comments = split_categories(row)
+    return {
+        "review_id": int(row.review_id),
+        "github_id": row.github_id,
+        "model": row.model or "unknown",
+        "trigger": row.trigger,
+        "language": row.language,
+        "quality_score": int(row.quality_score),
+        "summary": row.summary,
+        "scores_by_category": scores,
+        "comments": comments,
+        "audit": build_audit_value(row.audit),
+        "code": row.code if include_code else None,
+    }
 
 
 # ─────────────────────────────────────────
@@ -79,169 +116,34 @@ async def create_review_request(
     envelope: ReviewRequest,
     session: AsyncSession = Depends(get_session),
 ) -> ReviewRequestResponse:
-    meta = envelope.meta
-    body = envelope.body
-
-    if not body.snippet or not body.snippet.code:
-        raise HTTPException(status_code=400, detail="code snippet is empty")
-
-    github_id = getattr(meta, "github_id", None)
-    if not github_id:
-        raise HTTPException(status_code=400, detail="meta.github_id is required")
-
-    result = await session.execute(select(User).where(User.github_id == str(github_id)))
-    user = result.scalar_one_or_none()
-    if not user:
-        raise HTTPException(status_code=400, detail="user not found for given github_id")
-
-    user_id = int(user.id)
-    correlation_id = getattr(meta, "correlation_id", None)
-
-    raw_model = getattr(meta, "model", None)
-    model_id = "unknown"
-    if raw_model:
-        if isinstance(raw_model, dict):
-            model_id = raw_model.get("name") or "unknown"
-        else:
-            model_id = getattr(raw_model, "name", None) or str(raw_model)
-
-    language = getattr(meta, "language", "unknown")
-    trigger = getattr(meta, "trigger", "manual")
-
-    raw_analysis = getattr(meta, "analysis", None)
-    if isinstance(raw_analysis, dict):
-        aspects = raw_analysis.get("aspects") or []
-    else:
-        aspects = getattr(raw_analysis, "aspects", []) if raw_analysis else []
-    aspects = aspects or []
-
-    code_fingerprint = make_code_fingerprint(body.snippet.code)
-
-    await emit_review_event(
-        "review_request_received",
-        {
-            "correlation_id": correlation_id,
-            "github_id": str(github_id),
-            "user_id": user_id,
-            "language": language,
-            "model": model_id,
-            "trigger": trigger,
-            "aspects": aspects,
-            "code_fingerprint": code_fingerprint,
-        },
-    )
-
-    llm_req = LLMRequest(
-        code=body.snippet.code,
-        language=language,
-        model=model_id,
-        criteria=aspects,
-    )
-
-    await emit_review_event(
-        "llm_request_sent",
-        {
-            "correlation_id": correlation_id,
-            "github_id": str(github_id),
-            "user_id": user_id,
-            "model": model_id,
-            "language": language,
-        },
-    )
-
-    llm_res: LLMQualityResponse = await review_code(llm_req)
-
-    await emit_review_event(
-        "llm_response_received",
-        {
-            "correlation_id": correlation_id,
-            "github_id": str(github_id),
-            "user_id": user_id,
-            "model": model_id,
-            "language": language,
-            "quality_score": int(llm_res.quality_score),
-        },
-    )
-
-    raw_code_to_store = body.snippet.code if getattr(user, "store_code", False) else None
-
-    review: Review = await save_review_result(
-        session,
-        github_id=str(github_id),
-        model=model_id,
-        trigger=trigger,
-        language=language,
-        llm_result=llm_res,
-        code_fingerprint=code_fingerprint,
-        raw_code=raw_code_to_store,
-    )
-
-
-    meta_row = await session.get(ReviewMeta, review.meta_id)
-    if meta_row and not meta_row.github_id:
-        meta_row.github_id = str(github_id)
-        session.add(meta_row)
-
-    await emit_review_event(
-        "review_saved",
-        {
-            "correlation_id": correlation_id,
-            "github_id": str(github_id),
-            "review_id": int(review.id),
-            "user_id": user_id,
-        },
-    )
-    
-    await session.commit()
-
-    await emit_review_event(
-        "review_completed",
-        {
-            "correlation_id": correlation_id,
-            "github_id": str(github_id),
-            "review_id": int(review.id),
-            "user_id": user_id,
-            "language": language,
-            "model": model_id,
-            "trigger": trigger,
-            "quality_score": int(llm_res.quality_score),
-            "summary": llm_res.review_summary,
-            "scores_by_category": llm_res.scores_by_category.model_dump(),
-        },
-    )
-
-    now = datetime.now(timezone.utc)
-    audit_value = build_audit_value(now)
-
-    resp_meta = Meta(
-        github_id=str(github_id),
-        review_id=int(review.id),
-        version=getattr(meta, "version", "v1"),
-        actor="server",
-        language=language,
-        trigger=trigger,
-        code_fingerprint=code_fingerprint,
-        model=model_id,
-        result={"result_ref": str(review.id), "error_message": None},
-        audit=audit_value,
-    )
-
-    resp_body = ReviewRequestResponseBody(review_id=review.id)
-    return ReviewRequestResponse(meta=resp_meta, body=resp_body)
+    try:
+        return await run_review_request(session, envelope)
+    except ReviewRequestError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=exc.detail)
 
 
 @router.get("", response_model=ReviewListResponse)
 async def list_reviews(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
+    include: str | None = Query(None, description="추가로 포함할 필드 (예: code)"),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
 ):
+    include_code = "code" in parse_include(include)
+
+    version = await review_collection_version(session)
+    etag = make_etag("reviews", *version, include_code, fast, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
+
     stmt = (
-        select(Review)
+        select(*review_list_columns(include_code))
+        .select_from(Review)
         .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
-        .options(joinedload(Review.meta), joinedload(Review.categories))
         .order_by(ReviewMeta.audit.desc())
     )
-    result = await session.execute(stmt)
-    reviews: List[Review] = result.unique().scalars().all()
+    rows = (await session.execute(stmt)).all()
 
     now = datetime.now(timezone.utc)
     meta = Meta(
@@ -253,53 +155,22 @@ async def list_reviews(
         trigger="manual",
         code_fingerprint=None,
         model=None,
-        result={"result_ref": str(len(reviews)), "error_message": None},
+        result={"result_ref": str(len(rows)), "error_message": None},
         audit=build_audit_value(now),
     )
 
-    body: List[ReviewListItem] = []
-
-    for rec in reviews:
-        rec_meta: ReviewMeta | None = rec.meta
-        if not rec_meta:
-            continue
-
-        cat_map: Dict[str, ReviewCategoryResult] = {c.category: c for c in rec.categories}
-
-        def score(name: str) -> int:
-            c = cat_map.get(name)
-            return int(c.score) if c and c.score is not None else 0
-
-        def comment(name: str) -> str:
-            c = cat_map.get(name)
-            return c.comment or "" if c and c.comment is not None else ""
-
-        body.append(
-            ReviewListItem(
-                review_id=int(rec.id),
-                github_id=rec_meta.github_id,
-                model=rec_meta.model or "unknown",
-                trigger=rec_meta.trigger,
-                language=rec_meta.language,
-                quality_score=int(rec.quality_score),
-                summary=rec.summary,
-                scores_by_category=ScoresByCategory(
-                    bug=score("bug"),
-                    maintainability=score("maintainability"),
-                    style=score("style"),
-                    security=score("security"),
-                ),
-                comments={
-                    "bug": comment("bug"),
-                    "maintainability": comment("maintainability"),
-                    "style": comment("style"),
-                    "security": comment("security"),
-                },
-                audit=build_audit_value(rec_meta.audit),
-                code=rec.code,
-            )
-        )
+    if fast:
+        fast_response = FastJSONResponse({
+            "meta": meta.model_dump(mode="json"),
+            "body": [_list_item_dict(row, include_code) for row in rows],
+        })
+        return apply_cache_headers(fast_response, etag, COLLECTION_CACHE_CONTROL)
 
+    body: List[ReviewListItem] = [
+        ReviewListItem(**_list_item_dict(row, include_code)) for row in rows
+    ]
+
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
     return ReviewListResponse(meta=meta, body=body)
 
 # ─────────────────────────────────────────
@@ -308,23 +179,30 @@ async def list_reviews(
 
 @router.get("/me", response_model=dict)
 async def get_my_reviews(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
-    user_id: int = Depends(get_current_user_id_from_cookie),
+    user: CurrentUser = Depends(get_current_user),
+    include: str | None = Query(None, description="추가로 포함할 필드 (예: code)"),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
 ):
-    user = await session.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="user not found")
+
+    include_code = "code" in parse_include(include)
+
+    owned = review_owner_condition([user.id], [user.github_id])
+    version = await review_collection_version(session, owned)
+    etag = make_etag("reviews-me", user.id, *version, include_code, fast, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL, AUTH_VARY)
 
     stmt = (
-        select(Review)
+        select(*review_list_columns(include_code))
+        .select_from(Review)
         .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
-        .options(joinedload(Review.meta), joinedload(Review.categories))
-        .where(ReviewMeta.github_id == user.github_id)
+        .where(owned)
         .order_by(ReviewMeta.audit.desc())
-
     )
-    result = await session.execute(stmt)
-    reviews: List[Review] = result.unique().scalars().all()
+    rows = (await session.execute(stmt)).all()
 
     now = datetime.now(timezone.utc)
     meta = Meta(
@@ -336,52 +214,22 @@ async def get_my_reviews(
         trigger="manual",
         code_fingerprint=None,
         model=None,
-        result={"result_ref": str(len(reviews)), "error_message": None},
+        result={"result_ref": str(len(rows)), "error_message": None},
         audit=build_audit_value(now),
     )
 
     body: List[dict] = []
-    for rec in reviews:
-        rec_meta: ReviewMeta | None = rec.meta
-        if not rec_meta:
-            continue
-
-        cat_map: Dict[str, ReviewCategoryResult] = {c.category: c for c in rec.categories}
-
-        def score(name: str) -> int:
-            c = cat_map.get(name)
-            return int(c.score) if c and c.score is not None else 0
-
-        def comment(name: str) -> str:
-            c = cat_map.get(name)
-            return c.comment or "" if c and c.comment is not None else ""
-
-        body.append(
-            {
-                "review_id": rec.id,
-                "user_id": user.id,
-                "model": rec_meta.model or "unknown",
-                "trigger": rec_meta.trigger,
-                "language": rec_meta.language,
-                "quality_score": rec.quality_score,
-                "summary": rec.summary,
-                "scores_by_category": {
-                    "bug": score("bug"),
-                    "maintainability": score("maintainability"),
-                    "style": score("style"),
-                    "security": score("security"),
-                },
-                "comments": {
-                    "bug": comment("bug"),
-                    "maintainability": comment("maintainability"),
-                    "style": comment("style"),
-                    "security": comment("security"),
-                },
-                "audit": build_audit_value(rec_meta.audit),
-                "code": rec.code,
-            }
-        )
+    for row in rows:
+        item = _list_item_dict(row, include_code)
+        item["user_id"] = user.id
+        item["quality_score"] = row.quality_score
+        body.append(item)
+
+    if fast:
+        fast_response = FastJSONResponse({"meta": meta.model_dump(mode="json"), "body": body})
+        return apply_cache_headers(fast_response, etag, COLLECTION_CACHE_CONTROL, AUTH_VARY)
 
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL, AUTH_VARY)
     return {"meta": meta.model_dump(), "body": body}
 
 # ─────────────────────────────────────────
@@ -391,234 +239,280 @@ async def get_my_reviews(
 @router.get("/{review_id}", response_model=ReviewDetailResponse)
 async def get_review_raw(
     review_id: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
+    include: str | None = Query(None, description="추가로 포함할 필드 (예: code)"),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
 ):
-    stmt = (
-        select(Review)
-        .options(joinedload(Review.meta), joinedload(Review.categories))
-        .where(Review.id == review_id)
-    )
-    result = await session.execute(stmt)
-    review: Review | None = result.unique().scalar_one_or_none()
-    if not review:
+    include_code = "code" in parse_include(include)
+    doc = await load_review_detail(session, review_id)
+    if not doc:
         raise HTTPException(status_code=404, detail="review not found")
 
-    meta_db: ReviewMeta | None = review.meta
-    if not meta_db:
-        raise HTTPException(status_code=500, detail="meta not found for review")
+    variant = ("fast" if fast else "std") + ("+code" if include_code else "")
+    etag = _review_etag(doc["review_id"], doc["audit"], variant)
+    if etag_matches(request, etag):
+        return not_modified(etag, REVIEW_DETAIL_CACHE_CONTROL)
 
-    cat_map: Dict[str, ReviewCategoryResult] = {c.category: c for c in review.categories}
+    body = {
+        "quality_score": int(doc["quality_score"]),
+        "summary": doc["summary"],
+        "scores_by_category": doc["scores_by_category"],
+        "comments": doc["comments"],
+        "code": doc["code"] if include_code else None,
+    }
+    meta = _detail_meta_dict(doc)
 
-    def score(name: str) -> int:
-        c = cat_map.get(name)
-        return int(c.score) if c and c.score is not None else 0
+    if fast:
+        fast_response = FastJSONResponse({"meta": meta, "body": body})
+        return apply_cache_headers(fast_response, etag, REVIEW_DETAIL_CACHE_CONTROL)
 
-    def comment(name: str) -> str:
-        c = cat_map.get(name)
-        return c.comment or "" if c and c.comment is not None else ""
+    apply_cache_headers(response, etag, REVIEW_DETAIL_CACHE_CONTROL)
+    return ReviewDetailResponse(meta=Meta(**meta), body=ReviewResultBody(**body))
 
-    body = ReviewResultBody(
-        quality_score=int(review.quality_score),
-        summary=review.summary,
-        scores_by_category=ScoresByCategory(
-            bug=score("bug"),
-            maintainability=score("maintainability"),
-            style=score("style"),
-            security=score("security"),
-        ),
-        comments={
-            "bug": comment("bug"),
-            "maintainability": comment("maintainability"),
-            "style": comment("style"),
-            "security": comment("security"),
-        },
-        code=review.code,
-    )
 
-    resp_meta = Meta(
-        github_id=meta_db.github_id,
-        review_id=review.id,
-        version=meta_db.version,
-        actor="server",
-        language=meta_db.language,
-        trigger=meta_db.trigger,
-        code_fingerprint=meta_db.code_fingerprint,
-        model=meta_db.model or "unknown",
-        result={"result_ref": str(review.id), "error_message": None},
-        audit=build_audit_value(meta_db.audit),
-    )
+# ─────────────────────────────────────────
+#  GET /v1/reviews/{review_id}/code
+# ─────────────────────────────────────────
 
-    return ReviewDetailResponse(meta=resp_meta, body=body)
+@router.get("/{review_id}/code", response_model=ReviewCodeResponse)
+async def get_review_code(
+    review_id: int,
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+):
+    doc = await load_review_detail(session, review_id)
+    if not doc:
+        raise HTTPException(status_code=404, detail="review not found")
+
+    etag = _review_etag(doc["review_id"], doc["audit"], "code")
+    if etag_matches(request, etag):
+        return not_modified(etag, REVIEW_DETAIL_CACHE_CONTROL)
+
+    apply_cache_headers(response, etag, REVIEW_DETAIL_CACHE_CONTROL)
+    return ReviewCodeResponse(
+        meta=Meta(**_detail_meta_dict(doc)),
+        body=ReviewCodeBody(review_id=doc["review_id"], code=doc["code"]),
+    )
 
 
+# ─────────────────────────────────────────
+#  GET /v1/reviews/stats/by-model, /stats/by-user, /stats/timeseries
+#  (롤업 기반, 통계 캐시 사용)
+# ─────────────────────────────────────────
 
 @router.get("/stats/by-model", response_model=ModelStatsResponse)
 async def get_stats_by_model(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     from_: str | None = Query(None, alias="from"),
     to: str | None = Query(None, alias="to"),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
 ) -> ModelStatsResponse:
-    from_dt = parse_date_utc(from_)
-    to_dt = parse_date_utc(to)
-
-    if to_dt:
-        to_dt = to_dt + timedelta(days=1)
-
-    conditions = []
-    if from_dt:
-        conditions.append(ReviewMeta.audit >= from_dt)
-    if to_dt:
-        conditions.append(ReviewMeta.audit < to_dt)
-
-    stmt = (
-        select(
-            ReviewMeta.model.label("model"),
-            func.count(func.distinct(Review.id)).label("review_count"),
-            func.avg(Review.quality_score).label("avg_total"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "bug", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_bug"),
-            func.avg(
-                case(
-                    (
-                        ReviewCategoryResult.category == "maintainability",
-                        ReviewCategoryResult.score,
-                    ),
-                    else_=None,
-                )
-            ).label("avg_maintainability"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "style", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_style"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "security", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_security"),
-        )
-        .select_from(ReviewMeta)
-        .outerjoin(Review, Review.meta_id == ReviewMeta.id)
-        .outerjoin(ReviewCategoryResult, ReviewCategoryResult.review_id == Review.id)
-        .group_by(ReviewMeta.model)
-        .order_by(ReviewMeta.model)
-    )
-
-    if conditions:
-        stmt = stmt.where(and_(*conditions))
+    version, cache_key, items = await model_stats(session, parse_date_utc(from_), parse_date_utc(to))
+    etag = make_etag("stats-by-model", *version, *cache_key, fast, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
 
-    result = await session.execute(stmt)
-    rows = result.all()
+    if fast:
+        return apply_cache_headers(FastJSONResponse({"data": items}), etag, COLLECTION_CACHE_CONTROL)
 
-    items: list[ModelStatsItem] = []
-    for row in rows:
-        items.append(
-            ModelStatsItem(
-                model=row.model,
-                review_count=int(row.review_count or 0),
-                avg_total=float(row.avg_total) if row.avg_total is not None else None,
-                avg_bug=float(row.avg_bug) if row.avg_bug is not None else None,
-                avg_maintainability=float(row.avg_maintainability)
-                if row.avg_maintainability is not None
-                else None,
-                avg_style=float(row.avg_style) if row.avg_style is not None else None,
-                avg_security=float(row.avg_security) if row.avg_security is not None else None,
-            )
-        )
-
-    return ModelStatsResponse(data=items)
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
+    return ModelStatsResponse(data=[ModelStatsItem(**item) for item in items])
 
 @router.get("/stats/by-user", response_model=UserStatsResponse)
 async def get_stats_by_user(
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session),
     from_: str | None = Query(None, alias="from"),
     to: str | None = Query(None, alias="to"),
     model: str | None = Query(None),
     limit: int | None = Query(None, ge=1),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
 ) -> UserStatsResponse:
-    from_dt = parse_date_utc(from_)
-    to_dt = parse_date_utc(to)
-    if to_dt:
-        to_dt = to_dt + timedelta(days=1)
-
-    conditions = []
-    if from_dt:
-        conditions.append(ReviewMeta.audit >= from_dt)
-    if to_dt:
-        conditions.append(ReviewMeta.audit < to_dt)
-    if model:
-        conditions.append(ReviewMeta.model == model)
+    version, cache_key, items = await user_stats(
+        session, parse_date_utc(from_), parse_date_utc(to), model, limit
+    )
+    etag = make_etag("stats-by-user", *version, *cache_key, fast, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
 
-    stmt = (
-        select(
-            User.id.label("user_id"),
-            User.github_id.label("github_id"),
-            func.count(func.distinct(Review.id)).label("review_count"),
-            func.avg(Review.quality_score).label("avg_total"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "bug", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_bug"),
-            func.avg(
-                case(
-                    (
-                        ReviewCategoryResult.category == "maintainability",
-                        ReviewCategoryResult.score,
-                    ),
-                    else_=None,
-                )
-            ).label("avg_maintainability"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "style", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_style"),
-            func.avg(
-                case(
-                    (ReviewCategoryResult.category == "security", ReviewCategoryResult.score),
-                    else_=None,
-                )
-            ).label("avg_security"),
-        )
-        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
-        .join(User, User.github_id == ReviewMeta.github_id) 
-        .join(ReviewCategoryResult, ReviewCategoryResult.review_id == Review.id)
-        .group_by(User.id, User.github_id)
-        .order_by(desc(func.avg(Review.quality_score)))  
+    if fast:
+        return apply_cache_headers(FastJSONResponse({"data": items}), etag, COLLECTION_CACHE_CONTROL)
+
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
+    return UserStatsResponse(data=[UserStatsItem(**item) for item in items])
+
+@router.get("/stats/timeseries", response_model=TimeseriesResponse)
+async def get_stats_timeseries(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    bucket: str = Query("day", pattern="^(hour|day|week)$"),
+    group_by: str | None = Query(None, pattern="^(model|language|trigger|user)$"),
+    from_: str | None = Query(None, alias="from"),
+    to: str | None = Query(None, alias="to"),
+    model: str | None = Query(None),
+    fast: bool = Query(False, description="검증 없이 row 에서 바로 JSON 직렬화"),
+) -> TimeseriesResponse:
+    """
+    hour / day / week 버킷별 리뷰 수와 평균 점수 (UTC 기준).
+    차트용으로 기간 전체를 한 번의 GROUP BY 로 돌려준다.
+    """
+    from_dt, to_dt = parse_date_utc(from_), parse_date_utc(to)
+    model = (model or "").strip() or None
+    cache_key = stats_cache_key("timeseries", from_dt, to_dt, bucket, group_by, model)
+
+    version, items = await cached_stats(
+        session,
+        cache_key,
+        lambda: load_timeseries(
+            session,
+            bucket=bucket,
+            group_by=group_by,
+            from_dt=from_dt,
+            to_dt=to_dt,
+            model=model,
+        ),
+    )
+    etag = make_etag("stats-timeseries", *version, *cache_key, fast, weak=True)
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
+
+    if fast:
+        data = [
+            {**item, "bucket_start": item["bucket_start"].isoformat().replace("+00:00", "Z")}
+            for item in items
+        ]
+        content = {"bucket": bucket, "group_by": group_by, "data": data}
+        return apply_cache_headers(FastJSONResponse(content), etag, COLLECTION_CACHE_CONTROL)
+
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
+    return TimeseriesResponse(
+        bucket=bucket,
+        group_by=group_by,
+        data=[TimeseriesItem(**item) for item in items],
     )
 
-    if conditions:
-        stmt = stmt.where(and_(*conditions))
-    if limit:
-        stmt = stmt.limit(limit)
 
-    result = await session.execute(stmt)
-    rows = result.all()
+# ─────────────────────────────────────────
+#  GET /v1/reviews/stats/percentiles, /stats/histogram
+#  (인메모리 점수 스냅샷에서 벡터 연산)
+# ─────────────────────────────────────────
 
-    items: list[UserStatsItem] = []
-    for row in rows:
-        items.append(
-            UserStatsItem(
-                user_id=int(row.user_id),
-                github_id=row.github_id,
-                review_count=int(row.review_count or 0),
-                avg_total=float(row.avg_total) if row.avg_total is not None else None,
-                avg_bug=float(row.avg_bug) if row.avg_bug is not None else None,
-                avg_maintainability=float(row.avg_maintainability)
-                if row.avg_maintainability is not None
-                else None,
-                avg_style=float(row.avg_style) if row.avg_style is not None else None,
-                avg_security=float(row.avg_security) if row.avg_security is not None else None,
-            )
-        )
-
-    return UserStatsResponse(data=items)
+# group_by 파라미터 → 스냅샷 컬럼
+SNAPSHOT_GROUP_FIELDS = {
+    "model": "model",
+    "user": "github_id",
+    "language": "language",
+    "trigger": "trigger",
+}
+
+
+def _parse_quantiles(q: str) -> list[float]:
+    try:
+        quantiles = [float(part) for part in q.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="q must be comma separated numbers")
+    if not quantiles or any(not 0 <= value <= 100 for value in quantiles):
+        raise HTTPException(status_code=400, detail="q must be between 0 and 100")
+    return quantiles
+
+
+async def _synced_snapshot(session: AsyncSession, version: tuple[int, int]):
+    """version: ETag 에 쓴 rollup_version (스냅샷 동기화에 그대로 쓴다)"""
+    if not score_analytics.available():
+        raise HTTPException(status_code=503, detail="score analytics requires numpy")
+    await score_snapshot.sync(session, version)
+    return score_snapshot
+
+
+@router.get("/stats/percentiles", response_model=PercentileResponse)
+async def get_stats_percentiles(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    group_by: str | None = Query(None, pattern="^(model|language|trigger|user)$"),
+    q: str = Query("50,90", description="백분위 목록 (0~100, 콤마 구분)"),
+    from_: str | None = Query(None, alias="from"),
+    to: str | None = Query(None, alias="to"),
+    model: str | None = Query(None),
+    github_id: str | None = Query(None),
+) -> PercentileResponse:
+    """그룹별 quality / 카테고리 점수의 count, 평균, 백분위"""
+    quantiles = _parse_quantiles(q)
+
+    version = await rollup_version(session)
+    etag = make_etag(
+        "stats-percentiles", *version, group_by, q, from_, to, model, github_id, weak=True
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
+
+    snapshot = await _synced_snapshot(session, version)
+    items = snapshot.percentiles(
+        group_by=SNAPSHOT_GROUP_FIELDS.get(group_by),
+        quantiles=quantiles,
+        from_dt=parse_date_utc(from_),
+        to_dt=parse_date_utc(to),
+        filters={"model": model, "github_id": github_id},
+    )
+
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
+    return PercentileResponse(group_by=group_by, data=[PercentileItem(**item) for item in items])
+
+
+@router.get("/stats/histogram", response_model=HistogramResponse)
+async def get_stats_histogram(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    metric: str = Query("total", pattern="^(total|bug|maintainability|style|security)$"),
+    bins: int = Query(10, ge=1, le=200),
+    min_: float | None = Query(None, alias="min"),
+    max_: float | None = Query(None, alias="max"),
+    group_by: str | None = Query(None, pattern="^(model|language|trigger|user)$"),
+    from_: str | None = Query(None, alias="from"),
+    to: str | None = Query(None, alias="to"),
+    model: str | None = Query(None),
+    github_id: str | None = Query(None),
+) -> HistogramResponse:
+    """
+    점수 히스토그램. 구간 경계는 모든 그룹이 공유한다.
+    min / max 를 주지 않으면 필터된 값의 최소 ~ 최대.
+    """
+    if (min_ is None) != (max_ is None):
+        raise HTTPException(status_code=400, detail="min and max must be given together")
+    if min_ is not None and min_ >= max_:
+        raise HTTPException(status_code=400, detail="min must be less than max")
+
+    version = await rollup_version(session)
+    etag = make_etag(
+        "stats-histogram", *version, metric, bins, min_, max_,
+        group_by, from_, to, model, github_id, weak=True,
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag, COLLECTION_CACHE_CONTROL)
+
+    snapshot = await _synced_snapshot(session, version)
+    result = snapshot.histogram(
+        metric=metric,
+        group_by=SNAPSHOT_GROUP_FIELDS.get(group_by),
+        bins=bins,
+        value_range=(min_, max_) if min_ is not None else None,
+        from_dt=parse_date_utc(from_),
+        to_dt=parse_date_utc(to),
+        filters={"model": model, "github_id": github_id},
+    )
+
+    apply_cache_headers(response, etag, COLLECTION_CACHE_CONTROL)
+    return HistogramResponse(
+        metric=metric,
+        group_by=group_by,
+        edges=result["edges"],
+        data=[HistogramItem(**item) for item in result["data"]],
+    )
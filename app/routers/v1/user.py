@@ -5,7 +5,8 @@ from sqlalchemy import select
 from app.utils.database import get_session
 from app.models.user import User
 from app.schemas.user import UserCreate, UserOut, UserStoreCodeUpdate
-from app.routers.auth import get_current_user_id_from_cookie
+from app.routers.auth import get_current_user, get_current_user_id_from_cookie
+from app.services.principal import CurrentUser, principal_cache
 
 router = APIRouter(prefix="/v1/users", tags=["user"])
 
@@ -29,13 +30,7 @@ async def list_users(session: AsyncSession = Depends(get_session)):
     return rows
 
 @router.get("/me", response_model=UserOut)
-async def get_me(
-    session: AsyncSession = Depends(get_session),
-    user_id: int = Depends(get_current_user_id_from_cookie),
-):
-    user = await session.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="user not found")
+async def get_me(user: CurrentUser = Depends(get_current_user)):
     return user
 
 @router.patch("/me/store-code", response_model=UserOut)
@@ -52,5 +47,6 @@ async def update_my_store_code(
 
     session.add(user)
     await session.commit()
+    principal_cache.invalidate_users([user_id])
     await session.refresh(user)
     return user
\ No newline at end of file
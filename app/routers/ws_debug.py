@@ -1,44 +1,734 @@
 # app/routers/ws_debug.py
-from typing import List
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from uuid import uuid4
+import asyncio
 import json
+import os
+import time
+import zlib
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from sqlalchemy import select
+
+from app.models.review import Review, ReviewMeta
+from app.services.principal import CurrentUser, principal_cache
+from app.services.event_bus import event_bus
+from app.services.review_service import review_owner_condition
+from app.utils.database import AsyncSessionLocal
+
+try:
+    import msgpack
+except ImportError:  # msgpack 이 없으면 json 인코딩만 지원
+    msgpack = None
 
 router = APIRouter(tags=["ws-debug"])
 
+# 연결별 송신 큐 크기 / 큐가 꽉 찼을 때 정책 ("drop_oldest" | "disconnect")
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "256"))
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")
+
+# 느린 클라이언트를 끊을 때 close code (1013: Try Again Later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# 연결이 살아 있는지는 WebSocket 프로토콜 ping / pong 으로 본다 (uvicorn --ws-ping-interval /
+# --ws-ping-timeout, 기본 20초). 아래 앱 레벨 heartbeat 는 ?heartbeat=1 로 붙은 클라이언트에만 한다:
+# WS_PING_INTERVAL 마다 {"type": "ping"} 을 보내고, WS_IDLE_TIMEOUT 동안 아무 메시지 (pong 포함) 도
+# 없으면 끊는다 (초). 듣기만 하는 기존 클라이언트는 영향이 없다.
+WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "20"))
+WS_PING_TIMEOUT = float(os.getenv("WS_PING_TIMEOUT", "20"))
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "60"))
+
+# 동시 연결 수 제한 (전체 / 유저별, 0 이면 제한 없음). 익명 연결은 프록시 뒤에서 IP 가 다 같으므로
+# IP 별로 나누지 않고 익명 전체를 WS_MAX_ANONYMOUS_CONNECTIONS 로 묶는다
+# (익명 연결만으로 전체 한도를 채워 로그인 유저가 못 붙는 일이 없도록).
+WS_MAX_CONNECTIONS = int(os.getenv("WS_MAX_CONNECTIONS", "1000"))
+WS_MAX_CONNECTIONS_PER_USER = int(os.getenv("WS_MAX_CONNECTIONS_PER_USER", "5"))
+WS_MAX_ANONYMOUS_CONNECTIONS = int(os.getenv("WS_MAX_ANONYMOUS_CONNECTIONS", "200"))
+
+# idle 로 끊을 때 (1001: Going Away), 연결 수 초과로 거절할 때 (1013: Try Again Later)
+IDLE_CLOSE_CODE = 1001
+LIMIT_CLOSE_CODE = 1013
+
+# 재연결 시 놓친 이벤트를 돌려주기 위한 토픽별 링버퍼 크기 / 보관할 토픽 수
+WS_REPLAY_BUFFER_SIZE = int(os.getenv("WS_REPLAY_BUFFER_SIZE", "100"))
+WS_REPLAY_MAX_TOPICS = int(os.getenv("WS_REPLAY_MAX_TOPICS", "10000"))
+
+# 프레임 인코딩. ?encoding=json (기본, 텍스트 프레임) | msgpack (바이너리 프레임)
+# ?compress=deflate 면 인코딩한 바이트를 zlib 으로 압축해 바이너리 프레임으로 보낸다.
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+COMPRESS_DEFLATE = "deflate"
+WS_DEFLATE_LEVEL = int(os.getenv("WS_DEFLATE_LEVEL", "6"))
+
+# 모든 이벤트를 받는 관리자용 토픽. 관리자 역할이 따로 없으므로
+# WS_ALL_TOPIC_GITHUB_IDS (쉼표 구분 github_id 목록) 에 있는 유저만 구독할 수 있다.
+TOPIC_ALL = "all"
+WS_ALL_TOPIC_GITHUB_IDS = frozenset(
+    github_id.strip() for github_id in os.getenv("WS_ALL_TOPIC_GITHUB_IDS", "").split(",") if github_id.strip()
+)
+
+# 유저별 토픽 (user:<github_id>). 본인 토픽만 구독할 수 있다.
+USER_TOPIC_PREFIX = "user:"
+
+# 리뷰 / 요청별 토픽. id 를 추측할 수 있으므로 로그인한 유저만 구독할 수 있고,
+# 이벤트 payload 의 github_id 가 본인인 이벤트만 받는다 (review:<id> 는 구독할 때 소유자도 확인).
+REVIEW_TOPIC_PREFIX = "review:"
+CORRELATION_TOPIC_PREFIX = "correlation:"
+OWNER_TOPIC_PREFIXES = (REVIEW_TOPIC_PREFIX, CORRELATION_TOPIC_PREFIX)
+
+
+def parse_topics(raw: Optional[str]) -> List[str]:
+    """"user:42, review:7" → ["user:42", "review:7"]"""
+    if not raw:
+        return []
+    return [topic.strip() for topic in raw.split(",") if topic.strip()]
+
+
+def is_owner_topic(topic: str) -> bool:
+    """review:<id> / correlation:<id> (이벤트 소유자에게만 전달하는 토픽)"""
+    return topic.startswith(OWNER_TOPIC_PREFIXES)
+
+
+def event_owner(message: Dict[str, Any]) -> Optional[str]:
+    """이벤트 payload 의 github_id (owner 토픽 전달 대상 확인용)"""
+    payload = message.get("payload")
+    if isinstance(payload, dict) and payload.get("github_id"):
+        return str(payload["github_id"])
+    return None
+
+
+def can_subscribe(topic: str, user: Optional[CurrentUser]) -> bool:
+    """
+    user:<github_id> 는 본인만, "all" 은 WS_ALL_TOPIC_GITHUB_IDS 에 있는 유저만,
+    review: / correlation: 은 로그인한 유저만 (소유자 확인은 authorize_topics / 전달할 때). 나머지 토픽은 누구나
+    """
+    if topic == TOPIC_ALL:
+        return user is not None and user.github_id in WS_ALL_TOPIC_GITHUB_IDS
+    if topic.startswith(USER_TOPIC_PREFIX):
+        return user is not None and topic[len(USER_TOPIC_PREFIX):] == user.github_id
+    if is_owner_topic(topic):
+        return user is not None
+    return True
+
+
+async def owned_review_ids(user: CurrentUser, review_ids: Iterable[int]) -> Set[int]:
+    """review_ids 중 user 의 리뷰 (user_id 가 비어 있는 예전 행은 github_id 로)"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(Review.id)
+            .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+            .where(Review.id.in_(list(review_ids)), review_owner_condition([user.id], [user.github_id]))
+        )
+        return set(result.scalars().all())
+
+
+async def authorize_topics(topics: Iterable[str], user: Optional[CurrentUser]) -> Tuple[List[str], List[str]]:
+    """요청한 토픽 → (구독할 토픽, 거절한 토픽). review:<id> 는 본인 리뷰만"""
+    allowed: List[str] = []
+    denied: List[str] = []
+    review_ids: Dict[str, int] = {}
+    for topic in topics:
+        if not can_subscribe(topic, user):
+            denied.append(topic)
+        elif topic.startswith(REVIEW_TOPIC_PREFIX):
+            try:
+                review_ids[topic] = int(topic[len(REVIEW_TOPIC_PREFIX):])
+            except ValueError:
+                denied.append(topic)
+        else:
+            allowed.append(topic)
+
+    if review_ids:
+        owned = await owned_review_ids(user, review_ids.values())
+        for topic, review_id in review_ids.items():
+            (allowed if review_id in owned else denied).append(topic)
+    return allowed, denied
+
+
+def default_topics(user: Optional[CurrentUser]) -> List[str]:
+    """토픽을 지정하지 않고 붙었을 때: 허용된 유저면 "all", 아니면 본인 토픽, 익명이면 없음"""
+    if user is None:
+        return []
+    if can_subscribe(TOPIC_ALL, user):
+        return [TOPIC_ALL]
+    return [f"{USER_TOPIC_PREFIX}{user.github_id}"]
+
+
+def negotiate_format(encoding: Optional[str], compress: Optional[str]) -> str:
+    """
+    쿼리 파라미터 → 연결의 프레임 포맷 ("json", "msgpack", "json+deflate", "msgpack+deflate").
+    msgpack 이 설치되지 않았으면 json 으로 내린다 (subscribed 응답의 format 으로 알 수 있다).
+    """
+    fmt = ENCODING_MSGPACK if encoding == ENCODING_MSGPACK and msgpack is not None else ENCODING_JSON
+    if compress == COMPRESS_DEFLATE:
+        fmt += "+" + COMPRESS_DEFLATE
+    return fmt
+
+
+class _Frame:
+    """
+    보낼 메시지 하나. 포맷별 인코딩 결과를 캐시해서, 같은 이벤트를 몇 개의 연결에 보내든
+    포맷마다 한 번만 직렬화 / 압축한다. replay 버퍼에도 이 객체를 그대로 넣는다.
+    """
+
+    __slots__ = ("message", "owner", "_encoded")
+
+    # 실제로 인코딩한 횟수 (포맷별). 연결 수가 아니라 이벤트 수에 비례해야 한다.
+    encode_count: Dict[str, int] = {}
+
+    def __init__(self, message: Dict[str, Any]):
+        self.message = message
+        self.owner = event_owner(message)
+        self._encoded: Dict[str, Union[str, bytes]] = {}
+
+    def encode(self, fmt: str) -> Union[str, bytes]:
+        data = self._encoded.get(fmt)
+        if data is not None:
+            return data
+
+        encoding, _, compress = fmt.partition("+")
+        if compress:
+            raw = self.encode(encoding)
+            data = zlib.compress(raw.encode("utf-8") if isinstance(raw, str) else raw, WS_DEFLATE_LEVEL)
+        elif encoding == ENCODING_MSGPACK:
+            data = msgpack.packb(self.message, default=str, use_bin_type=True)
+        else:
+            data = json.dumps(self.message, ensure_ascii=False, separators=(",", ":"), default=str)
+
+        self._encoded[fmt] = data
+        _Frame.encode_count[fmt] = _Frame.encode_count.get(fmt, 0) + 1
+        return data
+
+
+class _CloseFrame(_Frame):
+    """큐에 넣어 두면 writer 가 앞선 메시지를 다 보낸 뒤 연결을 닫는다"""
+
+    __slots__ = ("code", "reason")
+
+    def __init__(self, code: int, reason: str = ""):
+        super().__init__({})
+        self.code = code
+        self.reason = reason
+
+
+class _ReplayBuffer:
+    """
+    토픽별 최근 이벤트 (seq, 프레임) 링버퍼.
+    버퍼에서 밀려난 가장 큰 seq 를 기억해서, 그 이전부터 이어 받으려는 클라이언트는
+    replay 대신 전체 새로고침이 필요하다고 판단한다.
+    """
+
+    def __init__(self, size: int, max_topics: int):
+        self.size = max(1, size)
+        self.max_topics = max(1, max_topics)
+        self._buffers: "OrderedDict[str, Deque[Tuple[int, _Frame]]]" = OrderedDict()
+        # 토픽별로 버퍼에서 밀려난 마지막 seq
+        self._evicted: Dict[str, int] = {}
+        # 토픽 자체가 밀려났을 때의 마지막 seq (그 토픽은 이 seq 이전으로 replay 불가)
+        self._floor = 0
+
+    def append(self, topics: Iterable[str], seq: int, frame: _Frame):
+        for topic in topics:
+            buf = self._buffers.get(topic)
+            if buf is None:
+                buf = self._buffers[topic] = deque(maxlen=self.size)
+            else:
+                self._buffers.move_to_end(topic)
+            if len(buf) == buf.maxlen:
+                self._evicted[topic] = buf[0][0]
+            buf.append((seq, frame))
+
+        while len(self._buffers) > self.max_topics:
+            topic, buf = self._buffers.popitem(last=False)
+            self._evicted.pop(topic, None)
+            self._floor = max(self._floor, buf[-1][0])
+
+    def since(self, topics: Iterable[str], last_seq: int, github_id: Optional[str] = None) -> Optional[List[_Frame]]:
+        """
+        last_seq 이후 이벤트 (seq 순, 중복 제거). 이어 받을 수 없으면 None.
+        owner 토픽에서는 github_id 가 소유자인 이벤트만 돌려준다.
+        """
+        found: Dict[int, _Frame] = {}
+        for topic in topics:
+            buf = self._buffers.get(topic)
+            if buf is None:
+                if last_seq < self._floor:
+                    return None
+                continue
+            if self._evicted.get(topic, 0) > last_seq:
+                return None
+            owner_only = is_owner_topic(topic)
+            for seq, frame in reversed(buf):
+                if seq <= last_seq:
+                    break
+                if owner_only and (github_id is None or frame.owner != github_id):
+                    continue
+                found[seq] = frame
+        return [found[seq] for seq in sorted(found)]
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+
+def websocket_user_id(websocket: WebSocket) -> Optional[int]:
+    """Bearer / access_token 쿠키 / ?token= 의 JWT → user id (없거나 유효하지 않으면 None)"""
+    auth = websocket.headers.get("authorization", "")
+    token = auth.split(" ", 1)[1] if auth.startswith("Bearer ") else None
+    token = token or websocket.cookies.get("access_token") or websocket.query_params.get("token")
+    if not token:
+        return None
+    return principal_cache.user_id_for_token(token)
+
+
+async def websocket_principal(websocket: WebSocket) -> Optional[CurrentUser]:
+    """websocket_user_id → 유저 스냅샷 (유저 캐시를 거친다)"""
+    user_id = websocket_user_id(websocket)
+    if user_id is None:
+        return None
+    async with AsyncSessionLocal() as session:
+        return await principal_cache.get_user(session, user_id=user_id)
+
+
+ANONYMOUS_OWNER = "anonymous"
+
+
+def connection_owner(websocket: WebSocket, user_id: Optional[int] = None) -> str:
+    """연결 수 제한에 쓰는 키. 인증된 연결이면 user:<id>, 아니면 ANONYMOUS_OWNER (익명 전체 한도)"""
+    if user_id is None:
+        user_id = websocket_user_id(websocket)
+    if user_id is not None:
+        return f"user:{user_id}"
+    return ANONYMOUS_OWNER
+
+
+def wants_heartbeat(params) -> bool:
+    """?heartbeat=1 이면 앱 레벨 ping / idle 정리를 받겠다는 뜻 (pong 을 보내는 클라이언트)"""
+    return params.get("heartbeat") in ("1", "true")
+
+
+class _Connection:
+    """소켓 하나 + 송신 큐 + 큐를 비우는 writer task"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int,
+        owner: str = "",
+        fmt: str = ENCODING_JSON,
+        heartbeat: bool = False,
+        github_id: Optional[str] = None,
+    ):
+        self.websocket = websocket
+        self.owner = owner
+        self.github_id = github_id
+        self.format = fmt
+        self.heartbeat = heartbeat
+        self.last_seen = time.monotonic()
+        self.queue: asyncio.Queue[_Frame] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task | None = None
+        self.dropped = 0
+        self.topics: Set[str] = set()
+
 
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    """
+    broadcast 는 각 연결의 큐에 넣기만 하고 바로 돌아온다 (소켓 I/O 를 기다리지 않음).
+    실제 전송은 연결마다 writer task 가 한다. 큐가 꽉 찬 느린 클라이언트는
+    WS_SLOW_CONSUMER_POLICY 에 따라 가장 오래된 메시지를 버리거나 연결을 끊는다.
+
+    연결은 토픽별로 인덱싱된다. 이벤트는 그 토픽을 구독한 연결과 "all" 구독자에게만 간다.
+    review: / correlation: 토픽은 이벤트 소유자 (payload 의 github_id) 인 연결에만 간다 (replay 도 같다).
+
+    토픽이 있는 이벤트에는 (epoch, seq) 를 붙이고 토픽별 링버퍼에 남긴다. 재연결한 클라이언트가
+    마지막으로 받은 epoch / seq 를 보내면 놓친 이벤트만 다시 보낸다. epoch 는 프로세스마다
+    다르므로 다른 워커에 붙었거나 버퍼가 한 바퀴 돌았으면 resync_required 를 보낸다.
+
+    메시지는 _Frame 으로 큐에 넣고 writer 가 연결의 포맷으로 꺼내 보낸다. 인코딩 결과는
+    프레임에 캐시되므로 fan-out 비용은 (이벤트 수 × 포맷 수) 만큼의 직렬화다.
+    uvicorn 의 permessage-deflate 는 연결마다 따로 압축하므로, 구독자가 많으면
+    ?compress=deflate (이벤트당 한 번 압축) 를 쓰는 편이 CPU 가 덜 든다.
+
+    heartbeat 를 협상한 연결에는 heartbeat task 가 WS_PING_INTERVAL 마다 ping 을 보내고,
+    WS_IDLE_TIMEOUT 동안 아무것도 받지 못한 연결을 정리한다. 나머지 연결의 생존 확인은
+    프로토콜 ping / pong (uvicorn) 에 맡긴다. 연결 수는 전체 / 유저별 / 익명 전체로 제한하고,
+    자리는 accept 를 기다리기 전에 잡는다 (동시에 붙는 연결이 같은 빈자리를 보지 않도록).
+    """
+
+    def __init__(
+        self,
+        queue_size: int = WS_SEND_QUEUE_SIZE,
+        policy: str = WS_SLOW_CONSUMER_POLICY,
+        max_connections: int = WS_MAX_CONNECTIONS,
+        max_per_owner: int = WS_MAX_CONNECTIONS_PER_USER,
+        max_anonymous: int = WS_MAX_ANONYMOUS_CONNECTIONS,
+        ping_interval: float = WS_PING_INTERVAL,
+        idle_timeout: float = WS_IDLE_TIMEOUT,
+    ):
+        self.queue_size = max(1, queue_size)
+        self.policy = policy
+        self.max_connections = max_connections
+        self.max_per_owner = max_per_owner
+        self.max_anonymous = max_anonymous
+        self.ping_interval = ping_interval
+        self.idle_timeout = idle_timeout
+        self._connections: Dict[WebSocket, _Connection] = {}
+        # owner → 연결 수 (accept 중인 연결 포함) / accept 중인 연결 수
+        self._owners: Dict[str, int] = {}
+        self._accepting = 0
+        self._heartbeat: asyncio.Task | None = None
+        self.rejected = 0
+        self.idle_evictions = 0
+        self._topics: Dict[str, Set[_Connection]] = {}
+        self.dropped_messages = 0
+        self.slow_disconnects = 0
+        self._closing: set[asyncio.Task] = set()
+        self.epoch = uuid4().hex[:12]
+        self.seq = 0
+        self._replay = _ReplayBuffer(WS_REPLAY_BUFFER_SIZE, WS_REPLAY_MAX_TOPICS)
+        self.replayed_messages = 0
+        self.resyncs = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self._connections)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        topics: Iterable[str] = (),
+        resume: Optional[Tuple[Optional[str], int]] = None,
+        fmt: str = ENCODING_JSON,
+        owner: Optional[str] = None,
+        denied: Iterable[str] = (),
+        heartbeat: bool = False,
+        github_id: Optional[str] = None,
+    ):
+        """
+        topics: 이미 authorize_topics 로 거른 토픽.
+        resume: 재연결이면 (마지막 epoch, 마지막 seq). 구독과 replay 사이에 다른 이벤트가 끼지 않는다.
+        fmt: negotiate_format 결과.
+        owner: 이미 인증한 경우 connection_owner 결과 (없으면 여기서 구한다).
+        denied: 권한이 없어 구독하지 않은 토픽 (subscribed 응답에 알려준다).
+        heartbeat: wants_heartbeat 결과 (앱 레벨 ping / idle 정리 대상).
+        github_id: 인증된 유저 (owner 토픽 이벤트를 받을 수 있는지 확인).
+        연결 수 제한에 걸리면 accept 하지 않고 닫은 뒤 False 를 돌려준다.
+        """
+        owner = owner or connection_owner(websocket)
+        if self._over_limit(owner):
+            self.rejected += 1
+            await websocket.close(code=LIMIT_CLOSE_CODE)
+            return False
 
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+        # 검사와 같은 틱에 자리를 잡는다 (accept 를 기다리는 동안 들어온 연결은 이 자리를 센다)
+        self._owners[owner] = self._owners.get(owner, 0) + 1
+        self._accepting += 1
+        try:
+            await websocket.accept()
+        except BaseException:
+            self._release_owner(owner)
+            raise
+        finally:
+            self._accepting -= 1
+
+        conn = _Connection(websocket, self.queue_size, owner, fmt, heartbeat, github_id)
+        conn.writer = asyncio.create_task(self._writer(conn))
+        self._connections[websocket] = conn
+        if heartbeat:
+            self._ensure_heartbeat()
+        self._enqueue(conn, _Frame(self.subscribed_message(self.subscribe(websocket, topics), fmt, denied)))
+        if resume is not None:
+            self.resume(websocket, *resume)
+        return True
+
+    def _over_limit(self, owner: str) -> bool:
+        if self.max_connections and len(self._connections) + self._accepting >= self.max_connections:
+            return True
+        limit = self.max_anonymous if owner == ANONYMOUS_OWNER else self.max_per_owner
+        return bool(limit) and self._owners.get(owner, 0) >= limit
+
+    def _release_owner(self, owner: str):
+        remaining = self._owners.get(owner, 0) - 1
+        if remaining > 0:
+            self._owners[owner] = remaining
+        else:
+            self._owners.pop(owner, None)
+
+    def touch(self, websocket: WebSocket):
+        """클라이언트에게서 메시지 (pong 포함) 를 받았을 때 호출"""
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            conn.last_seen = time.monotonic()
+
+    def subscribed_message(self, topics: List[str], fmt: Optional[str] = None, denied: Iterable[str] = ()) -> dict:
+        """구독 확인 응답. 클라이언트는 epoch / seq 를 기억해 두었다가 재연결 때 보낸다"""
+        message = {
+            "type": "system",
+            "event": "subscribed",
+            "topics": topics,
+            "epoch": self.epoch,
+            "seq": self.seq,
+            "format": fmt or ENCODING_JSON,
+        }
+        denied = sorted(denied)
+        if denied:
+            message["denied"] = denied
+        return message
+
+    def format_of(self, websocket: WebSocket) -> Optional[str]:
+        conn = self._connections.get(websocket)
+        return conn.format if conn is not None else None
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        conn = self._connections.pop(websocket, None)
+        if conn is None:
+            return
+        self._drop_topics(conn, list(conn.topics))
+        self._release_owner(conn.owner)
+        if conn.writer and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
 
-    async def broadcast(self, message: dict):
-        data = json.dumps(message, ensure_ascii=False, default=str)
-        to_remove: list[WebSocket] = []
+    def subscribe(self, websocket: WebSocket, topics: Iterable[str]) -> List[str]:
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return []
+        for topic in topics:
+            conn.topics.add(topic)
+            self._topics.setdefault(topic, set()).add(conn)
+        return sorted(conn.topics)
 
-        for conn in self.active_connections:
-            try:
-                await conn.send_text(data)
-            except Exception:
-                to_remove.append(conn)
+    def unsubscribe(self, websocket: WebSocket, topics: Iterable[str]) -> List[str]:
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return []
+        self._drop_topics(conn, topics)
+        return sorted(conn.topics)
+
+    def _drop_topics(self, conn: _Connection, topics: Iterable[str]):
+        for topic in topics:
+            conn.topics.discard(topic)
+            subscribers = self._topics.get(topic)
+            if subscribers is not None:
+                subscribers.discard(conn)
+                if not subscribers:
+                    del self._topics[topic]
+
+    async def _writer(self, conn: _Connection):
+        try:
+            while True:
+                frame = await conn.queue.get()
+                if isinstance(frame, _CloseFrame):
+                    await self._close(conn, frame.code, frame.reason)
+                    self.disconnect(conn.websocket)
+                    return
+                data = frame.encode(conn.format)
+                if isinstance(data, str):
+                    await conn.websocket.send_text(data)
+                else:
+                    await conn.websocket.send_bytes(data)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            self.disconnect(conn.websocket)
+
+    async def _close(self, conn: _Connection, code: int, reason: str = ""):
+        try:
+            await conn.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+
+    def _close_later(self, conn: _Connection, code: int):
+        self.disconnect(conn.websocket)
+        task = asyncio.create_task(self._close(conn, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _ensure_heartbeat(self):
+        if self.ping_interval > 0 and (self._heartbeat is None or self._heartbeat.done()):
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def _heartbeat_loop(self):
+        """
+        ping 을 보내고 idle 연결을 정리한다.
+        heartbeat 연결이 하나도 없으면 종료 (다음 heartbeat 연결의 connect 때 다시 시작)
+        """
+        while any(conn.heartbeat for conn in self._connections.values()):
+            await asyncio.sleep(self.ping_interval)
+            self.heartbeat_once()
 
-        for conn in to_remove:
-            self.disconnect(conn)
+    def heartbeat_once(self):
+        now = time.monotonic()
+        ping = _Frame({"type": "ping", "ts": time.time()})
+        for conn in list(self._connections.values()):
+            if not conn.heartbeat:
+                continue
+            if self.idle_timeout and now - conn.last_seen > self.idle_timeout:
+                self.idle_evictions += 1
+                self._close_later(conn, IDLE_CLOSE_CODE)
+                continue
+            self._enqueue(conn, ping)
+
+    def _enqueue(self, conn: _Connection, frame: _Frame):
+        try:
+            conn.queue.put_nowait(frame)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == "disconnect":
+            self.slow_disconnects += 1
+            self._close_later(conn, SLOW_CONSUMER_CLOSE_CODE)
+            return
+
+        # drop_oldest: 가장 오래된 메시지를 버리고 새 메시지를 넣는다
+        conn.queue.get_nowait()
+        conn.queue.put_nowait(frame)
+        conn.dropped += 1
+        self.dropped_messages += 1
+
+    def _subscribers(self, topics: Iterable[str], owner: Optional[str] = None) -> Set[_Connection]:
+        targets: Set[_Connection] = set(self._topics.get(TOPIC_ALL, ()))
+        for topic in topics:
+            subscribers = self._topics.get(topic, ())
+            if is_owner_topic(topic):
+                targets.update(conn for conn in subscribers if owner is not None and conn.github_id == owner)
+            else:
+                targets.update(subscribers)
+        return targets
+
+    async def broadcast(self, message: dict, topics: Iterable[str] = ()):
+        """
+        topics 중 하나라도 구독한 연결 + "all" 구독자에게 보낸다 (연결당 1번).
+        토픽이 있으면 seq 를 붙이고 replay 버퍼에 남긴다.
+        """
+        topics = list(topics)
+        if topics:
+            self.seq += 1
+            message = {**message, "epoch": self.epoch, "seq": self.seq}
+
+        frame = _Frame(message)
+        targets = self._subscribers(topics, frame.owner)
+        if not targets and not topics:
+            return
+        if topics:
+            self._replay.append([*topics, TOPIC_ALL], self.seq, frame)
+        for conn in targets:
+            self._enqueue(conn, frame)
+
+    def resume(self, websocket: WebSocket, epoch: Optional[str], last_seq: int) -> Dict[str, object]:
+        """구독 중인 토픽에서 last_seq 이후 이벤트를 다시 큐에 넣는다"""
+        conn = self._connections.get(websocket)
+        if conn is None:
+            return {}
+        missed = self._replay.since(conn.topics, last_seq, conn.github_id) if epoch == self.epoch else None
+
+        if missed is None:
+            self.resyncs += 1
+            result = {"type": "system", "event": "resync_required", "epoch": self.epoch, "seq": self.seq}
+            self._enqueue(conn, _Frame(result))
+            return result
+
+        for frame in missed:
+            self._enqueue(conn, frame)
+        self.replayed_messages += len(missed)
+        result = {"type": "system", "event": "resumed", "replayed": len(missed), "epoch": self.epoch, "seq": self.seq}
+        self._enqueue(conn, _Frame(result))
+        return result
+
+    async def send_to(self, websocket: WebSocket, message: dict):
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            self._enqueue(conn, _Frame(message))
+
+    def close_after_pending(self, websocket: WebSocket, code: int, reason: str = ""):
+        """이미 큐에 넣은 메시지를 보낸 뒤 닫는다 (send_to 로 보낸 에러가 close 보다 먼저 가도록)"""
+        conn = self._connections.get(websocket)
+        if conn is not None:
+            self._enqueue(conn, _CloseFrame(code, reason))
+
+    def stats(self) -> dict:
+        depths = [conn.queue.qsize() for conn in self._connections.values()]
+        formats: Dict[str, int] = {}
+        for conn in self._connections.values():
+            formats[conn.format] = formats.get(conn.format, 0) + 1
+        return {
+            "connections": len(depths),
+            "queue_size": self.queue_size,
+            "policy": self.policy,
+            "queued_total": sum(depths),
+            "queued_max": max(depths, default=0),
+            "dropped_messages": self.dropped_messages,
+            "slow_disconnects": self.slow_disconnects,
+            "topics": len(self._topics),
+            "seq": self.seq,
+            "replay_topics": len(self._replay),
+            "replayed_messages": self.replayed_messages,
+            "resyncs": self.resyncs,
+            "owners": len(self._owners),
+            "max_connections": self.max_connections,
+            "max_per_owner": self.max_per_owner,
+            "anonymous": self._owners.get(ANONYMOUS_OWNER, 0),
+            "max_anonymous": self.max_anonymous,
+            "rejected": self.rejected,
+            "idle_evictions": self.idle_evictions,
+            "formats": formats,
+            "encoded_frames": dict(_Frame.encode_count),
+        }
 
 
 ws_manager = WebSocketManager()
 
 
+async def _relay_event(event: dict):
+    """이벤트 버스 (로컬 + 다른 워커) → 이 프로세스의 소켓들"""
+    await ws_manager.broadcast(event["message"], topics=event.get("topics") or ())
+
+
+event_bus.add_handler(_relay_event)
+
+
 @router.websocket("/ws/debug")
 async def ws_debug_endpoint(websocket: WebSocket):
-    await ws_manager.connect(websocket)
+    """
+    ?topics=user:<github_id>,review:<id>,correlation:<id> 로 구독할 토픽을 고른다.
+    연결 후에도 {"action": "subscribe" | "unsubscribe", "topics": [...]} 로 바꿀 수 있다.
+    user:<github_id> 는 본인 (Bearer / access_token 쿠키 / ?token=) 토픽만, review:<id> 는 본인 리뷰만,
+    correlation:<id> 는 로그인 유저만 (본인 이벤트만 전달), "all" 은 WS_ALL_TOPIC_GITHUB_IDS 유저만
+    구독된다. 익명 연결은 user: / review: / correlation: 토픽을 받을 수 없다.
+    거절된 토픽은 subscribed 응답의 denied 에 온다.
+    지정하지 않으면 허용된 유저는 "all", 로그인 유저는 본인 토픽, 익명은 구독 없음.
+    client_connected 같은 시스템 이벤트와 debug_echo 는 "all" 구독자에게만 간다.
+
+    재연결 시 ?epoch=<epoch>&last_seq=<seq> (또는 {"action": "resume", ...}) 를 주면
+    놓친 이벤트만 다시 받는다. resync_required 가 오면 전체를 다시 조회해야 한다.
+
+    ?heartbeat=1 로 붙으면 서버가 {"type": "ping"} 을 보내고, {"type": "pong"} (다른 메시지도 인정) 이
+    WS_IDLE_TIMEOUT 동안 없으면 끊는다. 지정하지 않으면 프로토콜 ping / pong 으로만 확인한다.
+
+    ?encoding=msgpack 이면 바이너리 msgpack 프레임, ?compress=deflate 면 zlib 압축한 바이너리
+    프레임으로 받는다 (subscribed 응답의 format 참고). 클라이언트 → 서버 명령은 항상 JSON 텍스트.
+    """
+    params = websocket.query_params
+    user = await websocket_principal(websocket)
+    requested = parse_topics(params.get("topics"))
+    if requested:
+        topics, denied = await authorize_topics(requested, user)
+    else:
+        topics, denied = default_topics(user), []
+    resume = _parse_resume(params)
+    fmt = negotiate_format(params.get("encoding"), params.get("compress"))
+    owner = connection_owner(websocket, user.id if user else None)
+    if not await ws_manager.connect(
+        websocket,
+        topics,
+        resume=resume,
+        fmt=fmt,
+        owner=owner,
+        denied=denied,
+        heartbeat=wants_heartbeat(params),
+        github_id=user.github_id if user else None,
+    ):
+        return
 
     await ws_manager.broadcast({
         "type": "system",
@@ -49,11 +739,36 @@ async def ws_debug_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
+            ws_manager.touch(websocket)
+
+            command = _parse_command(data)
+            if command is None:
+                await ws_manager.broadcast({
+                    "type": "debug_echo",
+                    "message": data,
+                })
+                continue
+
+            action = command["action"]
+            if action == "pong":
+                continue
+            if action == "resume":
+                ws_manager.resume(websocket, *(_parse_resume(command) or (None, 0)))
+                continue
 
-            await ws_manager.broadcast({
-                "type": "debug_echo",
-                "message": data,
-            })
+            command_topics = command.get("topics") or []
+            if isinstance(command_topics, str):
+                command_topics = parse_topics(command_topics)
+            command_topics = [str(topic) for topic in command_topics]
+            denied = []
+            if action == "subscribe":
+                command_topics, denied = await authorize_topics(command_topics, user)
+                current = ws_manager.subscribe(websocket, command_topics)
+            else:
+                current = ws_manager.unsubscribe(websocket, command_topics)
+            await ws_manager.send_to(
+                websocket, ws_manager.subscribed_message(current, ws_manager.format_of(websocket), denied)
+            )
 
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
@@ -64,3 +779,29 @@ async def ws_debug_endpoint(websocket: WebSocket):
         })
     except Exception:
         ws_manager.disconnect(websocket)
+
+
+def _parse_command(data: str) -> Optional[dict]:
+    """subscribe / unsubscribe / resume 명령이나 pong 이면 dict, 아니면 None (debug echo)"""
+    try:
+        message = json.loads(data)
+    except ValueError:
+        return None
+    if not isinstance(message, dict):
+        return None
+    if message.get("type") == "pong":
+        return {"action": "pong"}
+    if message.get("action") not in ("subscribe", "unsubscribe", "resume"):
+        return None
+    return message
+
+
+def _parse_resume(params) -> Optional[Tuple[Optional[str], int]]:
+    """{"epoch": ..., "last_seq": ...} (쿼리 파라미터 또는 명령) → (epoch, last_seq)"""
+    last_seq = params.get("last_seq")
+    if last_seq is None:
+        return None
+    try:
+        return params.get("epoch"), int(last_seq)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,179 @@
+# app/routers/ws_reviews.py
+"""
+에디터 확장용 리뷰 요청 WebSocket (/ws/reviews).
+
+저장할 때마다 POST /v1/reviews/request 를 보내고 /ws/debug 로 진행 상황을 따로 듣는 대신,
+연결 하나로 요청을 보내고 진행 이벤트 / 결과를 받는다. 인증 (토큰 → user id) 은 연결할 때 한 번 하고,
+유저 (store_code 등) 는 요청마다 다시 조회한다. 그 사이 유저가 삭제됐으면 401 을 보내고 연결을 닫는다.
+
+클라이언트 → 서버 (JSON 텍스트)
+    {"type": "review_request", "correlation_id": "...", "meta": {...}, "body": {...}}
+        meta / body 는 POST /v1/reviews/request 와 같다 (github_id 는 인증된 유저로 고정).
+    {"type": "pong"}   (?heartbeat=1 로 붙어서 ping 을 받는 경우)
+
+서버 → 클라이언트 (요청별 메시지는 correlation_id 로 짝을 맞춘다)
+    {"type": "system", "event": "subscribed", "format": ...}  연결 직후 (프레임 포맷 확인)
+    {"type": "ready", "user_id": ..., "max_inflight": N}
+    {"type": "accepted", "correlation_id": ..., "inflight": n}
+    {"type": "progress", "correlation_id": ..., "event": "<review_request_received ...>", "payload": {...}}
+    {"type": "result", "correlation_id": ..., "data": <ReviewRequestResponse>}
+    {"type": "error", "correlation_id": ..., "status": 400 | 401 | 409 | 422 | 429 | 500, "detail": "..."}
+
+흐름 제어: 연결당 동시에 처리 중인 요청은 WS_REVIEW_MAX_INFLIGHT 개까지이고, 넘으면 429 로
+바로 거절한다 (클라이언트는 result / error 를 받은 만큼 다시 보낼 수 있다). 서버 → 클라이언트
+송신은 연결별 bounded 큐를 쓰고, 결과가 유실되지 않도록 큐가 꽉 찬 클라이언트는 끊는다.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Optional
+from uuid import uuid4
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
+
+from app.routers.ws_debug import (
+    WebSocketManager,
+    connection_owner,
+    negotiate_format,
+    wants_heartbeat,
+    websocket_principal,
+)
+from app.schemas.review import ReviewRequest
+from app.services.principal import CurrentUser, principal_cache
+from app.services.review_pipeline import ReviewRequestError, run_review_request
+from app.utils.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["ws-reviews"])
+
+# 연결당 동시에 처리할 리뷰 요청 수
+WS_REVIEW_MAX_INFLIGHT = int(os.getenv("WS_REVIEW_MAX_INFLIGHT", "4"))
+
+# 인증 실패 (1008: Policy Violation)
+AUTH_CLOSE_CODE = 1008
+
+review_ws_manager = WebSocketManager(policy="disconnect")
+
+
+class _ReviewChannel:
+    """연결 하나의 인증된 user id + 처리 중인 요청 (correlation_id → task)"""
+
+    def __init__(self, websocket: WebSocket, user: CurrentUser, max_inflight: int):
+        self.websocket = websocket
+        self.user_id = user.id
+        self.max_inflight = max(1, max_inflight)
+        self.inflight: Dict[str, asyncio.Task] = {}
+
+    async def send(self, message: dict):
+        await review_ws_manager.send_to(self.websocket, message)
+
+    async def error(self, correlation_id: Optional[str], status: int, detail: str):
+        await self.send({"type": "error", "correlation_id": correlation_id, "status": status, "detail": detail})
+
+    async def submit(self, message: dict):
+        correlation_id = str(message.get("correlation_id") or uuid4().hex)
+        try:
+            envelope = ReviewRequest.model_validate(
+                {"meta": {"actor": "client", **(message.get("meta") or {})}, "body": message.get("body")}
+            )
+        except ValidationError as exc:
+            await self.error(correlation_id, 422, json.dumps(exc.errors(include_url=False), default=str))
+            return
+
+        if correlation_id in self.inflight:
+            await self.error(correlation_id, 409, "correlation_id already in flight")
+            return
+        if len(self.inflight) >= self.max_inflight:
+            await self.error(correlation_id, 429, "too many in-flight requests")
+            return
+
+        task = asyncio.create_task(self._run(correlation_id, envelope))
+        self.inflight[correlation_id] = task
+        task.add_done_callback(lambda _: self.inflight.pop(correlation_id, None))
+        await self.send({"type": "accepted", "correlation_id": correlation_id, "inflight": len(self.inflight)})
+
+    async def _run(self, correlation_id: str, envelope: ReviewRequest):
+        async def on_event(event_type: str, payload: dict):
+            await self.send({
+                "type": "progress",
+                "correlation_id": correlation_id,
+                "event": event_type,
+                "payload": payload,
+            })
+
+        try:
+            async with AsyncSessionLocal() as session:
+                # 연결 중에 store_code 가 바뀌거나 유저가 삭제될 수 있으므로 요청마다 다시 조회한다
+                user = await principal_cache.get_user(session, user_id=self.user_id)
+                if user is None:
+                    await self.error(correlation_id, 401, "user no longer exists")
+                    review_ws_manager.close_after_pending(self.websocket, AUTH_CLOSE_CODE, "user no longer exists")
+                    return
+                response = await run_review_request(
+                    session,
+                    envelope,
+                    user=user,
+                    correlation_id=correlation_id,
+                    on_event=on_event,
+                )
+        except ReviewRequestError as exc:
+            await self.error(correlation_id, exc.status_code, exc.detail)
+            return
+        except Exception:
+            logger.exception("[ws_reviews] review failed (correlation_id=%s)", correlation_id)
+            await self.error(correlation_id, 500, "review failed")
+            return
+
+        await self.send({"type": "result", "correlation_id": correlation_id, "data": response.model_dump(mode="json")})
+
+
+@router.websocket("/ws/reviews")
+async def ws_reviews_endpoint(websocket: WebSocket):
+    """
+    Authorization: Bearer <jwt> (또는 access_token 쿠키 / ?token=) 로 인증한다.
+    ?encoding= / ?compress= / ?heartbeat= 는 /ws/debug 와 같다.
+    처리 중인 요청은 연결이 끊겨도 끝까지 저장되지만 결과는 버린다.
+    """
+    user = await websocket_principal(websocket)
+    if user is None:
+        await websocket.close(code=AUTH_CLOSE_CODE)
+        return
+
+    params = websocket.query_params
+    fmt = negotiate_format(params.get("encoding"), params.get("compress"))
+    owner = connection_owner(websocket, user.id)
+    if not await review_ws_manager.connect(websocket, (), fmt=fmt, owner=owner, heartbeat=wants_heartbeat(params)):
+        return
+
+    channel = _ReviewChannel(websocket, user, WS_REVIEW_MAX_INFLIGHT)
+    await channel.send({"type": "ready", "user_id": user.id, "max_inflight": channel.max_inflight})
+
+    try:
+        while True:
+            data = await websocket.receive_text()
+            review_ws_manager.touch(websocket)
+
+            try:
+                message = json.loads(data)
+            except ValueError:
+                await channel.error(None, 400, "invalid json")
+                continue
+            if not isinstance(message, dict):
+                await channel.error(None, 400, "message must be an object")
+                continue
+
+            kind = message.get("type")
+            if kind == "pong":
+                continue
+            if kind == "review_request":
+                await channel.submit(message)
+                continue
+            await channel.error(message.get("correlation_id"), 400, f"unknown message type: {kind}")
+
+    except WebSocketDisconnect:
+        pass
+    finally:
+        review_ws_manager.disconnect(websocket)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional, Dict
 
 from pydantic import BaseModel, Field
@@ -102,6 +103,8 @@ class ReviewResultBody(BaseModel):
     summary: str
     scores_by_category: ScoresByCategory
     comments: Dict[str, str]
+    # include=code 일 때만 채운다 (목록과 같음)
+    code: Optional[str] = None
 
 
 class ReviewDetailResponse(BaseModel):
@@ -109,6 +112,20 @@ class ReviewDetailResponse(BaseModel):
     body: ReviewResultBody
 
 
+# ─────────────────────────────────────────
+# GET /v1/reviews/{review_id}/code
+# ─────────────────────────────────────────
+
+class ReviewCodeBody(BaseModel):
+    review_id: int
+    code: Optional[str] = None
+
+
+class ReviewCodeResponse(BaseModel):
+    meta: Meta
+    body: ReviewCodeBody
+
+
 class ReviewAPIRequest(BaseModel):
     code_snippet: str
 
@@ -177,4 +194,51 @@ class UserStatsItem(BaseModel):
 
 
 class UserStatsResponse(BaseModel):
-    data: List[UserStatsItem]
\ No newline at end of file
+    data: List[UserStatsItem]
+
+
+class TimeseriesItem(BaseModel):
+    bucket_start: datetime
+    key: Optional[str] = None
+    review_count: int
+    avg_total: Optional[float]
+    avg_bug: Optional[float]
+    avg_maintainability: Optional[float]
+    avg_style: Optional[float]
+    avg_security: Optional[float]
+
+
+class TimeseriesResponse(BaseModel):
+    bucket: str
+    group_by: Optional[str] = None
+    data: List[TimeseriesItem]
+
+
+class ScoreMetricSummary(BaseModel):
+    count: int
+    mean: Optional[float]
+    percentiles: Dict[str, float]
+
+
+class PercentileItem(BaseModel):
+    key: Optional[str] = None
+    review_count: int
+    metrics: Dict[str, ScoreMetricSummary]
+
+
+class PercentileResponse(BaseModel):
+    group_by: Optional[str] = None
+    data: List[PercentileItem]
+
+
+class HistogramItem(BaseModel):
+    key: Optional[str] = None
+    count: int
+    counts: List[int]
+
+
+class HistogramResponse(BaseModel):
+    metric: str
+    group_by: Optional[str] = None
+    edges: List[float]
+    data: List[HistogramItem]
@@ -0,0 +1,278 @@
+# app/services/event_bus.py
+"""
+리뷰 이벤트 pub/sub 버스.
+
+- publish 는 같은 프로세스의 핸들러 (WebSocket 매니저) 에 바로 전달하고,
+  백엔드가 있으면 다른 워커로도 내보낸다. 요청 경로에서 네트워크 I/O 를 기다리지 않는다.
+- EVENT_BUS_URL
+    - "memory" (기본): 프로세스 하나 안에서만 전달
+    - "redis://[:password@]host:port[/db]": Redis PUBLISH / SUBSCRIBE 로 워커 간 전달.
+      별도 라이브러리 없이 RESP 프로토콜을 직접 쓴다.
+- 각 워커는 구독한 이벤트 중 자기가 보낸 것 (origin 이 같은 것) 은 건너뛴다.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+EVENT_BUS_URL = os.getenv("EVENT_BUS_URL", "memory")
+EVENT_BUS_CHANNEL = os.getenv("EVENT_BUS_CHANNEL", "review-events")
+EVENT_BUS_QUEUE_SIZE = int(os.getenv("EVENT_BUS_QUEUE_SIZE", "1000"))
+
+# 재연결 대기 (초): 1, 2, 4 ... 최대 30
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 30.0
+
+# 이 프로세스를 구분하는 id (자기 이벤트 중복 전달 방지)
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def review_event_topics(payload: Dict[str, Any]) -> List[str]:
+    """
+    리뷰 이벤트 payload → 토픽 목록.
+    user:<github_id> / correlation:<correlation_id> / review:<review_id>
+    """
+    topics = []
+    if payload.get("github_id"):
+        topics.append(f"user:{payload['github_id']}")
+    if payload.get("correlation_id"):
+        topics.append(f"correlation:{payload['correlation_id']}")
+    if payload.get("review_id") is not None:
+        topics.append(f"review:{payload['review_id']}")
+    return topics
+
+
+class EventBus:
+    """프로세스 내 전달만 하는 기본 버스 (memory 백엔드)"""
+
+    backend = "memory"
+
+    def __init__(self) -> None:
+        self._handlers: List[EventHandler] = []
+        self.published = 0
+        self.received = 0
+        self.handler_errors = 0
+
+    def add_handler(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
+
+    async def _dispatch(self, event: Dict[str, Any]) -> None:
+        for handler in self._handlers:
+            try:
+                await handler(event)
+            except Exception:
+                self.handler_errors += 1
+                logger.exception("[event_bus] handler failed")
+
+    async def publish(self, message: Dict[str, Any], topics: Iterable[str] = ()) -> None:
+        event = {"origin": WORKER_ID, "topics": list(topics), "message": message}
+        self.published += 1
+        await self._dispatch(event)
+        self._forward(event)
+
+    def _forward(self, event: Dict[str, Any]) -> None:
+        """다른 워커로 내보내기 (memory 백엔드는 없음)"""
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "worker_id": WORKER_ID,
+            "published": self.published,
+            "received": self.received,
+            "handler_errors": self.handler_errors,
+        }
+
+
+# ─────────────────────────────────────────
+#  Redis (RESP)
+# ─────────────────────────────────────────
+
+class RespConnection:
+    """PUBLISH / SUBSCRIBE 에 필요한 만큼만 구현한 Redis 프로토콜 연결"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, url: str) -> "RespConnection":
+        parsed = urlparse(url)
+        reader, writer = await asyncio.open_connection(parsed.hostname or "localhost", parsed.port or 6379)
+        conn = cls(reader, writer)
+        if parsed.password:
+            await conn.command("AUTH", parsed.password)
+        db = (parsed.path or "/").lstrip("/")
+        if db and db != "0":
+            await conn.command("SELECT", db)
+        return conn
+
+    @staticmethod
+    def encode(*args: Any) -> bytes:
+        out = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(out)
+
+    async def send(self, *args: Any) -> None:
+        self.writer.write(self.encode(*args))
+        await self.writer.drain()
+
+    async def read(self) -> Any:
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("redis connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RuntimeError(rest.decode())
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            length = int(rest)
+            if length < 0:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            length = int(rest)
+            if length < 0:
+                return None
+            return [await self.read() for _ in range(length)]
+        raise RuntimeError(f"unexpected RESP reply: {line!r}")
+
+    async def command(self, *args: Any) -> Any:
+        await self.send(*args)
+        return await self.read()
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except Exception:
+            pass
+
+
+class RedisEventBus(EventBus):
+    """
+    publish 는 로컬 전달 후 outbox 큐에 넣고 바로 돌아온다. publisher task 가 PUBLISH 하고,
+    subscriber task 가 채널을 구독해서 다른 워커의 이벤트를 로컬 핸들러로 넘긴다.
+    연결이 끊기면 지수 백오프로 다시 붙는다 (그 사이 outbox 가 꽉 차면 새 이벤트는 버린다).
+    PUBLISH 도중 끊긴 이벤트는 다시 붙은 뒤 먼저 보낸다 (응답만 못 받은 경우 두 번 갈 수 있다).
+    """
+
+    backend = "redis"
+
+    def __init__(self, url: str, channel: str = EVENT_BUS_CHANNEL, queue_size: int = EVENT_BUS_QUEUE_SIZE):
+        super().__init__()
+        self.url = url
+        self.channel = channel
+        self._outbox: asyncio.Queue[bytes] = asyncio.Queue(maxsize=max(1, queue_size))
+        # outbox 에서 꺼냈지만 PUBLISH 가 끝나지 않은 이벤트
+        self._pending: Optional[bytes] = None
+        self._tasks: List[asyncio.Task] = []
+        self.dropped = 0
+        self.reconnects = 0
+        self.connected = {"publisher": False, "subscriber": False}
+
+    def _forward(self, event: Dict[str, Any]) -> None:
+        data = json.dumps(event, ensure_ascii=False, default=str).encode("utf-8")
+        try:
+            self._outbox.put_nowait(data)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run("publisher", self._publish_loop)),
+            asyncio.create_task(self._run("subscriber", self._subscribe_loop)),
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _run(self, role: str, loop: Callable[[RespConnection], Awaitable[None]]) -> None:
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            conn: Optional[RespConnection] = None
+            try:
+                conn = await RespConnection.open(self.url)
+                self.connected[role] = True
+                delay = RECONNECT_MIN_DELAY
+                await loop(conn)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("[event_bus] redis %s disconnected: %s", role, exc)
+            finally:
+                self.connected[role] = False
+                if conn is not None:
+                    await conn.close()
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def _publish_loop(self, conn: RespConnection) -> None:
+        while True:
+            if self._pending is None:
+                self._pending = await self._outbox.get()
+            await conn.command("PUBLISH", self.channel, self._pending)
+            self._pending = None
+
+    async def _subscribe_loop(self, conn: RespConnection) -> None:
+        await conn.send("SUBSCRIBE", self.channel)
+        while True:
+            reply = await conn.read()
+            if not isinstance(reply, list) or len(reply) != 3 or reply[0] != b"message":
+                continue  # subscribe 확인 응답 등
+            try:
+                event = json.loads(reply[2])
+            except ValueError:
+                continue
+            if event.get("origin") == WORKER_ID:
+                continue
+            self.received += 1
+            await self._dispatch(event)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "channel": self.channel,
+            "connected": dict(self.connected),
+            "outbox": self._outbox.qsize() + (self._pending is not None),
+            "dropped": self.dropped,
+            "reconnects": self.reconnects,
+        }
+
+
+def create_event_bus(url: str = EVENT_BUS_URL) -> EventBus:
+    if url.startswith("redis://"):
+        return RedisEventBus(url)
+    return EventBus()
+
+
+event_bus = create_event_bus()
@@ -0,0 +1,26 @@
+# app/services/fix_service.py
+import asyncio
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.ai_client import CodeReviewerClient
+from app.services.review_service import load_review_detail
+
+ai_client = CodeReviewerClient(
+    vllm_url="http://18.205.229.159:8001/v1",
+)
+
+
+async def fix_review_code(session: AsyncSession, review_id: int, code: str) -> Optional[str]:
+    """리뷰 요약 / 코멘트를 바탕으로 수정한 코드. 리뷰가 없으면 None"""
+    review = await load_review_detail(session, review_id)
+    if not review:
+        return None
+
+    return await asyncio.to_thread(
+        ai_client.get_fix,
+        code,
+        review["summary"],
+        dict(review["comments"]),
+    )
@@ -0,0 +1,77 @@
+# app/services/fragment_cache.py
+"""
+UI 렌더링 결과 (HTML 조각) 캐시.
+
+- 리뷰 상세 본문 / 목록의 리뷰 행은 review id 로 캐시한다. 리뷰는 저장 후 바뀌지 않으므로
+  삭제할 때 지운다 (invalidate_reviews). 다른 워커에서 삭제한 리뷰 (code 원문 포함) 가 계속 보이지 않도록
+  FRAGMENT_CACHE_TTL 초가 지나면 다시 렌더링한다 (review_detail_cache 와 같은 기본값).
+- 목록 페이지 (행 묶음 + 다음 페이지 링크) 는 조각 캐시 generation 과 쿼리 파라미터로 캐시한다.
+  리뷰를 넣거나 지우는 쪽이 mark_fragments_dirty 로 세션에 표시하고, 커밋되면 generation 이 올라서
+  기존 페이지는 더 이상 조회되지 않는다. 다른 워커의 쓰기는 FRAGMENT_CACHE_LIST_TTL 초 안에 반영된다.
+- 로그인 유저 표시 같은 요청별 부분은 캐시하지 않고 매번 base 템플릿에서 렌더링한다.
+- 메모리는 문자 수 합계 (FRAGMENT_CACHE_MAX_CHARS) 로 제한하고, 넘으면 오래 안 쓴 것부터 버린다.
+"""
+import os
+from typing import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.utils.lru_cache import LRUCache
+
+FRAGMENT_CACHE_MAX_CHARS = int(os.getenv("FRAGMENT_CACHE_MAX_CHARS", str(32 * 1024 * 1024)))
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv("FRAGMENT_CACHE_MAX_ENTRIES", "100000"))
+FRAGMENT_CACHE_TTL = float(os.getenv("FRAGMENT_CACHE_TTL", "120"))
+FRAGMENT_CACHE_LIST_TTL = float(os.getenv("FRAGMENT_CACHE_LIST_TTL", "30"))
+
+_DIRTY_KEY = "fragment_cache_dirty"
+
+
+class FragmentCache(LRUCache):
+    """문자 수 제한 LRU (기본 TTL, 목록 페이지는 set 에서 따로 준다) + 목록 페이지 무효화용 generation"""
+
+    def __init__(self, max_entries: int, max_chars: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl, max_weight=max_chars, sizeof=len)
+        self.generation = 0
+
+    def bump(self) -> None:
+        self.generation += 1
+
+    def stats(self) -> dict:
+        return {**super().stats(), "generation": self.generation}
+
+
+fragment_cache = FragmentCache(FRAGMENT_CACHE_MAX_ENTRIES, FRAGMENT_CACHE_MAX_CHARS, FRAGMENT_CACHE_TTL)
+
+
+def detail_key(review_id: int) -> tuple:
+    return ("detail", review_id)
+
+
+def row_key(review_id: int, include_code: bool) -> tuple:
+    return ("row", review_id, include_code)
+
+
+def invalidate_reviews(review_ids: Iterable[int]) -> None:
+    """삭제된 리뷰의 상세 / 행 조각 (목록 페이지는 generation 으로 무효화된다)"""
+    keys = []
+    for review_id in review_ids:
+        keys += [detail_key(review_id), row_key(review_id, True), row_key(review_id, False)]
+    fragment_cache.delete_many(keys)
+
+
+def mark_fragments_dirty(session: AsyncSession) -> None:
+    """이 세션이 커밋되면 캐시된 목록 페이지를 무효화한다 (리뷰 추가 / 삭제)"""
+    session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        fragment_cache.bump()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_dirty(session: Session, previous_transaction) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,342 @@
+# app/services/import_jobs.py
+"""
+백그라운드 샘플 import 작업.
+
+- 업로드는 IMPORT_SPOOL_DIR 에 파일로 받아두고 (spool_upload) 작업 행을 만든 뒤 바로 응답한다.
+- 워커마다 ImportJobRunner 가 IMPORT_JOB_CONCURRENCY 개의 루프로 작업을 가져가서 돌린다.
+  가져갈 때는 UPDATE ... WHERE status 로 선점하고 (claimed_by), spool 파일이 이 서버 디스크에 있는 작업만 가져간다.
+- 배치를 커밋하는 트랜잭션에서 inserted (체크포인트) 를 같이 올리므로, 워커가 죽어도
+  updated_at 이 IMPORT_JOB_STALE_SECONDS 지난 running 작업은 다른 루프가 이어서 (skip) 한다.
+  정상 종료 (stop) 때는 돌던 작업을 queued 로 돌려놓는다.
+- 진행 상황은 이벤트 버스로 import:<id> / imports 토픽에 보낸다 (/ws/debug 로 구독).
+- 끝나거나 취소된 작업의 spool 파일은 지우고, 실패한 작업은 이어서 할 수 있게 남겨둔다.
+"""
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from fastapi import UploadFile
+from sqlalchemy import and_, or_, select, update
+from starlette.concurrency import run_in_threadpool
+
+from app.models.import_job import SampleImportJob
+from app.services.event_bus import event_bus
+from app.services.sample_import import (
+    SAMPLE_IMPORT_CHUNK_SIZE,
+    SampleImportError,
+    SampleImportResult,
+    import_samples,
+    iter_sample_items,
+)
+from app.utils.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+IMPORT_SPOOL_DIR = os.getenv("IMPORT_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "sample-import-spool"))
+IMPORT_JOB_CONCURRENCY = int(os.getenv("IMPORT_JOB_CONCURRENCY", "1"))
+IMPORT_JOB_POLL_INTERVAL = float(os.getenv("IMPORT_JOB_POLL_INTERVAL", "5"))
+IMPORT_JOB_STALE_SECONDS = float(os.getenv("IMPORT_JOB_STALE_SECONDS", "120"))
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# 모든 import 작업 이벤트를 받는 토픽
+IMPORTS_TOPIC = "imports"
+
+
+class ImportJobCancelled(Exception):
+    """취소됐거나 다른 루프가 작업을 가져갔다 (이 배치는 롤백하고 멈춘다)"""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def import_job_topic(job_id: int) -> str:
+    return f"import:{job_id}"
+
+
+def job_dict(job: SampleImportJob) -> Dict[str, Any]:
+    def iso(value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
+    return {
+        "id": job.id,
+        "github_id": job.github_id,
+        "filename": job.filename,
+        "size_bytes": job.size_bytes,
+        "batch_size": job.batch_size,
+        "status": job.status,
+        "inserted": job.inserted,
+        "batches": job.batches,
+        "error": job.error,
+        "created_at": iso(job.created_at),
+        "started_at": iso(job.started_at),
+        "finished_at": iso(job.finished_at),
+        "updated_at": iso(job.updated_at),
+    }
+
+
+async def publish_job_event(event_type: str, payload: Dict[str, Any]) -> None:
+    await event_bus.publish(
+        {"type": event_type, "payload": payload},
+        topics=[import_job_topic(payload["id"]), IMPORTS_TOPIC],
+    )
+
+
+async def spool_upload(upload: UploadFile) -> Tuple[str, int]:
+    """업로드 파일 → IMPORT_SPOOL_DIR 아래 파일 (경로, 바이트 수). 복사는 스레드에서 한다"""
+    os.makedirs(IMPORT_SPOOL_DIR, exist_ok=True)
+    path = os.path.join(IMPORT_SPOOL_DIR, f"{uuid4().hex}.upload")
+    await upload.seek(0)
+
+    def copy() -> int:
+        with open(path, "wb") as out:
+            shutil.copyfileobj(upload.file, out, SAMPLE_IMPORT_CHUNK_SIZE)
+            return out.tell()
+
+    return path, await run_in_threadpool(copy)
+
+
+def remove_spool(path: Optional[str]) -> None:
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("[import_jobs] failed to remove spool file %s", path, exc_info=True)
+
+
+class ImportJobRunner:
+    def __init__(
+        self,
+        concurrency: int = IMPORT_JOB_CONCURRENCY,
+        poll_interval: float = IMPORT_JOB_POLL_INTERVAL,
+        stale_after: float = IMPORT_JOB_STALE_SECONDS,
+    ):
+        self.concurrency = max(0, concurrency)
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._wake = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+        self._running: Set[int] = set()
+        self.claimed = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.requeued = 0
+
+    def start(self) -> None:
+        self._tasks = [task for task in self._tasks if not task.done()]
+        while len(self._tasks) < self.concurrency:
+            self._tasks.append(asyncio.create_task(self._loop()))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def wake(self) -> None:
+        """새 작업이 생겼을 때 (폴링 주기를 기다리지 않고 바로 가져간다)"""
+        self._wake.set()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                claim = await self.claim_next()
+            except Exception:
+                logger.exception("[import_jobs] claim failed")
+                claim = None
+
+            if claim is not None:
+                await self.run_job(*claim)
+                continue
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def claim_next(self) -> Optional[Tuple[int, str]]:
+        """
+        이 서버에 spool 파일이 있는 queued (또는 멈춘 running) 작업 하나를 선점한다.
+        (job id, claim token). token 은 체크포인트마다 확인한다 (멈춘 줄 알았던 루프가 살아 있어도 한쪽만 진행).
+        """
+        now = _now()
+        claimable = or_(
+            SampleImportJob.status == JOB_QUEUED,
+            and_(
+                SampleImportJob.status == JOB_RUNNING,
+                SampleImportJob.updated_at < now - timedelta(seconds=self.stale_after),
+            ),
+        )
+
+        token = uuid4().hex
+        async with AsyncSessionLocal() as session:
+            candidates = (
+                await session.execute(
+                    select(SampleImportJob.id, SampleImportJob.spool_path)
+                    .where(claimable)
+                    .order_by(SampleImportJob.id)
+                    .limit(20)
+                )
+            ).all()
+
+            for job_id, spool_path in candidates:
+                if job_id in self._running or not os.path.exists(spool_path):
+                    continue
+                result = await session.execute(
+                    update(SampleImportJob)
+                    .where(SampleImportJob.id == job_id, claimable)
+                    .values(status=JOB_RUNNING, claimed_by=token, updated_at=now, error=None)
+                )
+                await session.commit()
+                if result.rowcount == 1:
+                    self.claimed += 1
+                    return job_id, token
+        return None
+
+    async def run_job(self, job_id: int, token: str) -> None:
+        async with AsyncSessionLocal() as session:
+            job = await session.get(SampleImportJob, job_id)
+            if job is None:
+                return
+            offset = job.inserted
+            if job.started_at is None:
+                job.started_at = _now()
+                await session.commit()
+            await publish_job_event("import_started" if offset == 0 else "import_resumed", job_dict(job))
+
+            spool = open(job.spool_path, "rb")
+
+            async def read(size: int) -> bytes:
+                return await run_in_threadpool(spool.read, size)
+
+            async def on_batch(inserted: int) -> None:
+                # 배치와 같은 트랜잭션: 취소 확인 + 체크포인트
+                row = (
+                    await session.execute(
+                        select(SampleImportJob.status, SampleImportJob.claimed_by).where(SampleImportJob.id == job_id)
+                    )
+                ).one()
+                if row.status != JOB_RUNNING or row.claimed_by != token:
+                    raise ImportJobCancelled()
+                await session.execute(
+                    update(SampleImportJob)
+                    .where(SampleImportJob.id == job_id)
+                    .values(
+                        inserted=offset + inserted,
+                        batches=SampleImportJob.batches + 1,
+                        updated_at=_now(),
+                    )
+                )
+
+            async def on_progress(result: SampleImportResult) -> None:
+                await publish_job_event(
+                    "import_progress",
+                    {
+                        "id": job_id,
+                        "status": JOB_RUNNING,
+                        "inserted": offset + result.inserted,
+                        "bytes_read": spool.tell(),
+                        "size_bytes": job.size_bytes,
+                        "rate": result.rate,
+                    },
+                )
+
+            self._running.add(job_id)
+            try:
+                await import_samples(
+                    session,
+                    iter_sample_items(read),
+                    github_id=job.github_id,
+                    batch_size=job.batch_size,
+                    skip=offset,
+                    on_batch=on_batch,
+                    on_progress=on_progress,
+                )
+            except SampleImportError as exc:
+                if isinstance(exc.__cause__, ImportJobCancelled):
+                    await self._finish(session, job_id, token, JOB_CANCELLED)
+                else:
+                    logger.warning("[import_jobs] job %s failed: %s", job_id, exc)
+                    await self._finish(session, job_id, token, JOB_FAILED, error=str(exc))
+            except asyncio.CancelledError:
+                # 서버 종료: 다음에 (이 서버든 다른 루프든) 체크포인트부터 이어서 한다
+                await session.rollback()
+                await session.execute(
+                    update(SampleImportJob)
+                    .where(
+                        SampleImportJob.id == job_id,
+                        SampleImportJob.status == JOB_RUNNING,
+                        SampleImportJob.claimed_by == token,
+                    )
+                    .values(status=JOB_QUEUED, claimed_by=None)
+                )
+                await session.commit()
+                self.requeued += 1
+                raise
+            except Exception as exc:
+                logger.exception("[import_jobs] job %s crashed", job_id)
+                await session.rollback()
+                await self._finish(session, job_id, token, JOB_FAILED, error=str(exc))
+            else:
+                await self._finish(session, job_id, token, JOB_DONE)
+            finally:
+                spool.close()
+                self._running.discard(job_id)
+
+    async def _finish(self, session, job_id: int, token: str, status: str, error: Optional[str] = None) -> None:
+        job = await session.get(SampleImportJob, job_id)
+        await session.refresh(job)
+        if job.claimed_by != token:
+            # 다른 루프가 이어받았다
+            return
+        if job.status != JOB_CANCELLED:
+            job.status = status
+        job.claimed_by = None
+        job.error = error
+        job.finished_at = _now()
+        job.updated_at = job.finished_at
+        await session.commit()
+
+        if job.status == JOB_FAILED:
+            self.failed += 1
+        else:
+            remove_spool(job.spool_path)
+            if job.status == JOB_DONE:
+                self.completed += 1
+            else:
+                self.cancelled += 1
+        await publish_job_event(f"import_{job.status}", job_dict(job))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "running": sorted(self._running),
+            "claimed": self.claimed,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "requeued": self.requeued,
+            "spool_dir": IMPORT_SPOOL_DIR,
+        }
+
+
+import_job_runner = ImportJobRunner()
@@ -0,0 +1,149 @@
+# app/services/principal.py
+"""
+요청의 로그인 유저 (principal) 확인.
+
+- 토큰 → user id: JWT 디코드 결과를 PRINCIPAL_TOKEN_TTL 초 동안 캐시한다 (exp 가 있으면 그 전까지만).
+- user id → CurrentUser: User 행 스냅샷을 PRINCIPAL_USER_TTL 초 동안 캐시한다.
+  github_id 로 찾는 경우 (리뷰 요청 meta.github_id) 는 github_id → user id 인덱스를 거친다.
+- resolve_principal 은 요청마다 한 번만 확인하고 결과를 request.state.principal 에 둔다.
+
+유저를 수정 / 삭제한 쪽은 커밋 후 invalidate_users / clear_users 를 불러야 한다.
+다른 워커의 캐시는 PRINCIPAL_USER_TTL 초 안에 반영된다. 없는 유저 / 잘못된 토큰은 캐시하지 않는다.
+그래서 이 스냅샷은 신원 확인용이고, store_code 같은 동의 여부는 쓰는 시점에 DB 에서 다시 읽는다.
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.services.auth import decode_jwt
+from app.utils.lru_cache import LRUCache
+
+PRINCIPAL_TOKEN_TTL = float(os.getenv("PRINCIPAL_TOKEN_TTL", "300"))
+PRINCIPAL_USER_TTL = float(os.getenv("PRINCIPAL_USER_TTL", "30"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "4096"))
+
+_UNRESOLVED = object()
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """캐시에 두는 User 스냅샷 (UserOut 과 같은 필드). 수정이 필요하면 session.get(User, id) 로 다시 읽는다"""
+
+    id: int
+    github_id: str
+    login: str
+    name: Optional[str]
+    avatar_url: Optional[str]
+    store_code: bool
+
+
+def request_token(request: Request) -> Optional[str]:
+    """Authorization: Bearer 우선, 없으면 access_token 쿠키"""
+    auth = request.headers.get("Authorization", "")
+    if auth.startswith("Bearer "):
+        return auth.split(" ", 1)[1]
+    return request.cookies.get("access_token")
+
+
+class PrincipalCache:
+    def __init__(self, max_entries: int, token_ttl: float, user_ttl: float):
+        self.tokens = LRUCache(max_entries, token_ttl)
+        self.users = LRUCache(max_entries, user_ttl)
+        self.github_ids = LRUCache(max_entries, user_ttl)
+
+    def user_id_for_token(self, token: str) -> Optional[int]:
+        """JWT → user id (유효하지 않으면 None)"""
+        entry = self.tokens.get(token)
+        if entry is not None:
+            user_id, exp = entry
+            if exp is None or exp > time.time():
+                return user_id
+            self.tokens.delete(token)
+
+        try:
+            payload = decode_jwt(token)
+            user_id = int(payload["sub"])
+        except Exception:
+            return None
+
+        exp = payload.get("exp")
+        self.tokens.set(token, (user_id, float(exp) if exp is not None else None))
+        return user_id
+
+    async def get_user(
+        self,
+        session: AsyncSession,
+        *,
+        user_id: Optional[int] = None,
+        github_id: Optional[str] = None,
+    ) -> Optional[CurrentUser]:
+        if user_id is None:
+            github_id = str(github_id)
+            user_id = self.github_ids.get(github_id)
+            if user_id is not None:
+                user = await self.get_user(session, user_id=user_id)
+                if user is not None and user.github_id == github_id:
+                    return user
+                self.github_ids.delete(github_id)
+            stmt = select(User).where(User.github_id == github_id)
+        else:
+            user = self.users.get(user_id)
+            if user is not None:
+                return user
+            stmt = select(User).where(User.id == user_id)
+
+        row = (await session.execute(stmt)).scalar_one_or_none()
+        if row is None:
+            return None
+
+        user = CurrentUser(
+            id=int(row.id),
+            github_id=str(row.github_id),
+            login=row.login,
+            name=row.name,
+            avatar_url=row.avatar_url,
+            store_code=bool(row.store_code),
+        )
+        self.users.set(user.id, user)
+        self.github_ids.set(user.github_id, user.id)
+        return user
+
+    def invalidate_users(self, user_ids: Iterable[int]) -> None:
+        """수정 / 삭제된 유저 (github_id 인덱스는 get_user 에서 id 를 다시 확인하므로 그대로 둔다)"""
+        self.users.delete_many(user_ids)
+
+    def clear_users(self) -> None:
+        self.users.clear()
+        self.github_ids.clear()
+
+    def stats(self) -> dict:
+        return {
+            "tokens": self.tokens.stats(),
+            "users": self.users.stats(),
+            "github_ids": self.github_ids.stats(),
+        }
+
+
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_SIZE, PRINCIPAL_TOKEN_TTL, PRINCIPAL_USER_TTL)
+
+
+async def resolve_principal(request: Request, session: AsyncSession) -> Optional[CurrentUser]:
+    """현재 로그인 유저 (없거나 토큰이 유효하지 않으면 None). 같은 요청 안에서는 한 번만 확인한다"""
+    user = getattr(request.state, "principal", _UNRESOLVED)
+    if user is not _UNRESOLVED:
+        return user
+
+    user = None
+    token = request_token(request)
+    user_id = principal_cache.user_id_for_token(token) if token else None
+    if user_id is not None:
+        user = await principal_cache.get_user(session, user_id=user_id)
+
+    request.state.principal = user
+    return user
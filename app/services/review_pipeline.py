@@ -0,0 +1,237 @@
+# app/services/review_pipeline.py
+"""
+리뷰 요청 처리 (유저 확인 → LLM 호출 → 저장 → 이벤트).
+
+POST /v1/reviews/request, /ws/reviews, UI 가 같이 쓴다. 진행 이벤트는 이벤트 버스로 나가고
+(on_event 가 있으면 호출한 쪽에도 바로 전달), 실패는 ReviewRequestError 로 알린다.
+"""
+from datetime import datetime, timezone, timedelta
+from hashlib import sha256
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.review import Review, ReviewMeta
+from app.models.user import User
+from app.schemas.common import Meta
+from app.schemas.review import (
+    LLMQualityResponse,
+    LLMRequest,
+    ReviewRequest,
+    ReviewRequestResponse,
+    ReviewRequestResponseBody,
+)
+from app.services.event_bus import event_bus, review_event_topics
+from app.services.llm_client import review_code
+from app.services.principal import CurrentUser, principal_cache
+from app.services.review_service import save_review_result
+
+EventCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class ReviewRequestError(Exception):
+    """요청 자체가 잘못된 경우 (HTTP 에서는 status_code 그대로 응답)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def normalize_code(code: str) -> str:
+    if not code:
+        return ""
+    code = code.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.strip() for line in code.split("\n") if line.strip())
+
+
+def make_code_fingerprint(code: str) -> str:
+    normalized = normalize_code(code)
+    return sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def build_audit_value(audit_dt: datetime | None) -> str:
+    """UTC → KST 변환 후 ISO 문자열 반환"""
+    if not audit_dt:
+        audit_dt = datetime.now(timezone.utc)
+    kst = audit_dt.astimezone(timezone(timedelta(hours=9)))
+    return kst.isoformat().replace("+09:00", "")
+
+
+async def emit_review_event(event_type: str, payload: dict) -> None:
+    await event_bus.publish(
+        {"type": event_type, "payload": payload},
+        topics=review_event_topics(payload),
+    )
+
+
+def _model_name(raw_model: Any) -> str:
+    if not raw_model:
+        return "unknown"
+    if isinstance(raw_model, dict):
+        return raw_model.get("name") or "unknown"
+    return getattr(raw_model, "name", None) or str(raw_model)
+
+
+def _aspects(raw_analysis: Any) -> list:
+    if isinstance(raw_analysis, dict):
+        aspects = raw_analysis.get("aspects") or []
+    else:
+        aspects = getattr(raw_analysis, "aspects", []) if raw_analysis else []
+    return aspects or []
+
+
+async def run_review_request(
+    session: AsyncSession,
+    envelope: ReviewRequest,
+    *,
+    user: Optional[CurrentUser] = None,
+    correlation_id: Optional[str] = None,
+    on_event: Optional[EventCallback] = None,
+) -> ReviewRequestResponse:
+    """
+    user: 이미 인증/조회한 유저 (없으면 meta.github_id 로 유저 캐시에서 찾는다).
+    correlation_id: 없으면 meta 의 값 (있다면).
+    """
+    meta = envelope.meta
+    body = envelope.body
+
+    if not body.snippet or not body.snippet.code:
+        raise ReviewRequestError(400, "code snippet is empty")
+
+    if user is None:
+        github_id = getattr(meta, "github_id", None)
+        if not github_id:
+            raise ReviewRequestError(400, "meta.github_id is required")
+        user = await principal_cache.get_user(session, github_id=github_id)
+        if user is None:
+            raise ReviewRequestError(400, "user not found for given github_id")
+
+    github_id = user.github_id
+    user_id = user.id
+    if correlation_id is None:
+        correlation_id = getattr(meta, "correlation_id", None)
+
+    model_id = _model_name(getattr(meta, "model", None))
+    language = getattr(meta, "language", "unknown")
+    trigger = getattr(meta, "trigger", "manual")
+    aspects = _aspects(getattr(meta, "analysis", None))
+
+    code_fingerprint = make_code_fingerprint(body.snippet.code)
+
+    async def emit(event_type: str, payload: dict) -> None:
+        await emit_review_event(event_type, payload)
+        if on_event is not None:
+            await on_event(event_type, payload)
+
+    await emit(
+        "review_request_received",
+        {
+            "correlation_id": correlation_id,
+            "github_id": github_id,
+            "user_id": user_id,
+            "language": language,
+            "model": model_id,
+            "trigger": trigger,
+            "aspects": aspects,
+            "code_fingerprint": code_fingerprint,
+        },
+    )
+
+    llm_req = LLMRequest(
+        code=body.snippet.code,
+        language=language,
+        model=model_id,
+        criteria=aspects,
+    )
+
+    await emit(
+        "llm_request_sent",
+        {
+            "correlation_id": correlation_id,
+            "github_id": github_id,
+            "user_id": user_id,
+            "model": model_id,
+            "language": language,
+        },
+    )
+
+    llm_res: LLMQualityResponse = await review_code(llm_req)
+
+    await emit(
+        "llm_response_received",
+        {
+            "correlation_id": correlation_id,
+            "github_id": github_id,
+            "user_id": user_id,
+            "model": model_id,
+            "language": language,
+            "quality_score": int(llm_res.quality_score),
+        },
+    )
+
+    # 코드 저장 동의는 캐시 (워커별, PRINCIPAL_USER_TTL) 가 아니라 저장하는 시점의 DB 값으로 판단한다
+    user_row = await session.get(User, user_id)
+    if user_row is None:
+        raise ReviewRequestError(400, "user not found")
+    raw_code_to_store = body.snippet.code if user_row.store_code else None
+
+    review: Review = await save_review_result(
+        session,
+        github_id=github_id,
+        model=model_id,
+        trigger=trigger,
+        language=language,
+        llm_result=llm_res,
+        code_fingerprint=code_fingerprint,
+        raw_code=raw_code_to_store,
+        user_id=user_id,
+    )
+
+    meta_row = await session.get(ReviewMeta, review.meta_id)
+    if meta_row and not meta_row.github_id:
+        meta_row.github_id = github_id
+        session.add(meta_row)
+
+    await emit(
+        "review_saved",
+        {
+            "correlation_id": correlation_id,
+            "github_id": github_id,
+            "review_id": int(review.id),
+            "user_id": user_id,
+        },
+    )
+
+    await session.commit()
+
+    await emit(
+        "review_completed",
+        {
+            "correlation_id": correlation_id,
+            "github_id": github_id,
+            "review_id": int(review.id),
+            "user_id": user_id,
+            "language": language,
+            "model": model_id,
+            "trigger": trigger,
+            "quality_score": int(llm_res.quality_score),
+            "summary": llm_res.review_summary,
+            "scores_by_category": llm_res.scores_by_category.model_dump(),
+        },
+    )
+
+    resp_meta = Meta(
+        github_id=github_id,
+        review_id=int(review.id),
+        version=getattr(meta, "version", "v1"),
+        actor="server",
+        language=language,
+        trigger=trigger,
+        code_fingerprint=code_fingerprint,
+        model=model_id,
+        result={"result_ref": str(review.id), "error_message": None},
+        audit=build_audit_value(datetime.now(timezone.utc)),
+    )
+
+    return ReviewRequestResponse(meta=resp_meta, body=ReviewRequestResponseBody(review_id=review.id))
@@ -1,12 +1,20 @@
 # app/services/review_service.py
 
-from datetime import datetime, timezone
-from typing import Optional
+import base64
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.review import Review, ReviewMeta, ReviewCategoryResult
+from app.models.review import CATEGORY_NAMES, Review, ReviewMeta, ReviewCategoryResult
 from app.schemas.review import LLMQualityResponse
+from app.services.fragment_cache import mark_fragments_dirty
+from app.services.stats_rollup import add_review_to_rollups
+from app.services.score_analytics import stage_review
+from app.utils.lru_cache import LRUCache
 
 
 async def save_review_result(
@@ -19,12 +27,14 @@ async def save_review_result(
     llm_result: LLMQualityResponse,
     code_fingerprint: Optional[str] = None,
     raw_code: Optional[str] = None,
+    user_id: Optional[int] = None,
 ) -> Review:
 
     now = datetime.now(timezone.utc)
 
     meta = ReviewMeta(
         github_id=github_id,
+        user_id=user_id,
         version="v1",
         language=language or "unknown",
         trigger=trigger or "manual",
@@ -35,17 +45,19 @@ async def save_review_result(
     session.add(meta)
     await session.flush()
 
+    scores = llm_result.scores_by_category.model_dump()
+    comments = llm_result.review_details or {}
+
     review = Review(
         meta_id=meta.id,
         quality_score=float(llm_result.quality_score),
         summary=llm_result.review_summary,
         code=raw_code,
+        **wide_category_values(scores, comments),
     )
     session.add(review)
     await session.flush()
-
-    scores = llm_result.scores_by_category.model_dump()
-    comments = llm_result.review_details or {}
+    mark_fragments_dirty(session)
 
     for category_name, score in scores.items():
         category_row = ReviewCategoryResult(
@@ -56,4 +68,297 @@ async def save_review_result(
         )
         session.add(category_row)
 
+    await add_review_to_rollups(
+        session,
+        audit=now,
+        model=model,
+        user_id=user_id,
+        quality_score=review.quality_score,
+        scores=scores,
+    )
+    stage_review(
+        session,
+        review_id=review.id,
+        audit=now,
+        model=model,
+        github_id=github_id,
+        language=meta.language,
+        trigger=meta.trigger,
+        quality_score=review.quality_score,
+        scores=scores,
+    )
+
     return review
+
+
+# ─────────────────────────────────────────
+#  조회용 헬퍼 (컬럼 프로젝션)
+# ─────────────────────────────────────────
+
+def review_owner_condition(user_ids: Iterable[int], github_ids: Iterable[str]):
+    """
+    유저들의 리뷰 (ReviewMeta 조건).
+    user_id 가 비어 있는 행 (마이그레이션이 못 채운 예전 행 / 유저가 생기기 전에 import 한 행) 은 github_id 로 찾는다.
+    """
+    return or_(
+        ReviewMeta.user_id.in_(list(user_ids)),
+        and_(ReviewMeta.user_id.is_(None), ReviewMeta.github_id.in_(list(github_ids))),
+    )
+
+
+def parse_include(include: Optional[str]) -> set[str]:
+    """`include=code,foo` 형태의 쿼리 파라미터를 set 으로 변환"""
+    if not include:
+        return set()
+    return {part.strip().lower() for part in include.split(",") if part.strip()}
+
+
+def review_list_columns(include_code: bool = False) -> list:
+    """
+    목록 조회용 컬럼 프로젝션.
+    ORM 객체를 만들지 않고 필요한 컬럼만 가져온다.
+    code(Text)는 include_code 일 때만 실제 값을 싣고, 아니면 존재 여부만 가져온다.
+    """
+    columns = [
+        Review.id.label("review_id"),
+        Review.quality_score,
+        Review.summary,
+        ReviewMeta.github_id,
+        ReviewMeta.model,
+        ReviewMeta.trigger,
+        ReviewMeta.language,
+        ReviewMeta.audit,
+        *category_columns(),
+    ]
+    if include_code:
+        columns.append(Review.code)
+    else:
+        columns.append(Review.code.isnot(None).label("has_code"))
+    return columns
+
+
+def wide_category_values(
+    scores: Dict[str, object],
+    comments: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """고정 카테고리 점수/코멘트를 Review 의 score_* / comment_* 컬럼 값으로 변환"""
+    comments = comments or {}
+    values: Dict[str, object] = {}
+    for name in CATEGORY_NAMES:
+        score = scores.get(name)
+        comment = comments.get(name)
+        values[f"score_{name}"] = float(score) if score is not None else None
+        values[f"comment_{name}"] = str(comment) if comment is not None else None
+    return values
+
+
+def category_columns() -> list:
+    """review 의 고정 카테고리 점수/코멘트 컬럼 목록"""
+    return [getattr(Review, f"score_{name}") for name in CATEGORY_NAMES] + [
+        getattr(Review, f"comment_{name}") for name in CATEGORY_NAMES
+    ]
+
+
+def split_categories(row) -> Tuple[Dict[str, int], Dict[str, str]]:
+    """
+    score_* / comment_* 컬럼을 가진 row (Row 또는 Review) 를
+    (scores_by_category, comments) 두 dict 로 나눈다. 없는 값은 0 / "".
+    """
+    scores: Dict[str, int] = {}
+    comments: Dict[str, str] = {}
+    for name in CATEGORY_NAMES:
+        score = getattr(row, f"score_{name}", None)
+        scores[name] = int(score) if score is not None else 0
+        comments[name] = getattr(row, f"comment_{name}", None) or ""
+    return scores, comments
+
+
+async def review_collection_version(session: AsyncSession, *conditions) -> Tuple[int, int]:
+    """
+    리뷰 컬렉션의 버전 값 (리뷰 수, 최신 review.id).
+    리뷰는 저장 후 바뀌지 않고 id 도 재사용되지 않으므로
+    insert / delete 가 있으면 둘 중 하나는 반드시 달라진다.
+    conditions 에 ReviewMeta 조건을 넘기면 그 범위만 본다.
+    """
+    stmt = select(func.count(Review.id), func.max(Review.id))
+    if conditions:
+        stmt = (
+            stmt.select_from(Review)
+            .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+            .where(*conditions)
+        )
+    count, max_id = (await session.execute(stmt)).one()
+    return int(count or 0), int(max_id or 0)
+
+
+# ─────────────────────────────────────────
+#  목록 페이지 (keyset 커서)
+# ─────────────────────────────────────────
+
+# 커서: 이전 페이지 마지막 행의 (audit, meta id, review id)
+ReviewCursor = Tuple[Optional[datetime], int, int]
+
+
+def encode_review_cursor(row) -> str:
+    audit = row.audit.isoformat() if row.audit else None
+    raw = json.dumps([audit, int(row.meta_id), int(row.review_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_review_cursor(cursor: Optional[str]) -> Optional[ReviewCursor]:
+    """잘못된 커서는 None (첫 페이지)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        audit, meta_id, review_id = json.loads(raw)
+        return (datetime.fromisoformat(audit) if audit else None), int(meta_id), int(review_id)
+    except (ValueError, TypeError):
+        return None
+
+
+def _after_cursor(cursor: ReviewCursor):
+    """
+    (audit DESC, meta id DESC, review id DESC) 순서에서 커서 다음 행들.
+    MySQL / SQLite 는 DESC 정렬에서 NULL audit 이 맨 뒤에 온다.
+    """
+    audit, meta_id, review_id = cursor
+    same_audit_tail = or_(
+        ReviewMeta.id < meta_id,
+        and_(ReviewMeta.id == meta_id, Review.id < review_id),
+    )
+    if audit is None:
+        return and_(ReviewMeta.audit.is_(None), same_audit_tail)
+    return or_(
+        ReviewMeta.audit < audit,
+        and_(ReviewMeta.audit == audit, same_audit_tail),
+        ReviewMeta.audit.is_(None),
+    )
+
+
+async def load_review_page(
+    session: AsyncSession,
+    *,
+    limit: int,
+    cursor: Optional[ReviewCursor] = None,
+    include_code: bool = False,
+    model: Optional[str] = None,
+    user_id: Optional[int] = None,
+    from_dt: Optional[datetime] = None,
+    to_dt: Optional[datetime] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    최신순 리뷰 목록 한 페이지와 다음 페이지 커서 (없으면 None).
+    OFFSET 대신 커서 이후만 읽으므로 테이블 크기와 상관없이 limit + 1 행만 읽는다.
+    to_dt 는 그 날짜까지 포함한다.
+    """
+    conditions = []
+    if model:
+        conditions.append(ReviewMeta.model == model)
+    if user_id is not None:
+        conditions.append(ReviewMeta.user_id == user_id)
+    if from_dt:
+        conditions.append(ReviewMeta.audit >= from_dt)
+    if to_dt:
+        conditions.append(ReviewMeta.audit < to_dt + timedelta(days=1))
+    if cursor is not None:
+        conditions.append(_after_cursor(cursor))
+
+    stmt = (
+        select(*review_list_columns(include_code), ReviewMeta.id.label("meta_id"))
+        .select_from(Review)
+        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+        .order_by(ReviewMeta.audit.desc(), ReviewMeta.id.desc(), Review.id.desc())
+        .limit(limit + 1)
+    )
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+
+    rows = (await session.execute(stmt)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_review_cursor(rows[-1])
+
+
+# ─────────────────────────────────────────
+#  리뷰 상세 문서 캐시
+# ─────────────────────────────────────────
+
+# 리뷰는 저장 후 바뀌지 않으므로 삭제 시에만 무효화하면 된다.
+# 워커가 여러 개면 다른 워커의 삭제는 보지 못하므로 TTL (기본 120초) 로 상한을 둔다.
+# REVIEW_DETAIL_CACHE_TTL=0 (만료 없음) 은 워커가 하나일 때만 쓸 것.
+review_detail_cache = LRUCache(
+    max_entries=int(os.getenv("REVIEW_DETAIL_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("REVIEW_DETAIL_CACHE_TTL", "120")),
+)
+
+
+async def load_review_detail(session: AsyncSession, review_id: int) -> Optional[Dict[str, Any]]:
+    """
+    리뷰 상세 문서 (meta + 본문 + code + 카테고리) 를 캐시에서 꺼내거나 DB 에서 만든다.
+    /ui/review/{id}, GET /v1/reviews/{id}, /v1/fix 가 같이 쓴다.
+    반환된 dict 는 캐시와 공유되므로 수정하지 말 것.
+    """
+    doc = review_detail_cache.get(review_id)
+    if doc is not None:
+        return doc
+
+    stmt = (
+        select(
+            Review.id.label("review_id"),
+            Review.quality_score,
+            Review.summary,
+            Review.code,
+            ReviewMeta.github_id,
+            ReviewMeta.version,
+            ReviewMeta.language,
+            ReviewMeta.trigger,
+            ReviewMeta.code_fingerprint,
+            ReviewMeta.model,
+            ReviewMeta.audit,
+            *category_columns(),
+        )
+        .select_from(Review)
+        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+        .where(Review.id == review_id)
+    )
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+
+    category_rows = (
+        await session.execute(
+            select(
+                ReviewCategoryResult.category,
+                ReviewCategoryResult.score,
+                ReviewCategoryResult.comment,
+            )
+            .where(ReviewCategoryResult.review_id == review_id)
+            .order_by(ReviewCategoryResult.id)
+        )
+    ).all()
+
+    scores, comments = split_categories(row)
+    doc = {
+        "review_id": int(row.review_id),
+        "github_id": row.github_id,
+        "version": row.version,
+        "language": row.language,
+        "trigger": row.trigger,
+        "code_fingerprint": row.code_fingerprint,
+        "model": row.model,
+        "audit": row.audit,
+        "quality_score": row.quality_score,
+        "summary": row.summary,
+        "code": row.code,
+        "scores_by_category": scores,
+        "comments": comments,
+        # 확장 카테고리까지 포함한 원본 행 (UI 상세 화면용)
+        "categories": [
+            {"category": c.category, "score": c.score, "comment": c.comment}
+            for c in category_rows
+        ],
+    }
+    review_detail_cache.set(review_id, doc)
+    return doc
@@ -0,0 +1,549 @@
+# app/services/sample_import.py
+"""
+샘플 리뷰 JSON 대량 import.
+
+- 입력은 스트리밍으로 읽는다: JSON 배열 / 단일 객체 / NDJSON (줄마다 객체) 모두 된다.
+  파일 전체를 메모리에 올리지 않고, 완성된 항목만 꺼내서 배치로 모은다.
+- 배치마다 review_meta / review 는 multi-row INSERT 로 넣고 id 를 한 번에 받는다.
+  RETURNING 을 지원하는 DB (sqlite / postgresql / mariadb) 는 RETURNING 으로,
+  MySQL 은 첫 id (LAST_INSERT_ID) + auto_increment_increment 로 계산한다
+  (행 수가 정해진 단순 multi-row INSERT 는 InnoDB 에서 연속된 id 를 받는다).
+- 롤업은 배치 안에서 합쳐 upsert 하고, SAMPLE_IMPORT_BATCH_SIZE 건마다 커밋한다.
+  중간에 실패하면 그 배치만 롤백되고 앞서 커밋한 배치는 남는다 (SampleImportError.result).
+- import_samples_parallel 은 배치를 여러 세션 (커넥션) 에 나눠 동시에 넣는다 (python -m app.cli import).
+  이때는 롤업 행을 두고 배치끼리 경합하지 않도록 rollups=False 로 넣고 끝난 뒤 한 번에 다시 만든다.
+"""
+import asyncio
+import codecs
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.review import Review, ReviewCategoryResult, ReviewMeta
+from app.services.fragment_cache import mark_fragments_dirty
+from app.services.principal import principal_cache
+from app.services.review_service import wide_category_values
+from app.services.score_analytics import stage_review
+from app.services.stats_rollup import add_reviews_to_rollups
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_IMPORT_BATCH_SIZE = int(os.getenv("SAMPLE_IMPORT_BATCH_SIZE", "500"))
+SAMPLE_IMPORT_BATCH_MAX = 5000
+# 동시에 넣는 배치 수 상한 (커넥션 풀 기본 크기 5 + overflow 10 안에서)
+SAMPLE_IMPORT_WORKERS_MAX = 8
+# MySQL 에서 INSERT 문 하나에 넣을 행 수 (max_allowed_packet / 파라미터 수)
+SAMPLE_IMPORT_INSERT_ROWS = 1000
+SAMPLE_IMPORT_CHUNK_SIZE = int(os.getenv("SAMPLE_IMPORT_CHUNK_SIZE", str(64 * 1024)))
+# 항목 하나가 이보다 길면 (또는 깨진 JSON 이 끝나지 않으면) 더 읽지 않고 실패
+SAMPLE_IMPORT_MAX_ITEM_CHARS = int(os.getenv("SAMPLE_IMPORT_MAX_ITEM_CHARS", str(16 * 1024 * 1024)))
+
+_WS = re.compile(r"[ \t\n\r]*")
+_NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+ReadFn = Callable[[int], Awaitable[bytes]]
+
+
+# ─────────────────────────────────────────
+#  스트리밍 파서
+# ─────────────────────────────────────────
+
+class SampleStreamParser:
+    """
+    바이트 조각을 feed() 로 받아 완성된 항목 (dict) 만 돌려준다. 끝나면 close().
+    - 최상위가 '[' 이면 배열의 항목들, 아니면 공백 / 줄바꿈으로 이어진 값들 (단일 객체, NDJSON)
+    - 인코딩은 ASCII 가 아닌 첫 바이트들로 정한다 (utf-8, BOM 허용. 안 되면 cp949)
+    """
+
+    def __init__(self, max_item_chars: int = SAMPLE_IMPORT_MAX_ITEM_CHARS):
+        self.max_item_chars = max_item_chars
+        self._decoder: Optional[codecs.IncrementalDecoder] = None
+        self._head = b""
+        self._decoder_json = json.JSONDecoder()
+        self._buf = ""
+        self._state = "start"
+        self.count = 0
+
+    def _decode(self, chunk: bytes, final: bool = False) -> str:
+        if self._decoder is None:
+            # 인코딩을 정하기 전에는 ASCII 부분만 그대로 읽는다 (두 인코딩에서 같다)
+            data = self._head + chunk
+            match = _NON_ASCII.search(data)
+            if match is None:
+                self._head = b""
+                return data.decode("ascii")
+            start = match.start()
+            rest = data[start:]
+            if len(rest) < 4 and not final:
+                self._head = rest
+                return data[:start].decode("ascii")
+            self._head = b""
+            try:
+                codecs.getincrementaldecoder("utf-8-sig")().decode(rest, final)
+                encoding = "utf-8-sig"
+            except UnicodeDecodeError:
+                encoding = "cp949"
+            self._decoder = codecs.getincrementaldecoder(encoding)()
+            return data[:start].decode("ascii") + self._decode(rest, final)
+
+        try:
+            return self._decoder.decode(chunk, final)
+        except UnicodeDecodeError as exc:
+            raise ValueError(f"인코딩을 읽을 수 없습니다: {exc}") from exc
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        self._buf += self._decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[dict]:
+        self._buf += self._decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state == "start":
+            raise ValueError("빈 파일입니다.")
+        if self._state in ("array_first", "array_next", "array_value"):
+            raise ValueError("JSON 배열이 닫히지 않았습니다.")
+        return items
+
+    def _item(self, value: Any) -> dict:
+        self.count += 1
+        if not isinstance(value, dict):
+            raise ValueError(f"{self.count}번째 항목이 JSON 객체가 아닙니다.")
+        return value
+
+    def _drain(self, final: bool) -> List[dict]:
+        items: List[dict] = []
+        buf = self._buf
+        pos = 0
+
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if pos >= len(buf):
+                break
+            ch = buf[pos]
+            state = self._state
+
+            if state == "start":
+                if ch == "[":
+                    self._state = "array_first"
+                    pos += 1
+                else:
+                    self._state = "values"
+                continue
+
+            if state == "array_first" and ch == "]":
+                self._state = "end"
+                pos += 1
+                continue
+
+            if state == "array_next":
+                if ch == ",":
+                    self._state = "array_value"
+                elif ch == "]":
+                    self._state = "end"
+                else:
+                    raise ValueError(f"JSON 배열 형식 오류 ({self.count}번째 항목 뒤)")
+                pos += 1
+                continue
+
+            if state == "end":
+                raise ValueError("JSON 배열 뒤에 다른 값이 있습니다.")
+
+            # 값 하나 (array_first / array_value / values)
+            try:
+                value, end = self._decoder_json.raw_decode(buf, pos)
+            except json.JSONDecodeError as exc:
+                if final:
+                    raise ValueError(f"JSON 파싱 오류 ({self.count + 1}번째 항목): {exc}") from exc
+                break
+            if end >= len(buf) and not final:
+                # 숫자 같은 값은 뒤가 더 올 수 있다
+                break
+            items.append(self._item(value))
+            pos = end
+            if state != "values":
+                self._state = "array_next"
+
+        self._buf = buf[pos:]
+        if len(self._buf) > self.max_item_chars:
+            raise ValueError(f"항목 하나가 너무 큽니다 (>{self.max_item_chars}자) 또는 JSON 이 깨졌습니다.")
+        return items
+
+
+async def iter_sample_items(read: ReadFn, chunk_size: int = SAMPLE_IMPORT_CHUNK_SIZE) -> AsyncIterator[dict]:
+    """read(n) (UploadFile.read 등) 으로 조각씩 읽으며 항목을 하나씩 낸다"""
+    parser = SampleStreamParser()
+    while True:
+        chunk = await read(chunk_size)
+        if not chunk:
+            break
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+# ─────────────────────────────────────────
+#  배치 insert
+# ─────────────────────────────────────────
+
+async def insert_returning_ids(session: AsyncSession, table: Table, rows: List[Dict[str, Any]]) -> List[int]:
+    """
+    rows 를 multi-row INSERT 로 넣고 rows 순서대로 새 id 목록을 돌려준다.
+    auto increment / sequence id 는 INSERT 된 행 순서대로 증가한다고 가정한다.
+    """
+    if not rows:
+        return []
+    dialect = session.get_bind().dialect
+
+    if dialect.insert_returning:
+        # executemany + RETURNING: SQLAlchemy 가 multi-row INSERT ... RETURNING 으로 묶어 보낸다
+        result = await session.execute(insert(table).returning(table.c.id), rows)
+        return sorted(result.scalars())
+
+    # MySQL: RETURNING 이 없으므로 INSERT 문마다 LAST_INSERT_ID (첫 행 id) 에서 계산
+    step = int((await session.execute(text("SELECT @@auto_increment_increment"))).scalar() or 1)
+    ids: List[int] = []
+    for start in range(0, len(rows), SAMPLE_IMPORT_INSERT_ROWS):
+        chunk = rows[start:start + SAMPLE_IMPORT_INSERT_ROWS]
+        result = await session.execute(insert(table).values(chunk))
+        ids += [result.lastrowid + i * step for i in range(len(chunk))]
+    return ids
+
+
+def _parse_audit(raw: Any) -> Optional[datetime]:
+    if not raw:
+        return None
+    try:
+        # "2025-12-03T15:48:11" 형태라고 가정
+        return datetime.fromisoformat(raw)
+    except Exception:
+        return None  # 포맷 이상하면 그냥 None
+
+
+async def insert_sample_batch(
+    session: AsyncSession,
+    items: List[dict],
+    *,
+    github_id: str,
+    user_id: Optional[int],
+    rollups: bool = True,
+) -> List[int]:
+    """
+    항목 배치를 review_meta / review / review_category_result / 롤업에 넣는다 (커밋은 호출한 쪽).
+    rollups=False 면 롤업 / 점수 스냅샷은 건드리지 않는다 (끝난 뒤 rebuild_rollups 로 다시 만들 때).
+    """
+    metas: List[Dict[str, Any]] = []
+    parsed = []
+    for payload in items:
+        meta_json = payload.get("meta") or {}
+        body_json = payload.get("body") or {}
+        audit = _parse_audit(meta_json.get("audit"))
+
+        # github_id 는 UI에서 받은 값으로 강제 세팅
+        metas.append({
+            "github_id": github_id,
+            "user_id": user_id,
+            "version": meta_json.get("version") or "v1",
+            "language": meta_json.get("language") or "plaintext",
+            "trigger": meta_json.get("trigger") or "manual",
+            "code_fingerprint": meta_json.get("code_fingerprint") or "",
+            "model": meta_json.get("model") or "",
+            "audit": audit,
+        })
+        parsed.append((
+            audit,
+            body_json,
+            body_json.get("scores_by_category") or {},
+            body_json.get("comments") or {},
+        ))
+
+    meta_ids = await insert_returning_ids(session, ReviewMeta.__table__, metas)
+
+    review_rows = [
+        {
+            "meta_id": meta_id,
+            "quality_score": body_json.get("quality_score"),
+            "summary": body_json.get("summary"),
+            "code": body_json.get("code"),
+            **wide_category_values(scores, comments),
+        }
+        for meta_id, (_, body_json, scores, comments) in zip(meta_ids, parsed)
+    ]
+    review_ids = await insert_returning_ids(session, Review.__table__, review_rows)
+    mark_fragments_dirty(session)
+
+    category_rows = [
+        {
+            "review_id": review_id,
+            "category": category,
+            "score": score,
+            "comment": comments.get(category),
+        }
+        for review_id, (_, _, scores, comments) in zip(review_ids, parsed)
+        for category, score in scores.items()
+    ]
+    if category_rows:
+        await session.execute(insert(ReviewCategoryResult.__table__), category_rows)
+
+    if not rollups:
+        return review_ids
+
+    await add_reviews_to_rollups(
+        session,
+        [
+            {
+                "audit": audit,
+                "model": meta["model"],
+                "user_id": user_id,
+                "quality_score": review["quality_score"],
+                "scores": scores,
+            }
+            for meta, review, (audit, _, scores, _) in zip(metas, review_rows, parsed)
+        ],
+    )
+    for review_id, meta, review, (audit, _, scores, _) in zip(review_ids, metas, review_rows, parsed):
+        stage_review(
+            session,
+            review_id=review_id,
+            audit=audit,
+            model=meta["model"],
+            github_id=github_id,
+            language=meta["language"],
+            trigger=meta["trigger"],
+            quality_score=review["quality_score"],
+            scores=scores,
+        )
+
+    return review_ids
+
+
+# ─────────────────────────────────────────
+#  import 전체
+# ─────────────────────────────────────────
+
+@dataclass
+class SampleImportResult:
+    inserted: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> Optional[float]:
+        """초당 건수"""
+        return round(self.inserted / self.elapsed, 1) if self.elapsed > 0 else None
+
+
+ProgressFn = Callable[[SampleImportResult], Awaitable[None]]
+BatchFn = Callable[[int], Awaitable[None]]
+
+
+class SampleImportError(Exception):
+    """import 도중 실패. result 는 실패 전까지 커밋된 만큼"""
+
+    def __init__(self, message: str, result: SampleImportResult):
+        super().__init__(message)
+        self.result = result
+
+
+def clamp_batch_size(batch_size: Optional[int]) -> int:
+    if not batch_size or batch_size < 1:
+        return SAMPLE_IMPORT_BATCH_SIZE
+    return min(batch_size, SAMPLE_IMPORT_BATCH_MAX)
+
+
+def clamp_workers(workers: Optional[int]) -> int:
+    if not workers or workers < 1:
+        return 1
+    return min(workers, SAMPLE_IMPORT_WORKERS_MAX)
+
+
+async def import_samples(
+    session: AsyncSession,
+    items: AsyncIterator[dict],
+    *,
+    github_id: str,
+    batch_size: Optional[int] = None,
+    skip: int = 0,
+    on_batch: Optional[BatchFn] = None,
+    on_progress: Optional[ProgressFn] = None,
+) -> SampleImportResult:
+    """
+    items 를 batch_size 건씩 넣고 커밋한다. github_id 에 해당하는 유저가 없으면 user_id 없이 저장한다.
+    - skip: 앞에서부터 건너뛸 항목 수 (이어서 import 할 때 이미 커밋된 만큼)
+    - on_batch(inserted): 배치를 넣은 뒤 커밋 전에, 같은 트랜잭션 안에서 부른다 (체크포인트 저장용).
+      예외를 내면 그 배치는 롤백된다.
+    - on_progress(result): 커밋할 때마다 부른다.
+    """
+    batch_size = clamp_batch_size(batch_size)
+    result = SampleImportResult()
+    started = time.monotonic()
+
+    user = await principal_cache.get_user(session, github_id=github_id)
+    user_id = user.id if user else None
+
+    async def flush(batch: List[dict]) -> None:
+        await insert_sample_batch(session, batch, github_id=github_id, user_id=user_id)
+        if on_batch is not None:
+            await on_batch(result.inserted + len(batch))
+        await session.commit()
+        result.inserted += len(batch)
+        result.batches += 1
+        result.elapsed = time.monotonic() - started
+        logger.info(
+            "[sample_import] github_id=%s inserted=%d batches=%d (%.1f/s)",
+            github_id, result.inserted, result.batches, result.rate or 0,
+        )
+        if on_progress is not None:
+            await on_progress(result)
+
+    batch: List[dict] = []
+    try:
+        async for item in items:
+            if skip > 0:
+                skip -= 1
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+    except Exception as exc:
+        await session.rollback()
+        result.elapsed = time.monotonic() - started
+        raise SampleImportError(str(exc), result) from exc
+
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+@dataclass
+class ParallelImportResult(SampleImportResult):
+    # 앞에서부터 빠짐없이 커밋된 항목 수 (실패 후 이어서 할 때 skip 값)
+    committed_prefix: int = 0
+    # committed_prefix 뒤에 이미 커밋된 배치의 시작 위치 (이어서 할 때 done_offsets 로 넘긴다)
+    committed_offsets: List[int] = field(default_factory=list)
+
+
+async def import_samples_parallel(
+    session_factory: async_sessionmaker,
+    items: AsyncIterator[dict],
+    *,
+    github_id: str,
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    skip: int = 0,
+    done_offsets: Iterable[int] = (),
+    rollups: bool = True,
+    on_progress: Optional[ProgressFn] = None,
+) -> ParallelImportResult:
+    """
+    items 를 batch_size 건씩 잘라 workers 개의 세션이 동시에 넣고 배치마다 커밋한다.
+    배치가 커밋되는 순서는 정해져 있지 않으므로, 실패하면 committed_prefix 이후에도
+    먼저 끝난 배치가 남아 있을 수 있다. 그 배치들의 시작 위치는 result.committed_offsets 에 있고,
+    이어서 할 때 skip=committed_prefix, done_offsets=committed_offsets (같은 batch_size) 로 넘기면
+    그 배치는 건너뛴다.
+    """
+    batch_size = clamp_batch_size(batch_size)
+    workers = clamp_workers(workers)
+    result = ParallelImportResult(committed_prefix=skip)
+    started = time.monotonic()
+    done_offsets = {offset for offset in done_offsets if offset >= skip}
+
+    async with session_factory() as session:
+        user = await principal_cache.get_user(session, github_id=github_id)
+    user_id = user.id if user else None
+
+    queue: "asyncio.Queue[Optional[tuple]]" = asyncio.Queue(maxsize=workers * 2)
+    done_sizes: Dict[int, int] = {}
+    next_index = 0
+
+    def mark_done(index: int, size: int) -> None:
+        nonlocal next_index
+        done_sizes[index] = size
+        while next_index in done_sizes:
+            result.committed_prefix += done_sizes.pop(next_index)
+            next_index += 1
+
+    async def worker() -> None:
+        async with session_factory() as session:
+            while True:
+                job = await queue.get()
+                if job is None:
+                    return
+                index, batch = job
+                try:
+                    await insert_sample_batch(session, batch, github_id=github_id, user_id=user_id, rollups=rollups)
+                    await session.commit()
+                except BaseException:
+                    await session.rollback()
+                    raise
+
+                result.inserted += len(batch)
+                result.batches += 1
+                result.elapsed = time.monotonic() - started
+                mark_done(index, len(batch))
+                if on_progress is not None:
+                    await on_progress(result)
+
+    read_error: List[Exception] = []
+
+    async def put(index: int, batch: List[dict]) -> None:
+        if skip + index * batch_size in done_offsets:
+            # 지난번 실행에서 이미 커밋된 배치
+            mark_done(index, len(batch))
+            return
+        await queue.put((index, batch))
+
+    async def produce() -> None:
+        index = 0
+        remaining = skip
+        batch: List[dict] = []
+        try:
+            async for item in items:
+                if remaining > 0:
+                    remaining -= 1
+                    continue
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    await put(index, batch)
+                    index += 1
+                    batch = []
+            if batch:
+                await put(index, batch)
+        except Exception as exc:
+            # 읽기 실패: 이미 읽은 배치까지는 넣고 멈춘다 (import_samples 와 같게)
+            read_error.append(exc)
+        for _ in range(workers):
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(produce())] + [asyncio.create_task(worker()) for _ in range(workers)]
+    try:
+        # 배치를 넣다가 실패하면 나머지 (읽기 / 넣는 중인 배치) 를 멈춘다
+        finished, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in finished:
+            if task.exception() is not None:
+                raise task.exception()
+        if read_error:
+            raise read_error[0]
+    except Exception as exc:
+        result.elapsed = time.monotonic() - started
+        raise SampleImportError(str(exc), result) from exc
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # prefix 뒤에 커밋된 배치 = 이번에 먼저 끝난 배치 + 지난번 것 중 아직 prefix 에 안 들어간 배치
+        committed = {skip + index * batch_size for index in done_sizes} | done_offsets
+        result.committed_offsets = sorted(offset for offset in committed if offset >= result.committed_prefix)
+
+    result.elapsed = time.monotonic() - started
+    return result
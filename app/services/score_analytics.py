@@ -0,0 +1,383 @@
+# app/services/score_analytics.py
+"""
+점수 분포 분석 (백분위 / 히스토그램) 용 인메모리 컬럼 스냅샷.
+
+- (audit, model, github_id, language, trigger, quality_score, 카테고리 점수 4개) 를
+  NumPy 배열로 들고 있고, group-by / percentile / histogram 을 벡터 연산으로 계산한다.
+- save_review_result 가 stage_review 로 올려둔 행은 커밋된 뒤에만 스냅샷에 붙는다
+  (after_commit 이벤트, 롤백되면 버린다).
+- 다른 워커에서 저장/삭제된 리뷰는 조회 때 rollup_version 을 비교해서 감지한다.
+  새로 생긴 리뷰는 마지막으로 본 max id 이후 행만 가져와 붙이고, 늘어난 리뷰 수와
+  가져온 행 수가 맞지 않을 때 (다른 곳에서 삭제가 있었을 때) 만 전체를 다시 적재한다.
+- numpy 가 없으면 available() 이 False 이고 엔드포인트는 503 을 돌려준다.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.review import CATEGORY_NAMES, Review, ReviewMeta
+from app.services.stats_rollup import rollup_version
+
+try:
+    import numpy as np
+except ImportError:  # numpy 가 없으면 분석 엔드포인트만 비활성화
+    np = None
+
+
+METRICS: Tuple[str, ...] = ("total",) + CATEGORY_NAMES
+GROUP_FIELDS: Tuple[str, ...] = ("model", "github_id", "language", "trigger")
+
+# audit 가 없는 리뷰 (날짜 필터가 있으면 제외)
+_NO_AUDIT = -(2 ** 62)
+
+_PENDING_KEY = "score_analytics_pending"
+
+
+def available() -> bool:
+    return np is not None
+
+
+def _epoch(audit: Optional[datetime]) -> int:
+    if audit is None:
+        return _NO_AUDIT
+    if audit.tzinfo is None:
+        audit = audit.replace(tzinfo=timezone.utc)
+    return int(audit.timestamp())
+
+
+class _Dictionary:
+    """문자열 컬럼 사전 인코딩 (값 → int 코드). None 도 하나의 값으로 취급"""
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = []
+        self._codes: Dict[Optional[str], int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Optional[str]) -> Optional[int]:
+        return self._codes.get(value)
+
+
+class ScoreSnapshot:
+    """
+    리뷰 점수 컬럼 스냅샷. 용량을 두 배씩 늘리는 배열에 append 한다.
+    카테고리 점수가 없으면 NaN.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.size = 0
+        self.loads = 0
+        self.incremental_loads = 0
+        self.version: Optional[Tuple[int, int]] = None
+        self._lock = asyncio.Lock()
+        self._reset(capacity)
+
+    def _reset(self, capacity: int) -> None:
+        self.size = 0
+        self.max_id = 0
+        self.dicts = {field: _Dictionary() for field in GROUP_FIELDS}
+        if np is None:
+            return
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.audit = np.zeros(capacity, dtype=np.int64)
+        self.codes = {field: np.zeros(capacity, dtype=np.int32) for field in GROUP_FIELDS}
+        self.scores = {metric: np.zeros(capacity, dtype=np.float64) for metric in METRICS}
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+
+        def resize(arr):
+            out = np.zeros(capacity, dtype=arr.dtype)
+            out[: self.size] = arr[: self.size]
+            return out
+
+        self.ids = resize(self.ids)
+        self.audit = resize(self.audit)
+        self.codes = {k: resize(v) for k, v in self.codes.items()}
+        self.scores = {k: resize(v) for k, v in self.scores.items()}
+
+    # ─────────────────────────────────────────
+    #  쓰기
+    # ─────────────────────────────────────────
+
+    def append_rows(self, rows: Sequence[Dict[str, Any]]) -> None:
+        """rows: stage_review / _load_rows 가 만드는 dict 목록"""
+        if np is None or not rows:
+            return
+        start = self.size
+        self._grow(start + len(rows))
+
+        for offset, row in enumerate(rows):
+            i = start + offset
+            self.ids[i] = row["review_id"]
+            self.audit[i] = _epoch(row["audit"])
+            for field in GROUP_FIELDS:
+                self.codes[field][i] = self.dicts[field].encode(row[field])
+            for metric in METRICS:
+                value = row[metric]
+                self.scores[metric][i] = float(value) if value is not None else np.nan
+            self.max_id = max(self.max_id, int(row["review_id"]))
+
+        self.size = start + len(rows)
+        if self.version is not None:
+            self.version = (self.version[0] + len(rows), self.max_id)
+
+    def remove(self, review_ids: Iterable[int]) -> None:
+        review_ids = list(review_ids)
+        if np is None or not review_ids or self.size == 0:
+            return
+        n = self.size
+        keep = ~np.isin(self.ids[:n], np.asarray(review_ids, dtype=np.int64))
+        kept = int(keep.sum())
+
+        self.ids[:kept] = self.ids[:n][keep]
+        self.audit[:kept] = self.audit[:n][keep]
+        for arr in self.codes.values():
+            arr[:kept] = arr[:n][keep]
+        for arr in self.scores.values():
+            arr[:kept] = arr[:n][keep]
+
+        removed = n - kept
+        self.size = kept
+        self.max_id = int(self.ids[:kept].max()) if kept else 0
+        if self.version is not None:
+            self.version = (self.version[0] - removed, self.max_id)
+
+    def clear(self) -> None:
+        loaded = self.version is not None
+        self._reset(len(self.ids) if np is not None else 0)
+        self.version = (0, 0) if loaded else None
+
+    # ─────────────────────────────────────────
+    #  적재 / 동기화
+    # ─────────────────────────────────────────
+
+    async def _load_rows(
+        self,
+        session: AsyncSession,
+        after_id: Optional[int] = None,
+        upto_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """review id 순 행 목록. after_id < id <= upto_id 범위만 (주어진 경우)"""
+        stmt = (
+            select(
+                Review.id.label("review_id"),
+                ReviewMeta.audit,
+                ReviewMeta.model,
+                ReviewMeta.github_id,
+                ReviewMeta.language,
+                ReviewMeta.trigger,
+                Review.quality_score.label("total"),
+                *[getattr(Review, f"score_{name}").label(name) for name in CATEGORY_NAMES],
+            )
+            .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+            .order_by(Review.id)
+        )
+        if after_id is not None:
+            stmt = stmt.where(Review.id > after_id)
+        if upto_id is not None:
+            stmt = stmt.where(Review.id <= upto_id)
+        result = await session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def sync(self, session: AsyncSession, version: Optional[Tuple[int, int]] = None) -> None:
+        """
+        DB 버전 (rollup_version, 이미 구했으면 넘긴다) 과 맞춘다.
+        추가만 있었으면 새 행만 붙이고, 삭제가 섞였거나 처음 조회면 전체를 다시 적재한다.
+        """
+        if version is None:
+            version = await rollup_version(session)
+        if version == self.version:
+            return
+        async with self._lock:
+            if version == self.version:
+                return
+            if self.version is not None and version[1] >= self.max_id:
+                rows = await self._load_rows(session, after_id=self.max_id, upto_id=version[1])
+                if len(rows) == version[0] - self.version[0]:
+                    self.append_rows(rows)
+                    self.version = version
+                    self.incremental_loads += 1
+                    return
+            rows = await self._load_rows(session)
+            self._reset(max(1024, len(rows)))
+            self.append_rows(rows)
+            self.version = version
+            self.loads += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "available": available(),
+            "rows": self.size,
+            "loads": self.loads,
+            "incremental_loads": self.incremental_loads,
+            "version": list(self.version) if self.version else None,
+        }
+
+    # ─────────────────────────────────────────
+    #  조회 (벡터 연산)
+    # ─────────────────────────────────────────
+
+    def _mask(
+        self,
+        from_dt: Optional[datetime],
+        to_dt: Optional[datetime],
+        filters: Dict[str, Optional[str]],
+    ):
+        n = self.size
+        mask = np.ones(n, dtype=bool)
+        audit = self.audit[:n]
+        if from_dt or to_dt:
+            mask &= audit != _NO_AUDIT
+        if from_dt:
+            mask &= audit >= _epoch(from_dt)
+        if to_dt:
+            mask &= audit < _epoch(to_dt + timedelta(days=1))
+        for field, value in filters.items():
+            if value is None:
+                continue
+            code = self.dicts[field].lookup(value)
+            if code is None:
+                return np.zeros(n, dtype=bool)
+            mask &= self.codes[field][:n] == code
+        return mask
+
+    def _groups(self, group_by: Optional[str], mask):
+        """(key, 행 index 배열) 목록. group_by 가 없으면 전체 한 그룹"""
+        idx = np.flatnonzero(mask)
+        if group_by is None:
+            return [(None, idx)] if len(idx) else []
+        codes = self.codes[group_by][idx]
+        order = np.argsort(codes, kind="stable")
+        idx, codes = idx[order], codes[order]
+        uniq, starts = np.unique(codes, return_index=True)
+        parts = np.split(idx, starts[1:])
+        values = self.dicts[group_by].values
+        return [(values[code], part) for code, part in zip(uniq.tolist(), parts)]
+
+    def percentiles(
+        self,
+        *,
+        group_by: Optional[str],
+        quantiles: Sequence[float],
+        from_dt: Optional[datetime] = None,
+        to_dt: Optional[datetime] = None,
+        filters: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """그룹별, 지표별 count / mean / 백분위"""
+        mask = self._mask(from_dt, to_dt, filters or {})
+        q = np.asarray(quantiles, dtype=np.float64)
+        items = []
+        for key, idx in self._groups(group_by, mask):
+            metrics = {}
+            for metric in METRICS:
+                values = self.scores[metric][idx]
+                values = values[~np.isnan(values)]
+                if len(values) == 0:
+                    metrics[metric] = {"count": 0, "mean": None, "percentiles": {}}
+                    continue
+                points = np.percentile(values, q)
+                metrics[metric] = {
+                    "count": int(len(values)),
+                    "mean": float(values.mean()),
+                    "percentiles": {
+                        f"p{quantile:g}": float(point)
+                        for quantile, point in zip(quantiles, points)
+                    },
+                }
+            items.append({"key": key, "review_count": int(len(idx)), "metrics": metrics})
+        return items
+
+    def histogram(
+        self,
+        *,
+        metric: str,
+        group_by: Optional[str],
+        bins: int,
+        value_range: Optional[Tuple[float, float]] = None,
+        from_dt: Optional[datetime] = None,
+        to_dt: Optional[datetime] = None,
+        filters: Optional[Dict[str, Optional[str]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        그룹별 히스토그램. 그룹끼리 비교할 수 있도록 구간 경계는 모든 그룹이 공유한다
+        (value_range 가 없으면 필터된 전체 값의 min ~ max).
+        """
+        mask = self._mask(from_dt, to_dt, filters or {})
+        values_all = self.scores[metric][: self.size]
+        valid = mask & ~np.isnan(values_all)
+
+        if value_range is None:
+            if not valid.any():
+                return {"edges": [], "data": []}
+            lo, hi = float(values_all[valid].min()), float(values_all[valid].max())
+            value_range = (lo, hi if hi > lo else lo + 1.0)
+        edges = np.histogram_bin_edges(values_all[valid], bins=bins, range=value_range)
+
+        data = []
+        for key, idx in self._groups(group_by, valid):
+            counts, _ = np.histogram(values_all[idx], bins=edges)
+            data.append({"key": key, "count": int(len(idx)), "counts": counts.tolist()})
+        return {"edges": edges.tolist(), "data": data}
+
+
+score_snapshot = ScoreSnapshot()
+
+
+# ─────────────────────────────────────────
+#  커밋 연동
+# ─────────────────────────────────────────
+
+def stage_review(
+    session: AsyncSession,
+    *,
+    review_id: int,
+    audit: Optional[datetime],
+    model: Optional[str],
+    github_id: Optional[str],
+    language: Optional[str],
+    trigger: Optional[str],
+    quality_score: Optional[float],
+    scores: Dict[str, Any],
+) -> None:
+    """커밋되면 스냅샷에 붙일 리뷰를 세션에 올려둔다"""
+    if np is None:
+        return
+    row = {
+        "review_id": review_id,
+        "audit": audit,
+        "model": model,
+        "github_id": github_id,
+        "language": language,
+        "trigger": trigger,
+        "total": quality_score,
+    }
+    for name in CATEGORY_NAMES:
+        row[name] = scores.get(name)
+    session.info.setdefault(_PENDING_KEY, []).append(row)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows and score_snapshot.version is not None:
+        score_snapshot.append_rows(rows)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
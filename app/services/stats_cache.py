@@ -0,0 +1,91 @@
+# app/services/stats_cache.py
+"""
+통계 응답 캐시 (by-model / by-user / timeseries).
+
+- 키는 정규화한 쿼리 파라미터 (from, to, model, limit ...).
+- 통계에 영향을 주는 쓰기 (롤업 갱신) 가 커밋되면 generation 을 올려서 기존 엔트리를 무효화한다.
+  롤업 헬퍼가 mark_stats_dirty 로 세션에 표시하고, after_commit 에서 올린다.
+- 다른 워커의 쓰기는 알 수 없으므로 STATS_CACHE_MAX_STALENESS 초가 지나면 다시 계산한다.
+"""
+import os
+from datetime import datetime
+from typing import Any, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.utils.lru_cache import LRUCache
+
+STATS_CACHE_SIZE = int(os.getenv("STATS_CACHE_SIZE", "256"))
+STATS_CACHE_MAX_STALENESS = float(os.getenv("STATS_CACHE_MAX_STALENESS", "30"))
+
+_DIRTY_KEY = "stats_cache_dirty"
+
+
+class StatsCache:
+    """
+    키 앞에 generation 을 붙여서 저장한다. generation 이 오르면 기존 엔트리는
+    더 이상 조회되지 않고 LRU / TTL 로 밀려난다.
+    """
+
+    def __init__(self, max_entries: int, max_staleness: float) -> None:
+        self._entries = LRUCache(max_entries=max_entries, ttl=max_staleness)
+        self.generation = 0
+
+    def bump(self) -> None:
+        self.generation += 1
+
+    def get(self, key: Hashable) -> Any:
+        return self._entries.get((self.generation, key))
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """generation: 계산을 시작할 때 읽어둔 값 (도중에 쓰기가 있었으면 저장하지 않는다)"""
+        if generation != self.generation:
+            return
+        self._entries.set((generation, key), value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {**self._entries.stats(), "generation": self.generation}
+
+
+stats_cache = StatsCache(STATS_CACHE_SIZE, STATS_CACHE_MAX_STALENESS)
+
+
+def stats_cache_key(
+    name: str,
+    from_dt: Optional[datetime],
+    to_dt: Optional[datetime],
+    *params: Any,
+) -> Tuple[Any, ...]:
+    """날짜는 date 로, 빈 문자열은 None 으로 맞춰서 같은 조회가 같은 키가 되게 한다"""
+    normalized = []
+    for value in params:
+        if isinstance(value, str):
+            value = value.strip() or None
+        normalized.append(value)
+    return (
+        name,
+        from_dt.date() if from_dt else None,
+        to_dt.date() if to_dt else None,
+        *normalized,
+    )
+
+
+def mark_stats_dirty(session: AsyncSession) -> None:
+    """이 세션이 커밋되면 통계 캐시를 무효화한다"""
+    session.info[_DIRTY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    if session.info.pop(_DIRTY_KEY, False):
+        stats_cache.bump()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_dirty(session: Session, previous_transaction) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,253 @@
+# app/services/stats_rollup.py
+"""
+일별 통계 롤업 (review_stats_daily_model / review_stats_daily_user).
+
+- save_review_result 가 같은 트랜잭션 안에서 +1 델타를 upsert 한다 (대량 import 는 배치 단위로 합쳐서).
+- 삭제 경로는 지우기 전에 대상 리뷰들의 집계를 빼고 (-델타), 0 이 된 행을 정리한다.
+- rebuild_rollups 는 review / review_meta 전체에서 다시 만든다 (backfill 용).
+- 롤업을 바꾸는 함수는 모두 mark_stats_dirty 를 호출한다 (커밋 시 통계 캐시 무효화).
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.review import CATEGORY_NAMES, Review, ReviewMeta
+from app.models.review_stats import ReviewDailyModelStats, ReviewDailyUserStats
+from app.services.stats_cache import mark_stats_dirty
+
+# audit 가 없는 리뷰는 이 날짜로 모은다 (날짜 필터가 있으면 제외)
+UNDATED_DAY = date(1970, 1, 1)
+
+METRIC_COLUMNS: Tuple[str, ...] = ("review_count", "sum_total") + tuple(
+    col for name in CATEGORY_NAMES for col in (f"sum_{name}", f"cnt_{name}")
+)
+
+# 롤업 테이블 → 키 컬럼 (day 제외)
+ROLLUP_KEYS: Dict[Type, Tuple[str, ...]] = {
+    ReviewDailyModelStats: ("model",),
+    ReviewDailyUserStats: ("user_id", "model"),
+}
+
+# 키 컬럼이 NULL 일 때 저장할 값
+KEY_DEFAULTS: Dict[str, Any] = {"model": "", "user_id": 0}
+
+
+def _day_expr():
+    return func.coalesce(func.date(ReviewMeta.audit), UNDATED_DAY)
+
+
+def _key_expr(key: str):
+    return func.coalesce(getattr(ReviewMeta, key), KEY_DEFAULTS[key])
+
+
+def aggregate_columns() -> list:
+    """METRIC_COLUMNS 순서와 같은 집계 컬럼 목록"""
+    columns = [
+        func.count(Review.id).label("review_count"),
+        func.coalesce(func.sum(Review.quality_score), 0).label("sum_total"),
+    ]
+    for name in CATEGORY_NAMES:
+        score = getattr(Review, f"score_{name}")
+        columns.append(func.coalesce(func.sum(score), 0).label(f"sum_{name}"))
+        columns.append(func.count(score).label(f"cnt_{name}"))
+    return columns
+
+
+def _grouped_select(keys: Sequence[str], *conditions):
+    day = _day_expr()
+    key_exprs = [_key_expr(key) for key in keys]
+    stmt = (
+        select(
+            day.label("day"),
+            *[expr.label(key) for expr, key in zip(key_exprs, keys)],
+            *aggregate_columns(),
+        )
+        .select_from(Review)
+        .join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+        .group_by(day, *key_exprs)
+    )
+    if conditions:
+        stmt = stmt.where(*conditions)
+    return stmt
+
+
+async def _upsert_deltas(
+    session: AsyncSession,
+    table_cls: Type,
+    rows: List[Dict[str, Any]],
+) -> None:
+    """키가 같으면 METRIC_COLUMNS 를 더하고, 없으면 새로 넣는다"""
+    if not rows:
+        return
+
+    table = table_cls.__table__
+    dialect = session.get_bind().dialect.name
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+
+        stmt = dialect_insert(table).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            {col: table.c[col] + stmt.inserted[col] for col in METRIC_COLUMNS}
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+
+        stmt = dialect_insert(table).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["day", *ROLLUP_KEYS[table_cls]],
+            set_={col: table.c[col] + stmt.excluded[col] for col in METRIC_COLUMNS},
+        )
+
+    await session.execute(stmt)
+
+
+def _review_metrics(quality_score: Optional[float], scores: Dict[str, Any]) -> Dict[str, Any]:
+    metrics: Dict[str, Any] = {
+        "review_count": 1,
+        "sum_total": float(quality_score or 0),
+    }
+    for name in CATEGORY_NAMES:
+        score = scores.get(name)
+        metrics[f"sum_{name}"] = float(score) if score is not None else 0.0
+        metrics[f"cnt_{name}"] = 1 if score is not None else 0
+    return metrics
+
+
+async def add_reviews_to_rollups(session: AsyncSession, reviews: Iterable[Dict[str, Any]]) -> None:
+    """
+    리뷰 여러 건을 롤업에 더한다 (호출한 쪽 트랜잭션 안에서 실행).
+    reviews: audit / model / user_id / quality_score / scores 키를 가진 dict.
+    같은 (day, 키) 는 먼저 합쳐서 테이블마다 upsert 한 번으로 보낸다 (대량 import 용).
+    """
+    mark_stats_dirty(session)
+    deltas: Dict[Type, Dict[tuple, Dict[str, Any]]] = {table_cls: {} for table_cls in ROLLUP_KEYS}
+
+    for review in reviews:
+        metrics = _review_metrics(review.get("quality_score"), review.get("scores") or {})
+        audit = review.get("audit")
+        day = audit.date() if audit else UNDATED_DAY
+        keys = {
+            "model": review.get("model") or KEY_DEFAULTS["model"],
+            "user_id": review.get("user_id") or KEY_DEFAULTS["user_id"],
+        }
+
+        for table_cls, key_names in ROLLUP_KEYS.items():
+            group = (day, *[keys[k] for k in key_names])
+            row = deltas[table_cls].get(group)
+            if row is None:
+                deltas[table_cls][group] = {"day": day, **{k: keys[k] for k in key_names}, **metrics}
+                continue
+            for col in METRIC_COLUMNS:
+                row[col] += metrics[col]
+
+    for table_cls, rows in deltas.items():
+        await _upsert_deltas(session, table_cls, list(rows.values()))
+
+
+async def add_review_to_rollups(
+    session: AsyncSession,
+    *,
+    audit: Optional[datetime],
+    model: Optional[str],
+    user_id: Optional[int],
+    quality_score: Optional[float],
+    scores: Dict[str, Any],
+) -> None:
+    """리뷰 1건을 롤업에 더한다 (호출한 쪽 트랜잭션 안에서 실행)"""
+    await add_reviews_to_rollups(
+        session,
+        [{
+            "audit": audit,
+            "model": model,
+            "user_id": user_id,
+            "quality_score": quality_score,
+            "scores": scores,
+        }],
+    )
+
+
+async def subtract_reviews_from_rollups(session: AsyncSession, *conditions) -> None:
+    """
+    conditions (Review / ReviewMeta 조건) 에 걸리는 리뷰들을 롤업에서 뺀다.
+    반드시 실제 delete 보다 먼저, 같은 트랜잭션에서 호출할 것.
+    """
+    mark_stats_dirty(session)
+    for table_cls, key_names in ROLLUP_KEYS.items():
+        result = await session.execute(_grouped_select(key_names, *conditions))
+        rows = []
+        for row in result.mappings():
+            delta = dict(row)
+            for col in METRIC_COLUMNS:
+                delta[col] = -(delta[col] or 0)
+            rows.append(delta)
+        await _upsert_deltas(session, table_cls, rows)
+
+        await session.execute(delete(table_cls).where(table_cls.review_count <= 0))
+
+
+async def clear_rollups(session: AsyncSession) -> None:
+    mark_stats_dirty(session)
+    for table_cls in ROLLUP_KEYS:
+        await session.execute(delete(table_cls))
+
+
+async def rebuild_rollups(session: AsyncSession) -> None:
+    """롤업 테이블을 비우고 review / review_meta 전체에서 다시 집계한다"""
+    await clear_rollups(session)
+    for table_cls, key_names in ROLLUP_KEYS.items():
+        await session.execute(
+            insert(table_cls).from_select(
+                ["day", *key_names, *METRIC_COLUMNS],
+                _grouped_select(key_names),
+            )
+        )
+
+
+# ─────────────────────────────────────────
+#  조회용 헬퍼
+# ─────────────────────────────────────────
+
+def rollup_avg_columns(table_cls: Type) -> list:
+    """롤업 행들을 합쳐 review_count / avg_* 를 만드는 컬럼 목록"""
+    count = func.sum(table_cls.review_count)
+    columns = [
+        count.label("review_count"),
+        (func.sum(table_cls.sum_total) / func.nullif(count, 0)).label("avg_total"),
+    ]
+    for name in CATEGORY_NAMES:
+        total = func.sum(getattr(table_cls, f"sum_{name}"))
+        cnt = func.sum(getattr(table_cls, f"cnt_{name}"))
+        columns.append((total / func.nullif(cnt, 0)).label(f"avg_{name}"))
+    return columns
+
+
+def rollup_day_conditions(
+    table_cls: Type,
+    from_dt: Optional[datetime],
+    to_dt: Optional[datetime],
+    dated_only: bool = False,
+) -> list:
+    """from ~ to (포함) 날짜 필터. 날짜 필터가 있거나 dated_only 면 audit 없는 리뷰는 뺀다."""
+    conditions = []
+    if from_dt:
+        conditions.append(table_cls.day >= from_dt.date())
+    if to_dt:
+        conditions.append(table_cls.day < (to_dt + timedelta(days=1)).date())
+    if conditions or dated_only:
+        conditions.append(table_cls.day > UNDATED_DAY)
+    return conditions
+
+
+async def rollup_version(session: AsyncSession) -> Tuple[int, int]:
+    """통계용 버전 값 (롤업 기준 리뷰 수, 최신 review.id). 전체 스캔 없이 구한다."""
+    total = (
+        await session.execute(select(func.sum(ReviewDailyModelStats.review_count)))
+    ).scalar()
+    max_id = (await session.execute(select(func.max(Review.id)))).scalar()
+    return int(total or 0), int(max_id or 0)
@@ -0,0 +1,148 @@
+# app/services/stats_service.py
+"""
+모델별 / 유저별 통계 (롤업 기반, 통계 캐시 사용).
+
+/v1/reviews/stats/* 와 UI 통계 화면이 같이 쓴다. 반환값은
+(rollup_version, cache_key, items) 로, API 는 앞의 두 값으로 ETag 를 만든다.
+"""
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from sqlalchemy import and_, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.review_stats import ReviewDailyModelStats, ReviewDailyUserStats
+from app.models.user import User
+from app.services.stats_cache import stats_cache, stats_cache_key
+from app.services.stats_rollup import rollup_avg_columns, rollup_day_conditions, rollup_version
+
+StatsResult = Tuple[Tuple[int, int], Tuple[Any, ...], List[dict]]
+
+STATS_AVG_FIELDS = (
+    "avg_total",
+    "avg_bug",
+    "avg_maintainability",
+    "avg_style",
+    "avg_security",
+)
+
+
+def parse_date_utc(date_str: str | None) -> datetime | None:
+    if not date_str:
+        return None
+    dt = datetime.strptime(date_str, "%Y-%m-%d")
+    return dt.replace(tzinfo=timezone.utc)
+
+
+def _stats_item_dict(row, *keys: str) -> dict:
+    """통계 row 튜플 → ModelStatsItem / UserStatsItem 모양의 dict"""
+    item = {key: getattr(row, key) for key in keys}
+    item["review_count"] = int(row.review_count or 0)
+    for key in STATS_AVG_FIELDS:
+        value = getattr(row, key)
+        item[key] = float(value) if value is not None else None
+    return item
+
+
+async def cached_stats(
+    session: AsyncSession,
+    cache_key: tuple,
+    load: Callable[[], Awaitable[List[dict]]],
+) -> Tuple[Tuple[int, int], List[dict]]:
+    """
+    (rollup_version, items) 를 통계 캐시에서 꺼내거나 load() 로 계산해서 넣는다.
+    캐시 hit 이면 DB 에 전혀 접근하지 않는다.
+    """
+    entry = stats_cache.get(cache_key)
+    if entry is None:
+        generation = stats_cache.generation
+        version = await rollup_version(session)
+        items = await load()
+        entry = (version, items)
+        stats_cache.set(cache_key, entry, generation)
+    return entry
+
+
+async def _load_model_stats(session: AsyncSession, from_dt, to_dt) -> list[dict]:
+    # 전체 이력 대신 (day, model) 롤업 행만 합산
+    stmt = (
+        select(
+            ReviewDailyModelStats.model.label("model"),
+            *rollup_avg_columns(ReviewDailyModelStats),
+        )
+        .group_by(ReviewDailyModelStats.model)
+        .order_by(ReviewDailyModelStats.model)
+    )
+
+    conditions = rollup_day_conditions(ReviewDailyModelStats, from_dt, to_dt)
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    items = [_stats_item_dict(row, "model") for row in rows]
+    for item in items:
+        item["model"] = item["model"] or None
+    return items
+
+
+async def _load_user_stats(
+    session: AsyncSession, from_dt, to_dt, model: str | None, limit: int | None
+) -> list[dict]:
+    # 전체 이력 대신 (day, user_id, model) 롤업 행만 합산
+    conditions = rollup_day_conditions(ReviewDailyUserStats, from_dt, to_dt)
+    if model:
+        conditions.append(ReviewDailyUserStats.model == model)
+
+    avg_columns = rollup_avg_columns(ReviewDailyUserStats)
+    avg_total = avg_columns[1]
+
+    stmt = (
+        select(
+            User.id.label("user_id"),
+            User.github_id.label("github_id"),
+            *avg_columns,
+        )
+        .select_from(ReviewDailyUserStats)
+        .join(User, User.id == ReviewDailyUserStats.user_id)
+        .group_by(User.id, User.github_id)
+        .order_by(desc(avg_total))
+    )
+
+    if conditions:
+        stmt = stmt.where(and_(*conditions))
+    if limit:
+        stmt = stmt.limit(limit)
+
+    result = await session.execute(stmt)
+    rows = result.all()
+
+    return [_stats_item_dict(row, "user_id", "github_id") for row in rows]
+
+
+async def model_stats(
+    session: AsyncSession,
+    from_dt: Optional[datetime] = None,
+    to_dt: Optional[datetime] = None,
+) -> StatsResult:
+    cache_key = stats_cache_key("by-model", from_dt, to_dt)
+    version, items = await cached_stats(
+        session, cache_key, lambda: _load_model_stats(session, from_dt, to_dt)
+    )
+    return version, cache_key, items
+
+
+async def user_stats(
+    session: AsyncSession,
+    from_dt: Optional[datetime] = None,
+    to_dt: Optional[datetime] = None,
+    model: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> StatsResult:
+    model = (model or "").strip() or None
+    cache_key = stats_cache_key("by-user", from_dt, to_dt, model, limit)
+    version, items = await cached_stats(
+        session, cache_key, lambda: _load_user_stats(session, from_dt, to_dt, model, limit)
+    )
+    return version, cache_key, items
@@ -0,0 +1,183 @@
+# app/services/stats_timeseries.py
+"""
+버킷(hour / day / week) 단위 시계열 통계.
+
+- day / week + (그룹 없음 | model | user) 는 일별 롤업 행에서 바로 합산한다.
+- hour 버킷이나 language / trigger 그룹은 review 에서 한 번의 GROUP BY 로 구한다.
+- 어느 쪽이든 합계/개수를 가져와 파이썬에서 버킷으로 접은 뒤 평균을 낸다
+  (week 는 day 단위 결과를 월요일 기준으로 접는다). 시각은 모두 UTC 기준.
+- user 그룹의 키는 두 경로 모두 review_meta.user_id → user.github_id 이다.
+  (롤업이 user_id 로 모으므로) 연결된 유저가 없는 리뷰는 key None 으로 모인다.
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.review import CATEGORY_NAMES, Review, ReviewMeta
+from app.models.review_stats import ReviewDailyModelStats, ReviewDailyUserStats
+from app.models.user import User
+from app.services.stats_rollup import (
+    METRIC_COLUMNS,
+    aggregate_columns,
+    rollup_day_conditions,
+)
+
+BUCKETS = ("hour", "day", "week")
+GROUP_BY_FIELDS = ("model", "language", "trigger", "user")
+
+# group_by → review_meta 컬럼
+_META_GROUP_COLUMNS = {
+    "model": ReviewMeta.model,
+    "language": ReviewMeta.language,
+    "trigger": ReviewMeta.trigger,
+    "user": User.github_id,  # review_meta.user_id 로 조인 (롤업과 같은 키)
+}
+
+# group_by → (롤업 테이블, 키 컬럼명)
+_ROLLUP_SOURCES = {
+    None: (ReviewDailyModelStats, None),
+    "model": (ReviewDailyModelStats, "model"),
+    "user": (ReviewDailyUserStats, "user_id"),
+}
+
+
+def _to_utc_datetime(value: Any) -> datetime:
+    """DB 가 돌려준 버킷 값 (datetime / date / 문자열) → UTC datetime"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    raise ValueError(f"unexpected bucket value: {value!r}")
+
+
+def _hour_expr(dialect: str):
+    audit = ReviewMeta.audit
+    if dialect == "mysql":
+        return func.date_format(audit, "%Y-%m-%d %H:00:00")
+    if dialect == "postgresql":
+        return func.date_trunc("hour", audit)
+    return func.strftime("%Y-%m-%d %H:00:00", audit)
+
+
+def _rollup_select(
+    group_by: Optional[str],
+    from_dt: Optional[datetime],
+    to_dt: Optional[datetime],
+    model: Optional[str],
+):
+    table_cls, key_name = _ROLLUP_SOURCES[group_by]
+    key_col = getattr(table_cls, key_name) if key_name else None
+    if group_by == "user":
+        key_col = User.github_id  # user_id 롤업 → 응답 키는 github_id
+
+    columns = [table_cls.day.label("bucket")]
+    group_cols = [table_cls.day]
+    if key_col is not None:
+        columns.append(key_col.label("key"))
+        group_cols.append(key_col)
+    columns += [func.sum(getattr(table_cls, col)).label(col) for col in METRIC_COLUMNS]
+
+    conditions = rollup_day_conditions(table_cls, from_dt, to_dt, dated_only=True)
+    if model:
+        conditions.append(table_cls.model == model)
+
+    stmt = select(*columns).select_from(table_cls)
+    if group_by == "user":
+        stmt = stmt.outerjoin(User, User.id == table_cls.user_id)
+    return stmt.where(*conditions).group_by(*group_cols)
+
+
+def _review_select(
+    bucket: str,
+    group_by: Optional[str],
+    from_dt: Optional[datetime],
+    to_dt: Optional[datetime],
+    model: Optional[str],
+    dialect: str,
+):
+    bucket_expr = _hour_expr(dialect) if bucket == "hour" else func.date(ReviewMeta.audit)
+    key_col = _META_GROUP_COLUMNS.get(group_by)
+
+    columns = [bucket_expr.label("bucket")]
+    group_cols = [bucket_expr]
+    if key_col is not None:
+        columns.append(key_col.label("key"))
+        group_cols.append(key_col)
+    columns += aggregate_columns()
+
+    conditions = [ReviewMeta.audit.isnot(None)]
+    if from_dt:
+        conditions.append(ReviewMeta.audit >= from_dt)
+    if to_dt:
+        conditions.append(ReviewMeta.audit < to_dt + timedelta(days=1))
+    if model:
+        conditions.append(ReviewMeta.model == model)
+
+    stmt = select(*columns).select_from(Review).join(ReviewMeta, Review.meta_id == ReviewMeta.id)
+    if group_by == "user":
+        stmt = stmt.outerjoin(User, User.id == ReviewMeta.user_id)
+    return stmt.where(*conditions).group_by(*group_cols)
+
+
+def uses_rollups(bucket: str, group_by: Optional[str]) -> bool:
+    return bucket in ("day", "week") and group_by in _ROLLUP_SOURCES
+
+
+async def load_timeseries(
+    session: AsyncSession,
+    *,
+    bucket: str,
+    group_by: Optional[str] = None,
+    from_dt: Optional[datetime] = None,
+    to_dt: Optional[datetime] = None,
+    model: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    (bucket_start, key) 별 review_count / avg_* 목록을 bucket_start, key 순으로 돌려준다.
+    from_dt / to_dt 는 날짜 단위 (to 포함), audit 가 없는 리뷰는 제외된다.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"unknown bucket: {bucket}")
+    if group_by is not None and group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f"unknown group_by: {group_by}")
+
+    if uses_rollups(bucket, group_by):
+        stmt = _rollup_select(group_by, from_dt, to_dt, model)
+    else:
+        dialect = session.get_bind().dialect.name
+        stmt = _review_select(bucket, group_by, from_dt, to_dt, model, dialect)
+
+    result = await session.execute(stmt)
+
+    # 버킷으로 접기 (합계/개수끼리 더한다)
+    folded: Dict[Tuple[datetime, Optional[str]], Dict[str, float]] = {}
+    for row in result.mappings():
+        start = _to_utc_datetime(row["bucket"])
+        if bucket == "week":
+            start -= timedelta(days=start.weekday())
+        key = (row["key"] or None) if group_by else None  # 롤업은 NULL 을 "" 로 저장
+
+        acc = folded.setdefault((start, key), dict.fromkeys(METRIC_COLUMNS, 0))
+        for col in METRIC_COLUMNS:
+            acc[col] += row[col] or 0
+
+    items: List[Dict[str, Any]] = []
+    for (start, key), acc in sorted(folded.items(), key=lambda kv: (kv[0][0], kv[0][1] or "")):
+        count = int(acc["review_count"])
+        if count <= 0:
+            continue
+        item: Dict[str, Any] = {
+            "bucket_start": start,
+            "key": key,
+            "review_count": count,
+            "avg_total": float(acc["sum_total"]) / count,
+        }
+        for name in CATEGORY_NAMES:
+            cnt = acc[f"cnt_{name}"]
+            item[f"avg_{name}"] = float(acc[f"sum_{name}"]) / cnt if cnt else None
+        items.append(item)
+    return items
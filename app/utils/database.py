@@ -4,6 +4,7 @@ from __future__ import annotations
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.config import settings
+from app.utils.pool_monitor import PoolMonitor
 
 class Base(DeclarativeBase):
     pass
@@ -13,6 +14,10 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+# checkout 된 채 오래 반납되지 않는 커넥션 (세션 누수) 감지
+pool_monitor = PoolMonitor()
+pool_monitor.attach(engine)
+
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -20,6 +25,7 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 async def get_session() -> AsyncSession:
+    """요청 단위 세션 (FastAPI Depends 전용). 직접 __anext__() 로 꺼내 쓰면 닫히지 않는다."""
     async with AsyncSessionLocal() as session:
         yield session
 
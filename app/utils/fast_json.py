@@ -0,0 +1,34 @@
+# app/utils/fast_json.py
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson 이 없으면 표준 json 으로 대체
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """dict/list 를 바로 JSON bytes 로 직렬화 (pydantic 검증 없음)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """
+    response_model 검증/직렬화를 건너뛰는 고속 응답.
+    라우터에서 row 튜플로 만든 dict 를 그대로 넘길 때만 사용한다.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
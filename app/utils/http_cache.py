@@ -0,0 +1,43 @@
+# app/utils/http_cache.py
+from hashlib import sha256
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts: object, weak: bool = False) -> str:
+    """parts 를 이어 붙여 해시한 ETag 값 (따옴표 포함)"""
+    digest = sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더와 비교 (RFC 7232: If-None-Match 는 weak 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(t) for t in header.split(",") if t.strip()}
+
+
+def apply_cache_headers(
+    response: Response,
+    etag: str,
+    cache_control: str,
+    vary: str | None = None,
+) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    if vary:
+        response.headers["Vary"] = vary
+    return response
+
+
+def not_modified(etag: str, cache_control: str, vary: str | None = None) -> Response:
+    """304 Not Modified 응답 (본문 없음)"""
+    return apply_cache_headers(Response(status_code=304), etag, cache_control, vary)
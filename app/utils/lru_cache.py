@@ -0,0 +1,98 @@
+# app/utils/lru_cache.py
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+
+class LRUCache:
+    """
+    프로세스 내 LRU 캐시 (엔트리 수 제한 + 선택적 TTL).
+    asyncio 이벤트 루프 안에서만 쓰므로 별도 락은 두지 않는다.
+
+    sizeof / max_weight 를 주면 엔트리 수와 함께 무게 합계 (예: 문자 수) 로도 제한한다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        *,
+        max_weight: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.max_weight = max(1, int(max_weight)) if max_weight else None
+        self._sizeof = sizeof if self.max_weight else None
+        self._data: "OrderedDict[Hashable, tuple[Optional[float], Any]]" = OrderedDict()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.delete(key)
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """ttl: 이 엔트리만 다른 TTL 을 쓸 때 (없으면 캐시 기본값)"""
+        size = self._weigh(value)
+        if self.max_weight and size > self.max_weight:
+            # 혼자서 한도를 넘는 값은 캐시하지 않는다 (다른 엔트리를 다 밀어내지 않도록)
+            self.delete(key)
+            return
+
+        ttl = ttl if ttl and ttl > 0 else self.ttl
+        self.delete(key)
+        self._data[key] = (time.monotonic() + ttl if ttl else None, value)
+        self.weight += size
+        while len(self._data) > self.max_entries or (self.max_weight and self.weight > self.max_weight):
+            _, (_, oldest) = self._data.popitem(last=False)
+            self.weight -= self._weigh(oldest)
+            self.evictions += 1
+
+    def _weigh(self, value: Any) -> int:
+        return self._sizeof(value) if self._sizeof else 0
+
+    def delete(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.weight -= self._weigh(entry[1])
+
+    def delete_many(self, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self.delete(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        stats = {
+            "size": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else None,
+        }
+        if self.max_weight:
+            stats.update(weight=self.weight, max_weight=self.max_weight)
+        return stats
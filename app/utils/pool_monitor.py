@@ -0,0 +1,118 @@
+# app/utils/pool_monitor.py
+"""
+커넥션 풀 누수 감지.
+
+풀에서 커넥션을 꺼낼 때 (checkout) 시각을 기록하고 돌려줄 때 (checkin) 지운다.
+POOL_LEAK_WARN_SECONDS 보다 오래 반납되지 않은 커넥션은 한 번 경고 로그를 남긴다.
+POOL_LEAK_TRACE=1 이면 checkout 한 위치의 스택도 같이 남긴다 (비용이 있으므로 디버깅용).
+"""
+import asyncio
+import logging
+import os
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+POOL_LEAK_WARN_SECONDS = float(os.getenv("POOL_LEAK_WARN_SECONDS", "30"))
+POOL_LEAK_CHECK_INTERVAL = float(os.getenv("POOL_LEAK_CHECK_INTERVAL", "10"))
+POOL_LEAK_TRACE = os.getenv("POOL_LEAK_TRACE", "0") == "1"
+
+
+class _Checkout:
+    __slots__ = ("started", "stack", "warned")
+
+    def __init__(self, stack: Optional[str]):
+        self.started = time.monotonic()
+        self.stack = stack
+        self.warned = False
+
+
+class PoolMonitor:
+    """엔진 풀의 checkout / checkin 이벤트로 빌려간 커넥션과 그 나이를 추적한다"""
+
+    def __init__(
+        self,
+        warn_after: float = POOL_LEAK_WARN_SECONDS,
+        interval: float = POOL_LEAK_CHECK_INTERVAL,
+        trace: bool = POOL_LEAK_TRACE,
+    ):
+        self.warn_after = warn_after
+        self.interval = interval
+        self.trace = trace
+        self._checked_out: Dict[int, _Checkout] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.checkouts = 0
+        self.leak_warnings = 0
+
+    def attach(self, engine: AsyncEngine) -> None:
+        pool = engine.sync_engine.pool
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        stack = "".join(traceback.format_stack(limit=25)[:-2]) if self.trace else None
+        self._checked_out[id(connection_record)] = _Checkout(stack)
+        self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        self._checked_out.pop(id(connection_record), None)
+
+    @property
+    def checked_out(self) -> int:
+        return len(self._checked_out)
+
+    def check(self) -> List[float]:
+        """warn_after 를 넘긴 커넥션마다 (처음 한 번) 경고. 넘긴 커넥션들의 나이 목록을 돌려준다"""
+        now = time.monotonic()
+        overdue = []
+        for checkout in list(self._checked_out.values()):
+            age = now - checkout.started
+            if age < self.warn_after:
+                continue
+            overdue.append(age)
+            if checkout.warned:
+                continue
+            checkout.warned = True
+            self.leak_warnings += 1
+            logger.warning(
+                "[pool] connection checked out for %.1fs (possible session leak)%s",
+                age,
+                f"\ncheckout stack:\n{checkout.stack}" if checkout.stack else "",
+            )
+        return overdue
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.check()
+
+    def start(self) -> None:
+        if self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        ages = [now - checkout.started for checkout in self._checked_out.values()]
+        return {
+            "checked_out": len(ages),
+            "oldest_checkout_seconds": round(max(ages), 3) if ages else None,
+            "overdue": sum(1 for age in ages if age >= self.warn_after),
+            "checkouts": self.checkouts,
+            "leak_warnings": self.leak_warnings,
+            "warn_after": self.warn_after,
+        }
@@ -0,0 +1,114 @@
+# scripts/bench_fast_json.py
+"""
+리뷰 목록 응답 직렬화 벤치마크: 기본 경로 vs fast=true (FastJSONResponse).
+
+    python -m scripts.bench_fast_json                 # 1k / 10k / 100k 행
+    python -m scripts.bench_fast_json --rows 5000 --repeat 5
+
+DB 없이 목록 쿼리가 돌려주는 row 튜플 모양 (review_list_columns) 을 만들어서
+응답 본문을 만드는 데까지만 잰다. 기본 경로는 list_reviews 처럼 ReviewListItem 을 만들고,
+GET /v1/reviews 라우트의 response field 로 FastAPI (serialize_response) 와 똑같이
+field.validate → field.serialize (mode="json") → JSONResponse 를 거친다.
+시간은 CPU 시간 (process_time) 이고, repeat 번 중 가장 짧은 값을 쓴다.
+"""
+import argparse
+import os
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+
+# app.config 가 DB 설정을 요구한다 (벤치마크는 DB 에 붙지 않는다)
+for _name, _value in (("DB_HOST", "localhost"), ("DB_PORT", "3306"), ("DB_NAME", "bench"), ("DB_USER", "bench"), ("DB_PASSWORD", "bench")):
+    os.environ.setdefault(_name, _value)
+
+from fastapi.responses import JSONResponse
+
+from app.routers.v1.review import _list_item_dict, router
+from app.schemas.common import Meta
+from app.schemas.review import ReviewListItem, ReviewListResponse
+from app.services.review_service import review_list_columns
+from app.utils.fast_json import FastJSONResponse
+
+Row = namedtuple("Row", [column.key for column in review_list_columns(False)])
+
+
+def make_rows(count: int) -> list:
+    audit = datetime.now(timezone.utc)
+    values = {
+        "quality_score": 80,
+        "summary": "summary text " * 10,
+        "github_id": "42",
+        "model": "m1",
+        "trigger": "manual",
+        "language": "python",
+        "audit": audit,
+        "has_code": True,
+    }
+    rows = []
+    for i in range(count):
+        row = {}
+        for name in Row._fields:
+            if name == "review_id":
+                row[name] = i + 1
+            elif name.startswith("score_"):
+                row[name] = 70 + i % 30
+            elif name.startswith("comment_"):
+                row[name] = "comment " * 10
+            else:
+                row[name] = values[name]
+        rows.append(Row(**row))
+    return rows
+
+
+def list_response_field():
+    """GET /v1/reviews 라우트에서 FastAPI 가 응답 직렬화에 쓰는 field"""
+    for route in router.routes:
+        if getattr(route, "path", None) == "/v1/reviews" and "GET" in route.methods:
+            return route.secure_cloned_response_field
+    raise RuntimeError("GET /v1/reviews route not found")
+
+
+def default_path(rows: list, meta: Meta, field) -> bytes:
+    response = ReviewListResponse(meta=meta, body=[ReviewListItem(**_list_item_dict(row, False)) for row in rows])
+    value, errors = field.validate(response, {}, loc=("response",))
+    if errors:
+        raise RuntimeError(errors)
+    return JSONResponse(field.serialize(value)).body
+
+
+def fast_path(rows: list, meta: Meta) -> bytes:
+    return FastJSONResponse(
+        {"meta": meta.model_dump(mode="json"), "body": [_list_item_dict(row, False) for row in rows]}
+    ).body
+
+
+def measure(fn, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        started = time.process_time()
+        fn()
+        elapsed = time.process_time() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.bench_fast_json")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    meta = Meta(actor="server")
+    field = list_response_field()
+    for count in args.rows:
+        rows = make_rows(count)
+        default = measure(lambda: default_path(rows, meta, field), args.repeat)
+        fast = measure(lambda: fast_path(rows, meta), args.repeat)
+        print(
+            f"{count:>7} rows: default {default * 1000:9.1f} ms  fast {fast * 1000:9.1f} ms"
+            f"  ({default / fast if fast else float('inf'):.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
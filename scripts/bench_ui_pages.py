@@ -0,0 +1,68 @@
+# scripts/bench_ui_pages.py
+"""
+UI 페이지 지연 벤치마크 (실행 중인 서버에 요청).
+
+    uvicorn app.main:app --port 8000 &
+    python -m scripts.bench_ui_pages --base http://127.0.0.1:8000 --runs 200
+
+페이지마다 중앙값 / p95 (ms) 를 잰다. 같이 재는 "hop" 은 예전 페이지가 INTERNAL_API_BASE 로
+한 번 더 보내던 API 요청 (지금은 같은 프로세스에서 서비스 함수를 부른다) 이고,
+페이지가 아낀 지연은 대략 이 값이다. 바뀌기 전 커밋으로 서버를 띄워 같은 명령을 돌리면 직접 비교할 수 있다.
+리뷰 제출 / fix 페이지는 LLM 호출이 지연의 대부분이라 넣지 않았다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# (페이지, 예전 페이지가 내부에서 호출하던 API)
+PAGES: List[Tuple[str, Optional[str]]] = [
+    ("/ui/stats/models", "/v1/reviews/stats/by-model"),
+    ("/ui/stats/users", "/v1/reviews/stats/by-user"),
+]
+
+
+async def measure(client: httpx.AsyncClient, path: str, runs: int, warmup: int) -> Dict[str, float]:
+    for _ in range(warmup):
+        (await client.get(path)).raise_for_status()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = await client.get(path)
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    samples.sort()
+    return {
+        "median": statistics.median(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+    }
+
+
+async def run(base: str, runs: int, warmup: int, cookie: Optional[str]) -> None:
+    cookies = {"access_token": cookie} if cookie else None
+    async with httpx.AsyncClient(base_url=base, cookies=cookies, timeout=30.0) as client:
+        print(f"{'page':<22} {'median':>9} {'p95':>9}   {'hop':<28} {'median':>9} {'p95':>9}")
+        for page, hop in PAGES:
+            page_ms = await measure(client, page, runs, warmup)
+            line = f"{page:<22} {page_ms['median']:>9.2f} {page_ms['p95']:>9.2f}"
+            if hop:
+                hop_ms = await measure(client, hop, runs, warmup)
+                line += f"   {hop:<28} {hop_ms['median']:>9.2f} {hop_ms['p95']:>9.2f}"
+            print(line)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m scripts.bench_ui_pages")
+    parser.add_argument("--base", default="http://127.0.0.1:8000")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--cookie", default=None, help="access_token 쿠키 (로그인 상태로 잴 때)")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.base, args.runs, args.warmup, args.cookie))
+
+
+if __name__ == "__main__":
+    main()
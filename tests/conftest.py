@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+
+# app.config 가 DB 설정을 요구한다. 테스트는 각자 sqlite 엔진을 붙이므로 값은 쓰이지 않는다.
+for _name, _value in (("DB_HOST", "localhost"), ("DB_PORT", "3306"), ("DB_NAME", "test"), ("DB_USER", "test"), ("DB_PASSWORD", "test")):
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,127 @@
+# tests/test_event_bus.py
+"""RedisEventBus 를 RESP 대역 서버 (PUBLISH / SUBSCRIBE 만 하는 asyncio 서버) 에 붙여서 확인한다"""
+import asyncio
+import json
+from typing import Dict, List, Set
+
+from app.services import event_bus as event_bus_module
+from app.services.event_bus import RedisEventBus, RespConnection
+
+
+class RespStandIn:
+    """로컬 Redis 대역. drop_publishes 만큼 PUBLISH 를 받으면 응답 없이 연결을 끊는다"""
+
+    def __init__(self) -> None:
+        self.subscribers: Dict[bytes, Set[asyncio.StreamWriter]] = {}
+        self.published: List[bytes] = []
+        self.drop_publishes = 0
+        self.server = None
+        self.url = ""
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"redis://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = RespConnection(reader, writer)
+        try:
+            while True:
+                try:
+                    args = await conn.read()
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    return
+                command = args[0].upper()
+                if command == b"PUBLISH":
+                    if self.drop_publishes:
+                        self.drop_publishes -= 1
+                        return
+                    channel, data = args[1], args[2]
+                    self.published.append(data)
+                    receivers = self.subscribers.get(channel, set())
+                    for receiver in receivers:
+                        receiver.write(RespConnection.encode(b"message", channel, data))
+                    writer.write(b":%d\r\n" % len(receivers))
+                elif command == b"SUBSCRIBE":
+                    self.subscribers.setdefault(args[1], set()).add(writer)
+                    writer.write(RespConnection.encode(b"subscribe", args[1], 1))
+                else:
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        finally:
+            for receivers in self.subscribers.values():
+                receivers.discard(writer)
+            writer.close()
+
+
+async def _wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+async def _started_bus(server: RespStandIn, received: list) -> RedisEventBus:
+    async def handler(event: dict) -> None:
+        received.append(event)
+
+    bus = RedisEventBus(server.url, channel="test-events")
+    bus.add_handler(handler)
+    await bus.start()
+    await _wait_until(lambda: bus.connected["publisher"] and server.subscribers.get(b"test-events"))
+    return bus
+
+
+def test_redis_bus_relays_events_between_workers():
+    async def scenario():
+        server = RespStandIn()
+        await server.start()
+        received: list = []
+        bus = await _started_bus(server, received)
+        try:
+            # 이 워커의 이벤트: 로컬 핸들러에 한 번, Redis 로 나가지만 다시 받지는 않는다
+            await bus.publish({"type": "review_saved"}, topics=["user:42"])
+            await _wait_until(lambda: len(server.published) == 1)
+            assert json.loads(server.published[0])["topics"] == ["user:42"]
+
+            # 다른 워커의 이벤트: 구독으로 받아서 로컬 핸들러로
+            other = await RespConnection.open(server.url)
+            event = {"origin": "other-worker", "topics": ["review:7"], "message": {"type": "review_saved"}}
+            await other.command("PUBLISH", "test-events", json.dumps(event))
+            await other.close()
+            await _wait_until(lambda: len(received) == 2)
+
+            assert [e["topics"] for e in received] == [["user:42"], ["review:7"]]
+            assert bus.received == 1
+        finally:
+            await bus.stop()
+            await server.stop()
+
+    asyncio.run(scenario())
+
+
+def test_redis_bus_retries_publish_after_reconnect(monkeypatch):
+    monkeypatch.setattr(event_bus_module, "RECONNECT_MIN_DELAY", 0.01)
+
+    async def scenario():
+        server = RespStandIn()
+        await server.start()
+        bus = await _started_bus(server, [])
+        try:
+            server.drop_publishes = 1
+            await bus.publish({"type": "first"})
+            await bus.publish({"type": "second"})
+            await _wait_until(lambda: len(server.published) == 2)
+
+            assert [json.loads(data)["message"]["type"] for data in server.published] == ["first", "second"]
+            assert bus.reconnects >= 1
+            assert bus.stats()["outbox"] == 0
+        finally:
+            await bus.stop()
+            await server.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,59 @@
+# tests/test_pool_leak.py
+"""UI 페이지를 여러 번 불러도 풀에서 빌려간 커넥션 수가 처음으로 돌아오는지 (세션 누수 회귀 테스트)"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.schema import CreateTable
+
+import app.models.import_job  # noqa: F401  (테이블 등록)
+import app.models.review  # noqa: F401
+import app.models.review_stats  # noqa: F401
+import app.models.user  # noqa: F401
+from app.main import app
+from app.utils.database import AsyncSessionLocal, Base, pool_monitor
+
+LOADS = 20
+
+
+@pytest.fixture
+def sqlite_sessions(tmp_path):
+    """AsyncSessionLocal (get_session 포함) 을 sqlite 파일 DB 로 돌리고 pool_monitor 를 붙인다"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.sqlite'}")
+    pool_monitor.attach(engine)
+
+    def create_tables_sync(conn):
+        # 인덱스는 만들지 않는다: review_meta.id 와 review.meta_id 인덱스 이름이 같아서
+        # (MySQL 은 테이블별이라 괜찮지만) sqlite 에서는 충돌한다
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(create_tables_sync)
+
+    asyncio.run(create_tables())
+    original = AsyncSessionLocal.kw["bind"]
+    AsyncSessionLocal.configure(bind=engine)
+    try:
+        yield engine
+    finally:
+        AsyncSessionLocal.configure(bind=original)
+        asyncio.run(engine.dispose())
+
+
+def test_ui_pages_return_connections_to_pool(sqlite_sessions):
+    client = TestClient(app)
+    baseline = pool_monitor.checked_out
+    checkouts = pool_monitor.checkouts
+
+    for _ in range(LOADS):
+        assert client.get("/ui/stats/models").status_code == 200
+        assert client.get("/ui/stats/users").status_code == 200
+        # 없는 리뷰: LLM 을 부르지 않고 404 로 끝나지만 세션은 똑같이 연다
+        response = client.post("/ui/fix-test", data={"review_id": 999999, "code": "print(1)"})
+        assert response.status_code == 200
+
+    assert pool_monitor.checkouts > checkouts
+    assert pool_monitor.checked_out == baseline